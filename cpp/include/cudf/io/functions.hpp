@@ -107,6 +107,9 @@ struct read_json_args {
   /// Specify the compression format of the source or infer from file extension
   compression_type compression = compression_type::AUTO;
 
+  /// Names of columns to read; empty is all columns
+  std::vector<std::string> use_cols_names;
+
   ///< Read the file as a json object per line
   bool lines = false;
 
@@ -154,6 +154,8 @@ namespace json {
     /// Per-column types; disables type inference on those columns
     std::vector<std::string> dtype;
     bool dayfirst = false;
+    /// Names of the columns to read; empty is all columns
+    std::vector<std::string> use_cols_names;
 
     reader_options() = default;
     reader_options(reader_options const &) = default;
@@ -164,10 +166,14 @@ namespace json {
      * @param[in] lines Restrict to `JSON Lines` format rather than full JSON
      * @param[in] compression Compression type: "none", "infer", "gzip", "zip"
      * @param[in] dtype Ordered list of data types; deduced from dataset if empty
+     * @param[in] dayfirst Whether to parse dates as DD/MM versus MM/DD
+     * @param[in] use_cols_names Names of the columns to read; all if empty
      *---------------------------------------------------------------------------**/
     reader_options(bool lines, compression_type compression,
-                    std::vector<std::string> dtype, bool dayfirst)
-        : lines(lines), compression(compression), dtype(std::move(dtype)), dayfirst(dayfirst) {}
+                    std::vector<std::string> dtype, bool dayfirst,
+                    std::vector<std::string> use_cols_names = {})
+        : lines(lines), compression(compression), dtype(std::move(dtype)), dayfirst(dayfirst),
+          use_cols_names(std::move(use_cols_names)) {}
     };
 
   /**
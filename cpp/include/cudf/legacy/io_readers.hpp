@@ -408,7 +408,7 @@ struct reader_options {
    * @brief Constructor to populate reader options.
    *
    * @param[in] cols List of columns to read. If empty, all columns are read
-   * @param[in] strings_to_categorical Whether to store strings as GDF_CATEGORY
+   * @param[in] strings_to_categorical Whether to store strings as GDF_STRING_CATEGORY
    * @param[in] read_pandas_indexes Whether to always load PANDAS index columns
    * @param[in] timestamp_time_unit Resolution of timestamps; none for default
    *---------------------------------------------------------------------------**/
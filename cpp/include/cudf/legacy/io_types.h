@@ -48,4 +48,8 @@ typedef struct
 
     int rows_per_chunk;           // maximum number of rows to process for each file write
 
+    // called with each chunk of CSV data instead of writing to filepath, if not null
+    void (*write_chunk)(void* context, const char* data, size_t size);
+    void* write_context;          // passed to write_chunk
+
 } csv_write_arg;
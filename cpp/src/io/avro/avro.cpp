@@ -113,7 +113,8 @@ bool container::parse(file_metadata *md, size_t max_num_rows, size_t first_row)
     }
     md->max_block_size = max_block_size;
     md->num_rows = total_object_count;
-    md->total_data_size = m_cur - (m_base + md->metadata_size);
+    // Only the selected blocks are read
+    md->total_data_size = (md->block_list.size() > 0) ? m_cur - (m_base + md->block_list[0].offset) : 0;
     // Extract columns
     for (size_t i = 0; i < md->schema.size(); i++)
     {
@@ -30,6 +30,8 @@
 #include <rmm/thrust_rmm_allocator.h>
 #include <rmm/device_buffer.hpp>
 
+#include <algorithm>
+
 namespace cudf {
 namespace experimental {
 namespace io {
@@ -500,7 +502,8 @@ table_with_metadata reader::read_all(cudaStream_t stream) {
 table_with_metadata reader::read_rows(size_type skip_rows,
                                          size_type num_rows,
                                          cudaStream_t stream) {
-  return _impl->read(skip_rows, (num_rows != 0) ? num_rows : -1, stream);
+  return _impl->read(std::max(skip_rows, 0), (num_rows != 0) ? num_rows : -1,
+                     stream);
 }
 
 }  // namespace avro
@@ -25,6 +25,8 @@
 #include <rmm/thrust_rmm_allocator.h>
 
 #include <fstream>
+#include <functional>
+#include <future>
 #include <algorithm>
 
 // Functor for type-dispatcher converts columns into strings
@@ -230,7 +232,9 @@ NVStrings* column_to_strings_csv(const gdf_column* column, cudf::size_type row_o
 // copied into their position in the output memory. This way,
 // one column is processed at a time minimizing device memory usage.
 // Once formatted, the row group is copied to host memory so it can
-// be written to the output file.
+// be written to the output file, or handed to the write_chunk callback.
+// A chunk is written by another thread while the next chunk is formatted,
+// alternating between two host buffers.
 // Future optimization could use GDS so the memory can be written to
 // the file without going through host memory.
 //
@@ -256,7 +260,7 @@ gdf_error write_csv(csv_write_arg* args)
     bool include_header = args->include_header;
 
     // check for issues here
-    CUDF_EXPECTS( filepath!=nullptr, "write_csv: filepath not specified" );
+    CUDF_EXPECTS( filepath!=nullptr || args->write_chunk!=nullptr, "write_csv: filepath not specified" );
     CUDF_EXPECTS( count>=0, "write_csv: num_cols is required" );
     if( count > 0 )
         CUDF_EXPECTS( columns!=0, "write_csv: invalid data values" );
@@ -274,9 +278,23 @@ gdf_error write_csv(csv_write_arg* args)
         });
     CUDF_EXPECTS( all_sizes_match, "write_csv: columns sizes do not match" );
 
-    // check the file can be written
-    std::ofstream filecsv(filepath,std::ios::out|std::ios::binary|std::ios::trunc);
-    CUDF_EXPECTS( filecsv.is_open(), "write_csv: file could not be opened");
+    std::ofstream filecsv;
+    std::function<void(const char*,size_t)> write_output;
+    if( args->write_chunk )
+    {
+        write_output = [args] (const char* data, size_t size) {
+            args->write_chunk(args->write_context, data, size);
+        };
+    }
+    else
+    {
+        // check the file can be written
+        filecsv.open(filepath,std::ios::out|std::ios::binary|std::ios::trunc);
+        CUDF_EXPECTS( filecsv.is_open(), "write_csv: file could not be opened");
+        write_output = [&filecsv] (const char* data, size_t size) {
+            filecsv.write(data,size);
+        };
+    }
 
     //
     // This outputs the CSV in row chunks to save memory.
@@ -289,6 +307,27 @@ gdf_error write_csv(csv_write_arg* args)
         rows_chunk += 8 - (rows_chunk % 8);
     CUDF_EXPECTS( rows_chunk>0, "write_csv: invalid chunk_rows; must be at least 8" );
 
+    // the header is written with the first chunk
+    std::string header;
+    if(include_header)
+    {
+        for( int idx=0; idx < count; ++idx )
+        {
+            const gdf_column* col = columns[idx];
+            const char* delim = ((idx+1)<count ? delimiter : terminator);
+            if( col->col_name )
+                header = header + "\"" + col->col_name + "\"";
+            header += delim;
+        }
+    }
+    if( total_rows==0 && !header.empty() )
+        write_output(header.data(),header.size());
+
+    // double buffering: the previous chunk is written while this one is formatted
+    std::vector<char> h_buffers[2];
+    int buffer_idx = 0;
+    std::future<void> pending_write;
+
     auto execpol = rmm::exec_policy(0);
     cudf::size_type row_offset = 0;
     cudf::size_type rows = total_rows;
@@ -382,23 +421,22 @@ gdf_error write_csv(csv_write_arg* args)
                 }
             }
         }
-        // now we can write csv_data to the output file
-        // first write the header
-        if(include_header)
-        {
-            for( int idx=0; idx < count; ++idx )
-            {
-                const gdf_column* col = columns[idx];
-                const char* delim = ((idx+1)<count ? delimiter : terminator);
-                if( col->col_name )
-                    filecsv << "\"" << col->col_name << "\"";
-                filecsv << delim;
-            }
-        }
-        // copy the csv_data to host memory and write it out
-        std::vector<char> h_csv(memsize);
-        cudaMemcpyAsync(h_csv.data(), d_csv_data, memsize, cudaMemcpyDeviceToHost);
-        filecsv.write(h_csv.data(),memsize);
+        // copy the csv_data to host memory, after the header for the first chunk;
+        // the other buffer may still be being written out
+        std::vector<char>& h_csv = h_buffers[buffer_idx];
+        h_csv.resize(header.size() + memsize);
+        std::copy(header.begin(), header.end(), h_csv.begin());
+        CUDA_TRY( cudaMemcpyAsync(h_csv.data() + header.size(), d_csv_data, memsize, cudaMemcpyDeviceToHost) );
+        CUDA_TRY( cudaStreamSynchronize(0) );
+        header.clear();
+
+        // wait for the previous chunk, then write this one out in the background
+        if( pending_write.valid() )
+            pending_write.get();
+        pending_write = std::async(std::launch::async, [&write_output, &h_csv] {
+            write_output(h_csv.data(), h_csv.size());
+        });
+        buffer_idx = 1 - buffer_idx;
 
         // get ready for the next chunk of rows
         row_offset += rows_chunk;
@@ -406,10 +444,11 @@ gdf_error write_csv(csv_write_arg* args)
             rows = total_rows - row_offset;
         else
             rows = 0;
-        // prevent header for subsequent chunks
-        include_header = false;
     }
+    if( pending_write.valid() )
+        pending_write.get();
 
-    filecsv.close();
+    if( filecsv.is_open() )
+        filecsv.close();
     return gdf_error::GDF_SUCCESS;
 }
@@ -407,7 +407,8 @@ __device__ __inline__ bool is_like_float(long len, long digit_cnt, long decimal_
  * @param[in] dtypes The data type of each column
  * @param[in] opts A set of parsing options
  * @param[out] output_columns The output column data
- * @param[in] num_columns The number of columns
+ * @param[in] field_columns The output column of each field, -1 to skip it
+ * @param[in] num_fields The number of fields to parse
  * @param[out] valid_fields The bitmaps indicating whether column fields are valid
  * @param[out] num_valid_fields The numbers of valid fields in columns
  *
@@ -415,7 +416,8 @@ __device__ __inline__ bool is_like_float(long len, long digit_cnt, long decimal_
  **/
 __global__ void convert_json_to_columns_kernel(const char *data, size_t data_size, const uint64_t *rec_starts,
                                            cudf::size_type num_records, const data_type *dtypes, ParseOptions opts,
-                                           void *const *output_columns, int num_columns, bitmask_type *const *valid_fields,
+                                           void *const *output_columns, const int *field_columns, int num_fields,
+                                           bitmask_type *const *valid_fields,
                                            cudf::size_type *num_valid_fields) {
   const long rec_id = threadIdx.x + (blockDim.x * blockIdx.x);
   if (rec_id >= num_records)
@@ -428,12 +430,17 @@ __global__ void convert_json_to_columns_kernel(const char *data, size_t data_siz
   limit_range_to_brackets(data, start, stop);
   const bool is_object = (data[start - 1] == '{');
 
-  for (int col = 0; col < num_columns && start < stop; col++) {
+  for (int field = 0; field < num_fields && start < stop; field++) {
     if (is_object) {
       start = seek_field_name_end(data, opts, start, stop);
     }
     // field_end is at the next delimiter/newline
     const long field_end = cudf::experimental::io::gpu::seek_field_end(data, opts, start, stop);
+    const int col = field_columns[field];
+    if (col == -1) {
+      start = field_end + 1;
+      continue;
+    }
     long field_data_last = field_end - 1;
     // Modify start & end to ignore whitespace and quotechars
     trim_field_start_end(data, &start, &field_data_last, opts.quotechar);
@@ -474,14 +481,16 @@ __global__ void convert_json_to_columns_kernel(const char *data, size_t data_siz
  * @param[in] data Input data buffer
  * @param[in] data_size Size of the data buffer, in bytes
  * @param[in] opts A set of parsing options
- * @param[in] num_columns The number of columns of input data
+ * @param[in] field_columns The column of each field, -1 to skip it
+ * @param[in] num_fields The number of fields to inspect
  * @param[in] rec_starts The start the input data of interest
  * @param[in] num_records The number of lines/rows of input data 
  * @param[out] column_infos The count for each column data type
  *
  * @returns void
  **/
-__global__ void detect_json_data_types(const char *data, size_t data_size, const ParseOptions opts, int num_columns,
+__global__ void detect_json_data_types(const char *data, size_t data_size, const ParseOptions opts,
+                                    const int *field_columns, int num_fields,
                                     const uint64_t *rec_starts, cudf::size_type num_records, ColumnInfo *column_infos) {
   long rec_id = threadIdx.x + (blockDim.x * blockIdx.x);
   if (rec_id >= num_records)
@@ -494,11 +503,16 @@ __global__ void detect_json_data_types(const char *data, size_t data_size, const
   limit_range_to_brackets(data, start, stop);
   const bool is_object = (data[start - 1] == '{');
 
-  for (int col = 0; col < num_columns; col++) {
+  for (int field = 0; field < num_fields; field++) {
     if (is_object) {
       start = seek_field_name_end(data, opts, start, stop);
     }
     const long field_end = cudf::experimental::io::gpu::seek_field_end(data, opts, start, stop);
+    const int col = field_columns[field];
+    if (col == -1) {
+      start = field_end + 1;
+      continue;
+    }
     long field_data_last = field_end - 1;
     trim_field_start_end(data, &start, &field_data_last);
     const int field_len = field_data_last - start + 1;
@@ -600,7 +614,7 @@ __global__ void detect_json_data_types(const char *data, size_t data_size, const
 void convert_json_to_columns(rmm::device_buffer const& input_data, 
                           data_type *const dtypes, void *const *output_columns,
                           cudf::size_type num_records,
-                          cudf::size_type num_columns,  
+                          const int *field_columns, int num_fields,
                           const uint64_t *rec_starts,                        
                           bitmask_type *const *valid_fields, cudf::size_type *num_valid_fields,
                           ParseOptions const& opts,
@@ -614,7 +628,7 @@ void convert_json_to_columns(rmm::device_buffer const& input_data,
   convert_json_to_columns_kernel <<< grid_size, block_size, 0, stream >>> (
       static_cast<const char*>(input_data.data()), input_data.size(),
       rec_starts, num_records, dtypes, opts, output_columns,
-      num_columns, valid_fields, num_valid_fields);
+      field_columns, num_fields, valid_fields, num_valid_fields);
 
   CUDA_TRY(cudaGetLastError());
 }
@@ -626,7 +640,8 @@ void convert_json_to_columns(rmm::device_buffer const& input_data,
 void detect_data_types(
     ColumnInfo *column_infos,
     const char *data, size_t data_size, 
-    const ParseOptions &options, int num_columns,
+    const ParseOptions &options,
+    const int *field_columns, int num_fields,
     const uint64_t *rec_starts, cudf::size_type num_records,
     cudaStream_t stream) {
   int block_size;
@@ -637,7 +652,7 @@ void detect_data_types(
   const int grid_size = (num_records + block_size - 1) / block_size;
 
   detect_json_data_types <<< grid_size, block_size, 0, stream >>> (
-      data, data_size, options, num_columns, 
+      data, data_size, options, field_columns, num_fields,
       rec_starts, num_records, column_infos); 
       
   CUDA_TRY(cudaGetLastError());
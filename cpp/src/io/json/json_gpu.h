@@ -33,7 +33,8 @@ namespace gpu {
  * @param[in] dtypes The data type of each column
  * @param[out] output_columns The output column data
  * @param[in] num_records The number of lines/rows 
- * @param[in] num_columns The number of columns
+ * @param[in] field_columns The output column of each field, -1 to skip it
+ * @param[in] num_fields The number of fields to parse
  * @param[in] rec_starts The start of each data record
  * @param[out] valid_fields The bitmaps indicating whether column fields are valid
  * @param[out] num_valid_fields The numbers of valid fields in columns 
@@ -44,7 +45,8 @@ namespace gpu {
  **/
 void convert_json_to_columns(rmm::device_buffer const& input_data, 
                           data_type *const dtypes, void *const *output_columns,
-                          cudf::size_type num_records, cudf::size_type num_columns,  
+                          cudf::size_type num_records,
+                          const int *field_columns, int num_fields,
                           const uint64_t *rec_starts,                        
                           bitmask_type *const *valid_fields, cudf::size_type *num_valid_fields,
                           ParseOptions const& opts,
@@ -57,7 +59,8 @@ void convert_json_to_columns(rmm::device_buffer const& input_data,
  * @param[in] data Input data buffer
  * @param[in] data_size Size of the data buffer, in bytes
  * @param[in] opts A set of parsing options
- * @param[in] num_columns The number of columns of input data
+ * @param[in] field_columns The column of each field, -1 to skip it
+ * @param[in] num_fields The number of fields to inspect
  * @param[in] rec_starts The start the input data of interest
  * @param[in] num_records The number of lines/rows of input data 
  * @param[in] stream Cuda stream to run kernels on
@@ -66,7 +69,8 @@ void convert_json_to_columns(rmm::device_buffer const& input_data,
  **/
 void detect_data_types(ColumnInfo *column_infos,
                      const char *data, size_t data_size, 
-                     const ParseOptions &options, int num_columns,
+                     const ParseOptions &options,
+                     const int *field_columns, int num_fields,
                      const uint64_t *rec_starts, cudf::size_type num_records,
                      cudaStream_t stream = 0);
 
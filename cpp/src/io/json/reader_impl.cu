@@ -33,6 +33,9 @@
 
 #include <cudf/table/table.hpp>
 
+#include <algorithm>
+#include <numeric>
+
 namespace cudf {
 namespace experimental {
 namespace io {
@@ -332,83 +335,132 @@ void reader::impl::set_column_names(cudaStream_t stream) {
   }
 }
 
+/**
+ * @brief Select the columns to read from all the columns of the records
+ *
+ * Sets the field_columns_ data member, and restricts the column names to
+ * the columns read, in the order of the fields of the records
+ *
+ * @return void
+ **/
+void reader::impl::select_columns() {
+  const auto &names = metadata.column_names;
+  field_columns_.resize(names.size());
+  if (args_.use_cols_names.empty()) {
+    std::iota(field_columns_.begin(), field_columns_.end(), 0);
+    return;
+  }
+
+  std::fill(field_columns_.begin(), field_columns_.end(), -1);
+  for (const auto &name : args_.use_cols_names) {
+    const auto it = std::find(names.begin(), names.end(), name);
+    CUDF_EXPECTS(it != names.end(), "Requested column not found in the input.\n");
+    field_columns_[std::distance(names.begin(), it)] = 0;
+  }
+  std::vector<std::string> selected_names;
+  for (size_t field = 0; field < names.size(); ++field) {
+    if (field_columns_[field] != -1) {
+      field_columns_[field] = selected_names.size();
+      selected_names.push_back(names[field]);
+    }
+  }
+  // The fields after the last column read need not be parsed
+  while (field_columns_.back() == -1) {
+    field_columns_.pop_back();
+  }
+  metadata.column_names = std::move(selected_names);
+}
+
 /**
  * @brief Set the data type array data member
  *
- * If user does not pass the data types, deduces types from the file content
+ * Deduces the types of the columns the user does not pass the type of
+ * from the file content
  * 
  * @param[in] stream Cuda stream to execute gpu operations on
  *
  * @return void
  **/
 void reader::impl::set_data_types(cudaStream_t stream) {  
+  const auto num_columns = metadata.column_names.size();
+  dtypes_.assign(num_columns, data_type{});
+  std::vector<bool> is_explicit(num_columns, false);
+
   if (!args_.dtype.empty()) {
-    CUDF_EXPECTS(args_.dtype.size() == metadata.column_names.size(), "Need to specify the type of each column.\n");
     // Assume that the dtype is in dictionary format only if all elements contain a colon
     const bool is_dict = std::all_of(args_.dtype.begin(), args_.dtype.end(), [](const std::string &s) {
       return std::find(s.begin(), s.end(), ':') != s.end();
     });
     if (is_dict) {
       std::map<std::string, data_type> col_type_map;
-      // std::map<std::string, gdf_dtype_extra_info> col_type_info_map;
       for (const auto &ts : args_.dtype) {
         const size_t colon_idx = ts.find(":");
         const std::string col_name(ts.begin(), ts.begin() + colon_idx);
         const std::string type_str(ts.begin() + colon_idx + 1, ts.end());
-        /*
-        std::tie(
-          col_type_map[col_name],
-          col_type_info_map[col_name]
-        ) = convertStringToDtype(type_str);
-        */
-       col_type_map[col_name] = convert_string_to_dtype(type_str);
+        col_type_map[col_name] = convert_string_to_dtype(type_str);
       }
 
-      // Using the map here allows O(n log n) complexity
-      for (size_t col = 0; col < args_.dtype.size(); ++col) {
-        dtypes_.push_back(col_type_map[metadata.column_names[col]]);
-        // dtypes_extra_info_.push_back(col_type_info_map[column_names_[col]]);
+      // Using the map here allows O(n log n) complexity; columns missing
+      // from the map have their types deduced
+      for (size_t col = 0; col < num_columns; ++col) {
+        const auto it = col_type_map.find(metadata.column_names[col]);
+        if (it != col_type_map.end()) {
+          dtypes_[col] = it->second;
+          is_explicit[col] = true;
+        }
       }
     } else {
-      auto dtype_ = std::back_inserter(dtypes_);
-      // auto dtype_info_ = std::back_inserter(dtypes_extra_info_);
-      for (size_t col = 0; col < args_.dtype.size(); ++col) {
-        // std::tie(dtype_, dtype_info_) = convertStringToDtype(args_.dtype[col]);
-        dtype_ = convert_string_to_dtype(args_.dtype[col]);
+      CUDF_EXPECTS(args_.dtype.size() == num_columns, "Need to specify the type of each column.\n");
+      for (size_t col = 0; col < num_columns; ++col) {
+        dtypes_[col] = convert_string_to_dtype(args_.dtype[col]);
+        is_explicit[col] = true;
       }
     }
-  } else {
-    CUDF_EXPECTS(rec_starts_.size() != 0, "No data available for data type inference.\n");
-    const auto num_columns = metadata.column_names.size();
-
-    // dtypes_extra_info_ = std::vector<gdf_dtype_extra_info>(num_columns, gdf_dtype_extra_info{ TIME_UNIT_NONE });
-
-    rmm::device_vector<cudf::experimental::io::json::ColumnInfo> d_column_infos(num_columns, cudf::experimental::io::json::ColumnInfo{});
-    cudf::experimental::io::json::gpu::detect_data_types(d_column_infos.data().get(),
-                         static_cast<const char*>(data_.data()), data_.size(), 
-                         opts_, num_columns,
-                         rec_starts_.data().get(), rec_starts_.size(), stream);
-    thrust::host_vector<cudf::experimental::io::json::ColumnInfo> h_column_infos = d_column_infos;    
-
-    for (const auto &cinfo : h_column_infos) {
-      if (cinfo.null_count == static_cast<int>(rec_starts_.size())) {
-        // Entire column is NULL; allocate the smallest amount of memory
-        dtypes_.push_back(data_type(INT8));
-      } else if (cinfo.string_count > 0) {
-        dtypes_.push_back(data_type(STRING));
-      } else if (cinfo.datetime_count > 0) {
-        dtypes_.push_back(data_type(TIMESTAMP_MILLISECONDS));
-      } else if (cinfo.float_count > 0 || (cinfo.int_count > 0 && cinfo.null_count > 0)) {
-        dtypes_.push_back(data_type(FLOAT64));
-      } else if (cinfo.int_count > 0) {
-        dtypes_.push_back(data_type(INT64));
-      } else if (cinfo.bool_count > 0) {
-        dtypes_.push_back(data_type(BOOL8));
-      } else {
-        CUDF_FAIL("Data type detection failed.\n");
-      }
+  }
+  if (std::all_of(is_explicit.begin(), is_explicit.end(), [](bool b) { return b; })) {
+    return;
+  }
+
+  CUDF_EXPECTS(rec_starts_.size() != 0, "No data available for data type inference.\n");
+
+  // Only the fields of the columns without a type are inspected
+  std::vector<int> h_field_columns(field_columns_);
+  for (auto &col : h_field_columns) {
+    if (col != -1 && is_explicit[col]) {
+      col = -1;
+    }
+  }
+  rmm::device_vector<int> d_field_columns = h_field_columns;
+
+  rmm::device_vector<cudf::experimental::io::json::ColumnInfo> d_column_infos(num_columns, cudf::experimental::io::json::ColumnInfo{});
+  cudf::experimental::io::json::gpu::detect_data_types(d_column_infos.data().get(),
+                       static_cast<const char*>(data_.data()), data_.size(), 
+                       opts_, d_field_columns.data().get(), d_field_columns.size(),
+                       rec_starts_.data().get(), rec_starts_.size(), stream);
+  thrust::host_vector<cudf::experimental::io::json::ColumnInfo> h_column_infos = d_column_infos;    
+
+  for (size_t col = 0; col < num_columns; ++col) {
+    if (is_explicit[col]) {
+      continue;
+    }
+    const auto &cinfo = h_column_infos[col];
+    if (cinfo.null_count == static_cast<int>(rec_starts_.size())) {
+      // Entire column is NULL; allocate the smallest amount of memory
+      dtypes_[col] = data_type(INT8);
+    } else if (cinfo.string_count > 0) {
+      dtypes_[col] = data_type(STRING);
+    } else if (cinfo.datetime_count > 0) {
+      dtypes_[col] = data_type(TIMESTAMP_MILLISECONDS);
+    } else if (cinfo.float_count > 0 || (cinfo.int_count > 0 && cinfo.null_count > 0)) {
+      dtypes_[col] = data_type(FLOAT64);
+    } else if (cinfo.int_count > 0) {
+      dtypes_[col] = data_type(INT64);
+    } else if (cinfo.bool_count > 0) {
+      dtypes_[col] = data_type(BOOL8);
+    } else {
+      CUDF_FAIL("Data type detection failed.\n");
     }
-  }  
+  }
 }
 
 /**
@@ -442,9 +494,10 @@ table_with_metadata reader::impl::convert_data_to_table(cudaStream_t stream) {
   rmm::device_vector<void *> d_data = h_data;
   rmm::device_vector<cudf::bitmask_type *> d_valid = h_valid;
   rmm::device_vector<cudf::size_type> d_valid_counts(num_columns, 0);
+  rmm::device_vector<int> d_field_columns = field_columns_;
 
   cudf::experimental::io::json::gpu::convert_json_to_columns( data_, d_dtypes.data().get(), d_data.data().get(),
-                        num_records, num_columns, 
+                        num_records, d_field_columns.data().get(), d_field_columns.size(),
                         rec_starts_.data().get(),
                         d_valid.data().get(), d_valid_counts.data().get(), 
                         opts_, stream);  
@@ -507,7 +560,9 @@ table_with_metadata reader::impl::read(size_t range_offset, size_t range_size, c
 
   set_column_names(stream);
   CUDF_EXPECTS(!metadata.column_names.empty(), "Error determining column names.\n");
-  
+
+  select_columns();
+
   set_data_types(stream);
   CUDF_EXPECTS(!dtypes_.empty(), "Error in data type detection.\n");
 
@@ -69,6 +69,9 @@ private:
   
   table_metadata         metadata;
   std::vector<data_type> dtypes_;
+  // Output column of each field of a record, -1 if it is not read; fields
+  // after the last one read are not parsed at all
+  std::vector<int>       field_columns_;
   //std::vector<gdf_dtype_extra_info> dtypes_extra_info_;  
 
   // parsing options
@@ -132,10 +135,21 @@ private:
    **/
   void set_column_names(cudaStream_t stream);
 
+  /**
+   * @brief Select the columns to read from all the columns of the records
+   *
+   * Sets the field_columns_ data member, and restricts the column names to
+   * the columns read, in the order of the fields of the records
+   *
+   * @return void
+   **/
+  void select_columns();
+
   /**
    * @brief Set the data type array data member
    *
-   * If user does not pass the data types, deduces types from the file content
+   * Deduces the types of the columns the user does not pass the type of
+   * from the file content
    * 
    * @param[in] stream Cuda stream to execute gpu operations on
    *
@@ -22,9 +22,15 @@
 
 #include <algorithm>
 #include <array>
+#include <map>
+#include <set>
+
+#include <nvstrings/NVCategory.h>
+#include <nvstrings/NVStrings.h>
 
 #include <rmm/device_buffer.hpp>
 #include <rmm/thrust_rmm_allocator.h>
+#include <thrust/transform.h>
 
 namespace cudf {
 namespace io {
@@ -104,10 +110,11 @@ constexpr std::pair<gdf_dtype, gdf_dtype_extra_info> to_dtype(
     case parquet::DOUBLE:
       return std::make_pair(GDF_FLOAT64, gdf_dtype_extra_info{TIME_UNIT_NONE});
     case parquet::BYTE_ARRAY:
-    case parquet::FIXED_LEN_BYTE_ARRAY:
-      // Can be mapped to GDF_CATEGORY (32-bit hash) or GDF_STRING (nvstring)
-      return std::make_pair(strings_to_categorical ? GDF_CATEGORY : GDF_STRING,
+      // Can be mapped to GDF_STRING_CATEGORY (dictionary codes) or GDF_STRING
+      return std::make_pair(strings_to_categorical ? GDF_STRING_CATEGORY : GDF_STRING,
                             gdf_dtype_extra_info{TIME_UNIT_NONE});
+    case parquet::FIXED_LEN_BYTE_ARRAY:
+      return std::make_pair(GDF_STRING, gdf_dtype_extra_info{TIME_UNIT_NONE});
     case parquet::INT96:
       return (ts_unit != TIME_UNIT_NONE)
                  ? std::make_pair(GDF_TIMESTAMP, gdf_dtype_extra_info{ts_unit})
@@ -511,11 +518,25 @@ void reader::Impl::decode_page_data(
     str_dict_index.resize(total_str_dict_indexes);
   }
 
+  // The string dictionary entries of each category column, as the position
+  // and count of the entries of each of its chunks in the index
+  std::map<gdf_column *, std::vector<std::pair<size_t, size_t>>> dict_spans;
+  std::map<gdf_column *, int32_t> num_codes;
+
   // Update chunks with pointers to column data
   for (size_t c = 0, page_count = 0, str_ofs = 0; c < chunks.size(); c++) {
+    if (chunk_map[c]->dtype == GDF_STRING_CATEGORY) {
+      // Codes index the concatenated dictionaries of the column's chunks
+      chunks[c].str_dict_base = num_codes[chunk_map[c]];
+    }
     if (is_dict_chunk(chunks[c])) {
+      const auto num_entries = pages[page_count].num_values;
       chunks[c].str_dict_index = str_dict_index.data().get() + str_ofs;
-      str_ofs += pages[page_count].num_values;
+      if (chunk_map[c]->dtype == GDF_STRING_CATEGORY) {
+        dict_spans[chunk_map[c]].emplace_back(str_ofs, num_entries);
+        num_codes[chunk_map[c]] += num_entries;
+      }
+      str_ofs += num_entries;
     }
     chunks[c].valid_map_base = (uint32_t *)chunk_map[c]->valid;
     chunks[c].column_data_base = chunk_map[c]->data;
@@ -544,6 +565,95 @@ void reader::Impl::decode_page_data(
       }
     }
   }
+
+  // The dictionary entries are referenced by the index, so the categories
+  // are built before the page data is released
+  for (const auto &column_spans : dict_spans) {
+    build_category(column_spans.first, str_dict_index.data().get(),
+                   column_spans.second);
+  }
+}
+
+void reader::Impl::select_category_columns(
+    const hostdevice_vector<parquet::gpu::ColumnChunkDesc> &chunks,
+    const hostdevice_vector<parquet::gpu::PageInfo> &pages,
+    const std::vector<gdf_column *> &chunk_map) {
+  // Writers may fall back to plain encoding once the dictionary of a chunk
+  // grows too large; as codes are only known for dictionary pages, such a
+  // column is output as strings instead
+  std::set<gdf_column *> plain_columns;
+  for (size_t c = 0, page_count = 0; c < chunks.size(); c++) {
+    if (chunk_map[c]->dtype == GDF_STRING_CATEGORY) {
+      const auto first_page = page_count + chunks[c].num_dict_pages;
+      const auto end_page = page_count + chunks[c].max_num_pages;
+      if (chunks[c].num_dict_pages == 0 && first_page < end_page) {
+        plain_columns.insert(chunk_map[c]);
+      }
+      for (auto i = first_page; i < end_page; i++) {
+        if (pages[i].encoding != parquet::PLAIN_DICTIONARY &&
+            pages[i].encoding != parquet::RLE_DICTIONARY) {
+          plain_columns.insert(chunk_map[c]);
+        }
+      }
+    }
+    page_count += chunks[c].max_num_pages;
+  }
+
+  for (size_t c = 0; c < chunks.size(); c++) {
+    if (plain_columns.count(chunk_map[c]) != 0) {
+      chunks[c].data_type = parquet::BYTE_ARRAY;  // str -> nvstrdesc
+    }
+  }
+  for (auto column : plain_columns) {
+    column->dtype = GDF_STRING;
+  }
+}
+
+void reader::Impl::build_category(
+    gdf_column *column, const parquet::gpu::nvstrdesc_s *str_dict_index,
+    const std::vector<std::pair<size_t, size_t>> &dict_spans) {
+  using str_pair = std::pair<const char *, size_t>;
+
+  size_t num_entries = 0;
+  for (const auto &span : dict_spans) {
+    num_entries += span.second;
+  }
+  if (num_entries == 0) {
+    return;
+  }
+
+  // Gather the dictionaries of the column's chunks, in the order of the codes
+  using entry_type = parquet::gpu::nvstrdesc_s;
+  rmm::device_vector<entry_type> entries(num_entries);
+  for (size_t i = 0, pos = 0; i < dict_spans.size(); i++) {
+    CUDA_TRY(cudaMemcpyAsync(entries.data().get() + pos,
+                             str_dict_index + dict_spans[i].first,
+                             dict_spans[i].second * sizeof(entry_type),
+                             cudaMemcpyDeviceToDevice));
+    pos += dict_spans[i].second;
+  }
+
+  // Unify the dictionaries into a sorted set of keys; only the dictionary
+  // entries are hashed, not the rows
+  std::unique_ptr<NVCategory, decltype(&NVCategory::destroy)> dict(
+      NVCategory::create_from_index(
+          reinterpret_cast<str_pair *>(entries.data().get()), num_entries),
+      &NVCategory::destroy);
+  CUDF_EXPECTS(dict != nullptr, "Cannot create `NVCategory` instance");
+
+  // Remap the codes of the rows from dictionary entries to keys
+  const int32_t *entry_keys = dict->values_cptr();
+  const auto num_codes = static_cast<int32_t>(num_entries);
+  auto codes = static_cast<int32_t *>(column->data);
+  thrust::transform(
+      rmm::exec_policy()->on(0), codes, codes + column->size, codes,
+      [entry_keys, num_codes] __device__(int32_t code) {
+        return (code >= 0 && code < num_codes) ? entry_keys[code] : 0;
+      });
+
+  auto category = dict->gather(codes, column->size);
+  CUDF_EXPECTS(category != nullptr, "Cannot create `NVCategory` instance");
+  column->dtype_info.category = category;
 }
 
 reader::Impl::Impl(std::unique_ptr<datasource> source,
@@ -643,8 +753,8 @@ table reader::Impl::read(int skip_rows, int num_rows, int row_group) {
         type_width = 1;  // I32 -> I8
       else if (gdf_column->dtype == GDF_INT16)
         type_width = 2;  // I32 -> I16
-      else if (gdf_column->dtype == GDF_CATEGORY)
-        type_width = 4;  // str -> hash32
+      else if (gdf_column->dtype == GDF_STRING_CATEGORY)
+        type_width = 4;  // str -> dictionary code
       else if (gdf_column->dtype == GDF_TIMESTAMP)
         ts_clock_rate = to_clockrate(timestamp_unit_);
 
@@ -706,6 +816,7 @@ table reader::Impl::read(int skip_rows, int num_rows, int row_group) {
     rmm::device_buffer decomp_page_data;
 
     decode_page_headers(chunks, pages);
+    select_category_columns(chunks, pages, chunk_map);
     if (total_decompressed_size > 0) {
       decomp_page_data = decompress_page_data(chunks, pages);
       // Free compressed data
@@ -96,6 +96,19 @@ class reader::Impl {
       const hostdevice_vector<parquet::gpu::ColumnChunkDesc> &chunks,
       const hostdevice_vector<parquet::gpu::PageInfo> &pages);
 
+  /**
+   * @brief Outputs the category columns as strings unless all of their data
+   * pages are dictionary-encoded.
+   *
+   * @param[in] chunks List of column chunk descriptors
+   * @param[in] pages List of page information
+   * @param[in] chunk_map Mapping between column chunk and gdf_column
+   **/
+  void select_category_columns(
+      const hostdevice_vector<parquet::gpu::ColumnChunkDesc> &chunks,
+      const hostdevice_vector<parquet::gpu::PageInfo> &pages,
+      const std::vector<gdf_column *> &chunk_map);
+
   /**
    * @brief Decompresses the page data, at page granularity.
    *
@@ -123,6 +136,18 @@ class reader::Impl {
       const std::vector<gdf_column *> &chunk_map, size_t min_row,
       size_t total_rows);
 
+  /**
+   * @brief Unifies the string dictionaries of the chunks of a category column
+   * into its category, and remaps its codes to the keys of the category.
+   *
+   * @param[in,out] column Category column holding dictionary entry codes
+   * @param[in] str_dict_index Index of the string dictionary entries
+   * @param[in] dict_spans Position and count of the entries of each chunk
+   **/
+  void build_category(
+      gdf_column *column, const parquet::gpu::nvstrdesc_s *str_dict_index,
+      const std::vector<std::pair<size_t, size_t>> &dict_spans);
+
  private:
   std::unique_ptr<datasource> source_;
   std::unique_ptr<ParquetMetadata> md_;
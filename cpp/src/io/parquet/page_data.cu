@@ -637,17 +637,29 @@ __device__ void gpuInitStringDescriptors(volatile page_state_s *s, int target_po
 
 
 /**
- * @brief Output a string descriptor
+ * @brief Output a string descriptor, hash or dictionary code
  *
  * @param[in,out] s Page state input/output
  * @param[in] src_pos Source position
- * @param[in] dstv Pointer to row output data (string descriptor or 32-bit hash)
+ * @param[in] dstv Pointer to row output data (string descriptor, 32-bit hash or dictionary code)
  **/
 inline __device__ void gpuOutputString(volatile page_state_s *s, int src_pos, void *dstv)
 {
     const char *ptr = NULL;
     size_t len = 0;
 
+    if (s->dtype_len == 4 && s->col.str_dict_base >= 0)
+    {
+        // Output the code of the dictionary entry
+        uint32_t dict_idx = (s->dict_bits > 0) ? s->dict_idx[src_pos & (NZ_BFRSZ - 1)] : 0;
+        int32_t code = -1;
+        if (s->dict_base && dict_idx * sizeof(nvstrdesc_s) < (uint32_t)s->dict_size)
+        {
+            code = s->col.str_dict_base + (int32_t)dict_idx;
+        }
+        *reinterpret_cast<int32_t *>(dstv) = code;
+        return;
+    }
     if (s->dict_base)
     {
         // String dictionary
@@ -92,7 +92,8 @@ struct ColumnChunkDesc {
         codec(codec_),
         converted_type(converted_type_),
         decimal_scale(decimal_scale_),
-        ts_clock_rate(ts_clock_rate_) {}
+        ts_clock_rate(ts_clock_rate_),
+        str_dict_base(-1) {}
 
   uint8_t *compressed_data;     // pointer to compressed column chunk data
   size_t compressed_size;       // total compressed data size for this chunk
@@ -117,6 +118,8 @@ struct ColumnChunkDesc {
   int8_t converted_type;        // converted type enum
   int8_t decimal_scale;         // decimal scale pow(10, -decimal_scale)
   int32_t ts_clock_rate;        // output timestamp clock frequency (0=default, 1000=ms, 1000000000=ns)
+  int32_t str_dict_base;        // output code of the first string dictionary entry, for 32-bit string
+                                // output of dictionary codes rather than hashes (-1=output hashes)
 };
 
 
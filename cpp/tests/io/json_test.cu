@@ -416,6 +416,34 @@ TEST_F(JsonReaderTest, JsonLinesObjectsStrings) {
   cudf::test::expect_columns_equal(result.tbl->get_column(2), cudf::test::strings_column_wrapper({"aaa", "bbb"}));
 }
 
+TEST_F(JsonReaderTest, JsonLinesObjectsUseCols) {
+  std::string data =
+      "{\"col1\":100, \"col2\":1.1, \"col3\":\"aaa\", \"col4\":true}\n"
+      "{\"col1\":200, \"col2\":2.2, \"col3\":\"bbb\", \"col4\":false}\n";
+
+  cudf_io::read_json_args in_args{cudf_io::source_info{data.data(), data.size()}};
+  in_args.lines = true;
+  in_args.use_cols_names = {"col3", "col1"};
+  in_args.dtype = {"col1:int32"};
+
+  cudf_io::table_with_metadata result = cudf_io::read_json(in_args);
+
+  EXPECT_EQ(result.tbl->num_columns(), 2);
+  EXPECT_EQ(result.tbl->num_rows(), 2);
+
+  EXPECT_EQ(result.tbl->get_column(0).type().id(), cudf::INT32);
+  EXPECT_EQ(result.tbl->get_column(1).type().id(), cudf::STRING);
+
+  EXPECT_EQ(std::string(result.metadata.column_names[0]), "col1");
+  EXPECT_EQ(std::string(result.metadata.column_names[1]), "col3");
+
+  auto validity = cudf::test::make_counting_transform_iterator(
+      0, [](auto i) { return true; });
+
+  cudf::test::expect_columns_equal(result.tbl->get_column(0), int_wrapper{{100, 200}, validity});
+  cudf::test::expect_columns_equal(result.tbl->get_column(1), cudf::test::strings_column_wrapper({"aaa", "bbb"}));
+}
+
 /*
 // currently, the json reader is strict about having non-empty input.
 TEST_F(JsonReaderTest, EmptyFile) {
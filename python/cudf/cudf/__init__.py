@@ -3,7 +3,16 @@
 
 from cudf import core, datasets
 from cudf._version import get_versions
-from cudf.core import DataFrame, Index, MultiIndex, Series, from_pandas, merge
+from cudf.core import (
+    DataFrame,
+    Index,
+    MultiIndex,
+    Series,
+    apply_rows,
+    from_pandas,
+    merge,
+    segmented,
+)
 from cudf.core.dtypes import CategoricalDtype
 from cudf.core.ops import (
     arccos,
@@ -19,9 +28,16 @@ from cudf.core.ops import (
     sqrt,
     tan,
 )
-from cudf.core.reshape import concat, get_dummies, melt, merge_sorted
+from cudf.core.reshape import (
+    concat,
+    get_dummies,
+    melt,
+    merge_asof,
+    merge_sorted,
+)
 from cudf.io import (
     from_dlpack,
+    read_arrow_stream,
     read_avro,
     read_csv,
     read_feather,
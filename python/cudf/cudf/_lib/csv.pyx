@@ -244,6 +244,29 @@ cpdef read_csv(
 
     return df
 
+class _ChunkWriter:
+    """
+    Write the chunks of CSV data produced by libcudf to a binary file,
+    keeping the first error raised, as it cannot be raised in libcudf.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.error = None
+
+    def write(self, data):
+        if self.error is not None:
+            return
+        try:
+            self.file.write(data)
+        except BaseException as e:
+            self.error = e
+
+
+cdef void _write_chunk(void* context, const char* data, size_t size) with gil:
+    (<object> context).write(data[:size])
+
+
 cpdef write_csv(
     cols,
     path=None,
@@ -253,10 +276,14 @@ cpdef write_csv(
     header=True,
     line_terminator="\n",
     rows_per_chunk=8,
+    file=None,
 ):
     """
     Cython function to call into libcudf API, see `write_csv`.
 
+    The CSV data is written to the binary ``file`` if given, and otherwise
+    to the file at ``path``.
+
     See Also
     --------
     cudf.io.csv.write_csv
@@ -269,8 +296,17 @@ cpdef write_csv(
     cdef gdf_column* c_col
     cdef cpp_csv.csv_write_arg csv_writer = cpp_csv.csv_write_arg()
 
-    path = str(os.path.expanduser(str(path))).encode()
-    csv_writer.filepath = path
+    writer = None
+    if file is not None:
+        writer = _ChunkWriter(file)
+        csv_writer.filepath = NULL
+        csv_writer.write_chunk = _write_chunk
+        csv_writer.write_context = <void*> writer
+    else:
+        path = str(os.path.expanduser(str(path))).encode()
+        csv_writer.filepath = path
+        csv_writer.write_chunk = NULL
+        csv_writer.write_context = NULL
     line_terminator = line_terminator.encode()
     csv_writer.line_terminator = line_terminator
     csv_writer.delimiter = sep.encode()[0]
@@ -327,4 +363,7 @@ cpdef write_csv(
 
     nvtx_range_pop()
 
+    if writer is not None and writer.error is not None:
+        raise writer.error
+
     return None
@@ -28,7 +28,7 @@ cdef get_scalar_value(gdf_scalar scalar, dtype)
 
 cdef gdf_column* column_view_from_column(Column col, col_name=*) except? NULL
 cdef gdf_scalar* gdf_scalar_from_scalar(val, dtype=*) except? NULL
-cdef Column gdf_column_to_column(gdf_column* c_col)
+cdef Column gdf_column_to_column(gdf_column* c_col, bint categorical=*)
 cdef gdf_column* column_view_from_string_column(Column col,
                                                 col_name=*) except? NULL
 cdef gdf_column** cols_view_from_cols(cols, names=*) except ? NULL
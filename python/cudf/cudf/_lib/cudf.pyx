@@ -313,7 +313,7 @@ cpdef uintptr_t column_view_pointer(col):
     return <uintptr_t> column_view_from_column(col)
 
 
-cdef Column gdf_column_to_column(gdf_column* c_col):
+cdef Column gdf_column_to_column(gdf_column* c_col, bint categorical=False):
     """
     Util to create a Python cudf.Column from a libcudf gdf_column.
 
@@ -321,9 +321,17 @@ cdef Column gdf_column_to_column(gdf_column* c_col):
     ----------
     c_col : gdf_column*
         A pointer to the source gdf_column.
+    categorical : bool; optional
+        A flag indicating GDF_STRING_CATEGORY columns should be returned as
+        categorical columns of their codes rather than as string columns
+        (default: False).
     """
     from cudf.core.buffer import Buffer
-    from cudf.core.column import build_column, as_column
+    from cudf.core.column import (
+        build_categorical_column,
+        build_column,
+        as_column,
+    )
 
     gdf_dtype = c_col.dtype
     data_ptr = int(<uintptr_t>c_col.data)
@@ -333,6 +341,29 @@ cdef Column gdf_column_to_column(gdf_column* c_col):
         c_free(<void*><uintptr_t>mask_ptr, <cudaStream_t><uintptr_t>0)
         data = nvstrings.bind_cpointer(data_ptr)
         result = as_column(data)
+    elif gdf_dtype == GDF_STRING_CATEGORY and categorical:
+        # the keys of the category are the categories, and the column data
+        # their codes: the strings of the rows are not built
+        nvcat_ptr = int(<uintptr_t>c_col.dtype_info.category)
+        if nvcat_ptr == 0:
+            categories = as_column(nvstrings.to_device([]))
+        else:
+            nvcat_obj = nvcategory.bind_cpointer(nvcat_ptr)
+            categories = as_column(nvcat_obj.keys())
+
+        dptr = rmm._DevicePointer(data_ptr)
+        codes = build_column(
+            data=Buffer(dptr, np.dtype("int32").itemsize * c_col.size),
+            dtype=np.dtype("int32"),
+        )
+        mask = None
+        if mask_ptr != 0:
+            mptr = rmm._DevicePointer(mask_ptr)
+            mask = Buffer(mptr, size=bitmask_allocation_size_bytes(c_col.size))
+
+        result = build_categorical_column(
+            categories=categories, codes=codes, mask=mask, ordered=False
+        )
     elif gdf_dtype == GDF_STRING_CATEGORY:
         c_free(<void*><uintptr_t>data_ptr, <cudaStream_t><uintptr_t>0)
         c_free(<void*><uintptr_t>mask_ptr, <cudaStream_t><uintptr_t>0)
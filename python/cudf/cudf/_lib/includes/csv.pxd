@@ -85,4 +85,7 @@ cdef extern from "cudf/cudf.h" nogil:
 
         int rows_per_chunk
 
+        void (*write_chunk)(void* context, const char* data, size_t size)
+        void* write_context
+
     cdef gdf_error write_csv(csv_write_arg* args) except +
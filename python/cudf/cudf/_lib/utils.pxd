@@ -6,7 +6,7 @@ from libcpp.pair cimport pair
 from libcpp.string cimport string
 
 
-cdef table_to_dataframe(cudf_table* table, int_col_names=*)
+cdef table_to_dataframe(cudf_table* table, int_col_names=*, categorical=*)
 cdef cudf_table* table_from_dataframe(df) except? NULL
 
 cdef columns_from_table(cudf_table* table, int_col_names=*)
@@ -18,7 +18,8 @@ cdef cudf_table* table_from_dataframe(df) except? NULL:
     return c_table
 
 
-cdef table_to_dataframe(cudf_table* c_table, int_col_names=False):
+cdef table_to_dataframe(cudf_table* c_table, int_col_names=False,
+                        categorical=False):
     """
     Util to create a Python cudf.DataFrame from a libcudf cudf_table.
 
@@ -32,6 +33,9 @@ cdef table_to_dataframe(cudf_table* c_table, int_col_names=False):
     int_col_names : bool; optional
         A flag indicating string column names should be cast
         to integers after decoding (default: False).
+    categorical : bool; optional
+        A flag indicating GDF_STRING_CATEGORY columns should be returned
+        as categorical columns (default: False).
     """
     from cudf.core.dataframe import DataFrame
     cdef i
@@ -39,7 +43,7 @@ cdef table_to_dataframe(cudf_table* c_table, int_col_names=False):
     df = DataFrame()
     for i in range(c_table[0].num_columns()):
         c_col = c_table[0].get_column(i)
-        col = gdf_column_to_column(c_col)
+        col = gdf_column_to_column(c_col, categorical)
         name = None
         if c_col.col_name is not NULL:
             name = c_col.col_name.decode()
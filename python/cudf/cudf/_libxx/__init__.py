@@ -7,6 +7,7 @@ from . import (
     copying,
     dlpack,
     gpuarrow,
+    groupby,
     hash,
     join,
     merge,
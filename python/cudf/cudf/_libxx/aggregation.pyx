@@ -16,7 +16,8 @@ from cudf._libxx.cpp.types cimport (
     type_id,
     size_type,
     data_type,
-    interpolation
+    interpolation,
+    include_nulls
 )
 cimport cudf._libxx.cpp.aggregation as libcudf_aggregation
 
@@ -53,8 +54,28 @@ cdef unique_ptr[aggregation] get_aggregation(op, kwargs) except *:
         )
     elif op == "std":
         agg = move(libcudf_aggregation.make_std_aggregation(kwargs['ddof']))
-    elif op == "count":
-        agg = move(libcudf_aggregation.make_count_aggregation())
+    elif op == "median":
+        agg = move(libcudf_aggregation.make_median_aggregation())
+    elif op == "argmin":
+        agg = move(libcudf_aggregation.make_argmin_aggregation())
+    elif op == "argmax":
+        agg = move(libcudf_aggregation.make_argmax_aggregation())
+    elif op == "nunique":
+        agg = move(libcudf_aggregation.make_nunique_aggregation(
+            include_nulls.EXCLUDE_NULLS)
+        )
+    elif op == "size":
+        agg = move(libcudf_aggregation.make_count_aggregation(
+            include_nulls.INCLUDE_NULLS)
+        )
+    elif op == "first":
+        agg = move(libcudf_aggregation.make_nth_element_aggregation(
+            0, include_nulls.EXCLUDE_NULLS)
+        )
+    elif op == "last":
+        agg = move(libcudf_aggregation.make_nth_element_aggregation(
+            -1, include_nulls.EXCLUDE_NULLS)
+        )
     elif callable(op):
         # Handling UDF type
         nb_type = numba.numpy_support.from_dtype(kwargs['dtype'])
@@ -4,7 +4,12 @@ from libcpp.string cimport string
 from libcpp.memory cimport unique_ptr
 from libcpp.vector cimport vector
 
-from cudf._libxx.cpp.types cimport size_type, data_type, interpolation
+from cudf._libxx.cpp.types cimport (
+    size_type,
+    data_type,
+    interpolation,
+    include_nulls
+)
 
 
 cdef extern from "cudf/aggregation.hpp" namespace "cudf::experimental" nogil:
@@ -25,6 +30,9 @@ cdef extern from "cudf/aggregation.hpp" namespace "cudf::experimental" nogil:
 
     cdef unique_ptr[aggregation] make_count_aggregation() except +
 
+    cdef unique_ptr[aggregation] make_count_aggregation(
+        include_nulls _include_nulls) except +
+
     cdef unique_ptr[aggregation] make_any_aggregation() except +
 
     cdef unique_ptr[aggregation] make_all_aggregation() except +
@@ -47,6 +55,12 @@ cdef extern from "cudf/aggregation.hpp" namespace "cudf::experimental" nogil:
 
     cdef unique_ptr[aggregation] make_argmin_aggregation() except +
 
+    cdef unique_ptr[aggregation] make_nunique_aggregation(
+        include_nulls _include_nulls) except +
+
+    cdef unique_ptr[aggregation] make_nth_element_aggregation(
+        size_type n, include_nulls _include_nulls) except +
+
     cdef unique_ptr[aggregation] make_udf_aggregation(
         udf_type type,
         string user_defined_aggregator,
@@ -0,0 +1,43 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+from libcpp.memory cimport unique_ptr
+from libcpp.vector cimport vector
+from libcpp.pair cimport pair
+
+from cudf._libxx.cpp.aggregation cimport aggregation
+from cudf._libxx.cpp.column.column cimport column
+from cudf._libxx.cpp.column.column_view cimport column_view
+from cudf._libxx.cpp.table.table cimport table
+from cudf._libxx.cpp.table.table_view cimport table_view
+from cudf._libxx.cpp.types cimport include_nulls, sorted
+
+
+cdef extern from "cudf/groupby.hpp" \
+        namespace "cudf::experimental::groupby" nogil:
+    cdef cppclass aggregation_request:
+        aggregation_request() except +
+        column_view values
+        vector[unique_ptr[aggregation]] aggregations
+
+    cdef cppclass aggregation_result:
+        aggregation_result() except +
+        vector[unique_ptr[column]] results
+
+    cdef cppclass groupby:
+        groupby(const table_view& keys) except +
+        groupby(
+            const table_view& keys,
+            include_nulls include_null_keys
+        ) except +
+        groupby(
+            const table_view& keys,
+            include_nulls include_null_keys,
+            sorted keys_are_sorted
+        ) except +
+
+        pair[
+            unique_ptr[table],
+            vector[aggregation_result]
+        ] aggregate(
+            const vector[aggregation_request]& requests
+        ) except +
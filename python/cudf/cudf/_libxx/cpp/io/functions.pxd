@@ -28,6 +28,7 @@ cdef extern from "cudf/io/functions.hpp" \
         bool lines
         cudf_io_types.compression_type compression
         vector[string] dtype
+        vector[string] use_cols_names
         bool dayfirst
         size_t byte_range_offset
         size_t byte_range_size
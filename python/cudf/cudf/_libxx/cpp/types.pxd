@@ -20,6 +20,10 @@ cdef extern from "cudf/types.hpp" namespace "cudf" nogil:
         ASCENDING "cudf::order::ASCENDING"
         DESCENDING "cudf::order::DESCENDING"
 
+    ctypedef enum include_nulls "cudf::include_nulls":
+        EXCLUDE_NULLS "cudf::include_nulls::NO"
+        INCLUDE_NULLS "cudf::include_nulls::YES"
+
     ctypedef enum null_order "cudf::null_order":
         AFTER "cudf::null_order::AFTER"
         BEFORE "cudf::null_order::BEFORE"
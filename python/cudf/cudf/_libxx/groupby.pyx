@@ -0,0 +1,97 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+from libcpp cimport bool
+from libcpp.memory cimport unique_ptr
+from libcpp.pair cimport pair
+from libcpp.vector cimport vector
+
+from cudf.utils.dtypes import is_categorical_dtype
+
+from cudf._libxx.column cimport Column
+from cudf._libxx.table cimport Table, columns_from_ptr
+from cudf._libxx.move cimport move
+from cudf._libxx.aggregation cimport get_aggregation
+
+from cudf._libxx.cpp.table.table cimport table
+from cudf._libxx.cpp.table.table_view cimport table_view
+from cudf._libxx.cpp.types cimport include_nulls
+cimport cudf._libxx.cpp.groupby as libcudf_groupby
+
+
+def groupby(Table keys, list values, list aggs, bool dropna=True, ddof=1):
+    """
+    Compute grouped aggregations of ``values``, grouping by ``keys``.
+
+    Each value column is sent to libcudf once, together with the list of
+    aggregations to compute on it, so that several aggregations of the
+    same column share a single pass over the data.
+
+    Parameters
+    ----------
+    keys : Table
+        Key columns to group by.
+    values : list of Columns
+        Columns to aggregate.
+    aggs : list of lists of str
+        The aggregations to compute for the column at the same position
+        in ``values``.
+    dropna : bool
+        Whether or not to drop null keys
+    ddof : int
+        Delta degrees of freedom of the ``var`` and ``std`` aggregations
+
+    Returns
+    -------
+    result : tuple
+        The unique keys as a list of Columns, in arbitrary order, and for
+        each column of ``values`` a list of result Columns, one per
+        aggregation.
+    """
+    from cudf.core.column import build_categorical_column
+
+    cdef table_view c_keys_view = keys.data_view()
+    cdef include_nulls c_include_null_keys = (
+        include_nulls.EXCLUDE_NULLS if dropna
+        else include_nulls.INCLUDE_NULLS
+    )
+    cdef unique_ptr[libcudf_groupby.groupby] c_groupby
+    cdef vector[libcudf_groupby.aggregation_request] c_requests
+    cdef pair[
+        unique_ptr[table],
+        vector[libcudf_groupby.aggregation_result]
+    ] c_result
+    cdef Column col
+
+    c_groupby.reset(
+        new libcudf_groupby.groupby(c_keys_view, c_include_null_keys)
+    )
+
+    c_requests.resize(len(values))
+    for i, (col, agg_list) in enumerate(zip(values, aggs)):
+        c_requests[i].values = col.view()
+        for op in agg_list:
+            c_requests[i].aggregations.push_back(
+                move(get_aggregation(op, {"dtype": col.dtype, "ddof": ddof}))
+            )
+
+    with nogil:
+        c_result = move(c_groupby.get()[0].aggregate(c_requests))
+
+    result_key_cols = columns_from_ptr(move(c_result.first))
+    for i, inp_key_col in enumerate(keys._data.columns):
+        if is_categorical_dtype(inp_key_col.dtype):
+            result_key_cols[i] = build_categorical_column(
+                categories=inp_key_col.categories,
+                codes=result_key_cols[i],
+                mask=result_key_cols[i].base_mask,
+                ordered=inp_key_col.ordered,
+            )
+
+    result_value_cols = []
+    for i in range(c_result.second.size()):
+        result_value_cols.append([
+            Column.from_unique_ptr(move(c_result.second[i].results[j]))
+            for j in range(c_result.second[i].results.size())
+        ])
+
+    return result_key_cols, result_value_cols
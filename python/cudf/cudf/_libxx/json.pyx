@@ -16,7 +16,7 @@ cimport cudf._libxx.cpp.io.types as cudf_io_types
 
 
 cpdef read_json(filepath_or_buffer, dtype,
-                lines, compression, byte_range):
+                lines, compression, byte_range, columns=None):
     """
     Cython function to call into libcudf API, see `read_json`.
 
@@ -63,6 +63,10 @@ cpdef read_json(filepath_or_buffer, dtype,
             for col_dtype in dtype:
                 args.dtype.push_back(str(col_dtype).encode())
 
+    if columns is not None:
+        for col in columns:
+            args.use_cols_names.push_back(str(col).encode())
+
     # Determine byte read offsets if applicable
     cdef size_t c_range_offset = byte_range[0] if byte_range is not None else 0
     cdef size_t c_range_size = byte_range[1] if byte_range is not None else 0
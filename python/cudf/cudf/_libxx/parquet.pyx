@@ -143,8 +143,11 @@ cpdef read_parquet(filepath_or_buffer, columns=None, row_group=None,
         else:
             c_out_table = reader.get().read_all()
 
-    # Construct dataframe from columns
-    df = table_to_dataframe(&c_out_table)
+    # Construct dataframe from columns; dictionary-encoded strings are
+    # kept as categorical codes when `strings_to_categorical` is set
+    df = table_to_dataframe(
+        &c_out_table, categorical=bool(strings_to_categorical)
+    )
 
     # Set column to use as row indexes if available
     index_col = reader.get().get_index_column().decode("UTF-8")
@@ -35,7 +35,7 @@ def is_sorted(
     null_position : None or list-like of booleans
         None or list-like of boolean values indicating desired order of nulls
         compared to other elements. If list-like, size of list-like must be
-        len(columns). If None, null order is set to before. False (0) - after,
+        len(columns). If None, null order is set to after. False (0) - after,
         True (1) - before.
 
     Returns
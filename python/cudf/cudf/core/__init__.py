@@ -1,8 +1,8 @@
 # Copyright (c) 2018-2019, NVIDIA CORPORATION.
 
-from cudf.core import buffer, column
+from cudf.core import buffer, column, segmented
 from cudf.core.buffer import Buffer
-from cudf.core.dataframe import DataFrame, from_pandas, merge
+from cudf.core.dataframe import DataFrame, apply_rows, from_pandas, merge
 from cudf.core.index import (
     CategoricalIndex,
     DatetimeIndex,
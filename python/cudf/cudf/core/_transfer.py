@@ -0,0 +1,412 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+"""
+Batched host <-> device transfer of fixed-width columns.
+
+Rather than one allocation and one synchronous copy per column, the data
+and null masks of many columns are packed into a single staging buffer,
+copied in one go and sliced without copying on the other side. The host
+staging buffer is page-locked and reused across calls.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+import cupy
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from numba import cuda
+
+import rmm
+
+from cudf._libxx.null_mask import bitmask_allocation_size_bytes
+from cudf.core.buffer import Buffer
+from cudf.core.column import build_column
+from cudf.core.column.datetime import DatetimeColumn
+from cudf.core.column.numerical import NumericalColumn
+from cudf.utils.dtypes import np_to_pa_dtype
+
+# the offset of every buffer in a staging buffer is a multiple of this
+_ALIGNMENT = 64
+
+_time_units = ("s", "ms", "us", "ns")
+
+
+def _aligned(nbytes):
+    return -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+
+
+class PinnedMemoryPool:
+    """
+    A page-locked host staging buffer, reused across transfers.
+
+    Page-locked memory is expensive to allocate but is copied to and from
+    the device much faster than pageable memory, so the buffer is kept and
+    only grown when a larger one is needed.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        The largest buffer kept. Transfers are split into batches of at
+        most this size. Defaults to the ``CUDF_PINNED_POOL_SIZE``
+        environment variable, or 256MiB.
+    """
+
+    def __init__(self, max_bytes=None):
+        if max_bytes is None:
+            max_bytes = int(
+                os.environ.get("CUDF_PINNED_POOL_SIZE", 256 * 1024 ** 2)
+            )
+        self.max_bytes = max_bytes
+        self._buffer = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def reserve(self, nbytes):
+        """
+        Yield a host buffer of ``nbytes`` bytes, which is page-locked
+        unless it is too large for the pool or the pool is in use.
+        """
+        if nbytes > self.max_bytes or not self._lock.acquire(blocking=False):
+            yield np.empty(nbytes, dtype=np.uint8)
+            return
+        try:
+            if self._buffer is None or self._buffer.size < nbytes:
+                self._buffer = None
+                size = max(nbytes, 1024 ** 2)
+                size = min(1 << (size - 1).bit_length(), self.max_bytes)
+                self._buffer = cuda.pinned_array(size, dtype=np.uint8)
+            yield self._buffer[:nbytes]
+        finally:
+            self._lock.release()
+
+    @property
+    def nbytes(self):
+        return 0 if self._buffer is None else self._buffer.size
+
+    def clear(self):
+        """Release the page-locked buffer."""
+        with self._lock:
+            self._buffer = None
+
+
+pinned_memory_pool = PinnedMemoryPool()
+
+
+def _batches(sizes, max_bytes):
+    """
+    Split the positions of ``sizes`` into consecutive batches of at most
+    ``max_bytes``, an oversized item making a batch of its own.
+    """
+    batch, total = [], 0
+    for i, size in enumerate(sizes):
+        if batch and total + size > max_bytes:
+            yield batch
+            batch, total = [], 0
+        batch.append(i)
+        total += size
+    if batch:
+        yield batch
+
+
+def _pack_mask(valid):
+    """
+    Pack a boolean array into a little-endian bitmask of the size libcudf
+    allocates.
+    """
+    out = np.zeros(bitmask_allocation_size_bytes(len(valid)), dtype=np.uint8)
+    padded = np.zeros(-(-len(valid) // 8) * 8, dtype=np.bool_)
+    padded[: len(valid)] = valid
+    bits = np.packbits(padded.reshape(-1, 8)[:, ::-1])
+    out[: len(bits)] = bits
+    return out
+
+
+def _host_validity(values, nan_as_null):
+    """
+    The validity of ``values`` if it has any null, else None.
+    """
+    if values.dtype.kind == "f" and nan_as_null:
+        invalid = np.isnan(values)
+    elif values.dtype.kind == "M":
+        invalid = np.isnat(values)
+    else:
+        return None
+    if not invalid.any():
+        return None
+    return ~invalid
+
+
+def is_batchable_array(values):
+    """
+    Whether a host array can be moved to the device by ``arrays_to_device``.
+    """
+    if not isinstance(values, np.ndarray) or values.ndim != 1:
+        return False
+    if values.dtype.kind == "M":
+        return np.datetime_data(values.dtype)[0] in _time_units
+    return values.dtype.kind in "biuf"
+
+
+def _to_device(parts):
+    """
+    Copy host buffers to the device through the pinned staging buffer.
+
+    Parameters
+    ----------
+    parts : list of (numpy.ndarray, int)
+        The bytes of each buffer, as a uint8 array, and the size of the
+        device buffer, which is zero-padded.
+
+    Returns
+    -------
+    list of Buffer
+        Slices of one device allocation per batch.
+    """
+    sizes = [_aligned(size) for _, size in parts]
+    out = [None] * len(parts)
+    for batch in _batches(sizes, pinned_memory_pool.max_bytes):
+        offsets = np.cumsum([0] + [sizes[i] for i in batch])
+        with pinned_memory_pool.reserve(int(offsets[-1])) as host:
+            for i, offset in zip(batch, offsets):
+                data, size = parts[i]
+                host[offset : offset + data.size] = data
+                host[offset + data.size : offset + size] = 0
+            device = rmm.DeviceBuffer(ptr=host.ctypes.data, size=host.size)
+        for i, offset in zip(batch, offsets):
+            out[i] = Buffer(device.ptr + int(offset), parts[i][1], device)
+    return out
+
+
+def _to_host(parts):
+    """
+    Copy device buffers to the host by a single transfer per batch.
+
+    Parameters
+    ----------
+    parts : list of (Buffer, int)
+        Device buffers and the number of their leading bytes to copy.
+
+    Returns
+    -------
+    list of numpy.ndarray
+        uint8 views of one host allocation per batch.
+    """
+    sizes = [_aligned(size) for _, size in parts]
+    out = [None] * len(parts)
+    for batch in _batches(sizes, pinned_memory_pool.max_bytes):
+        offsets = np.cumsum([0] + [sizes[i] for i in batch])
+        device = Buffer.empty(int(offsets[-1]))
+        staging = cupy.asarray(device).view(np.uint8)
+        for i, offset in zip(batch, offsets):
+            buf, size = parts[i]
+            if size > 0:
+                data = cupy.asarray(buf).view(np.uint8)
+                staging[offset : offset + size] = data[:size]
+
+        with pinned_memory_pool.reserve(device.size) as pinned:
+            rmm._lib.device_buffer.copy_ptr_to_host(device.ptr, pinned)
+            # the pinned buffer is reused, so the results must own a copy
+            host = pinned.copy()
+        for i, offset in zip(batch, offsets):
+            out[i] = host[offset : offset + parts[i][1]]
+    return out
+
+
+def arrays_to_device(arrays, nan_as_null=True):
+    """
+    Move fixed-width host arrays to the device as a list of columns.
+
+    The data and masks of a batch of arrays are packed into one host
+    buffer and copied by a single transfer into a single device buffer,
+    which the columns share.
+
+    Parameters
+    ----------
+    arrays : list of numpy.ndarray
+        Arrays for which ``is_batchable_array`` is True.
+    nan_as_null : bool, default True
+        Whether NaN values of floating point arrays are null.
+    """
+    arrays = [np.ascontiguousarray(values) for values in arrays]
+    parts, masked = [], []
+    for values in arrays:
+        parts.append((values.view(np.uint8), values.nbytes))
+        valid = _host_validity(values, nan_as_null)
+        masked.append(valid is not None)
+        if valid is not None:
+            mask = _pack_mask(valid)
+            parts.append((mask, mask.size))
+
+    buffers = iter(_to_device(parts))
+    out = []
+    for values, has_mask in zip(arrays, masked):
+        data = next(buffers)
+        mask = next(buffers) if has_mask else None
+        out.append(build_column(data, values.dtype, mask=mask))
+    return out
+
+
+def _arrow_dtype(pa_type):
+    """
+    The dtype of the columns the arrays of ``pa_type`` are copied to by
+    ``arrow_to_device``, or None if they are not.
+    """
+    if pa.types.is_timestamp(pa_type):
+        if pa_type.tz is not None:
+            return None
+        return np.dtype("datetime64[{}]".format(pa_type.unit))
+    if pa.types.is_date64(pa_type):
+        return np.dtype("datetime64[ms]")
+    if pa.types.is_integer(pa_type) or pa.types.is_floating(pa_type):
+        dtype = np.dtype(pa_type.to_pandas_dtype())
+        return None if dtype == np.float16 else dtype
+    return None
+
+
+def _single_chunk(arr):
+    if isinstance(arr, pa.ChunkedArray):
+        if arr.num_chunks != 1:
+            return None
+        arr = arr.chunk(0)
+    return arr
+
+
+def is_batchable_arrow(arr, dtype=None):
+    """
+    Whether a pyarrow array can be moved to the device by
+    ``arrow_to_device``, as a column of ``dtype`` if it is not None. The
+    ``dtype`` may also be a pandas type name from pandas metadata.
+    """
+    arr = _single_chunk(arr)
+    if arr is None or arr.offset != 0:
+        return False
+    target = _arrow_dtype(arr.type)
+    if target is None or dtype is None:
+        return target is not None
+    if dtype == "datetime":
+        return target.kind == "M"
+    try:
+        return np.dtype(dtype) == target
+    except TypeError:
+        return False
+
+
+def _host_bytes(buf, nbytes):
+    if nbytes == 0:
+        return np.empty(0, dtype=np.uint8)
+    return np.frombuffer(buf, dtype=np.uint8, count=nbytes)
+
+
+def arrow_to_device(arrays):
+    """
+    Move fixed-width pyarrow arrays to the device as a list of columns.
+
+    The Arrow buffers are copied as they are, without conversion, so that
+    the arrays of a memory-mapped file are read straight from the mapping
+    into the staging buffer.
+
+    Parameters
+    ----------
+    arrays : list of pyarrow.Array or pyarrow.ChunkedArray
+        Arrays for which ``is_batchable_arrow`` is True.
+    """
+    arrays = [_single_chunk(arr) for arr in arrays]
+    parts = []
+    for arr in arrays:
+        dtype = _arrow_dtype(arr.type)
+        mask, data = arr.buffers()
+        nbytes = len(arr) * dtype.itemsize
+        parts.append((_host_bytes(data, nbytes), nbytes))
+        if arr.null_count > 0:
+            mask = _host_bytes(mask, -(-len(arr) // 8))
+            parts.append((mask, bitmask_allocation_size_bytes(len(arr))))
+
+    buffers = iter(_to_device(parts))
+    out = []
+    for arr in arrays:
+        data = next(buffers)
+        mask = next(buffers) if arr.null_count > 0 else None
+        out.append(build_column(data, _arrow_dtype(arr.type), mask=mask))
+    return out
+
+
+def _is_batchable_column(col):
+    return type(col) in (NumericalColumn, DatetimeColumn) and not col.offset
+
+
+def columns_to_pandas(columns, index=None):
+    """
+    Convert a list of columns into a list of pandas Series.
+
+    The fixed-width columns are gathered into one device buffer, which is
+    copied to the host by a single transfer and sliced into the values of
+    the Series. Nulls are filled as ``Column.to_pandas`` fills them.
+    Other columns are converted one by one.
+
+    Parameters
+    ----------
+    columns : list of Column
+    index : pandas.Index, optional
+        The index of every Series.
+    """
+    out = [None] * len(columns)
+    batchable = []
+    for i, col in enumerate(columns):
+        # pandas has no nullable bool dtype to transfer into
+        if _is_batchable_column(col) and not (
+            col.dtype.kind == "b" and col.has_nulls
+        ):
+            if col.has_nulls:
+                col = col.fillna(col.default_na_value())
+            batchable.append((i, col))
+        else:
+            out[i] = col.to_pandas(index=index)
+
+    values = _to_host(
+        [(col.data, len(col) * col.dtype.itemsize) for _, col in batchable]
+    )
+    for (i, col), data in zip(batchable, values):
+        out[i] = pd.Series(data.view(col.dtype), index=index)
+    return out
+
+
+def columns_to_arrow(columns):
+    """
+    Convert a list of columns into a list of pyarrow arrays.
+
+    The data and masks of the fixed-width columns are copied to the host
+    by a single transfer and wrapped by the arrays without copying. Other
+    columns are converted one by one.
+
+    Parameters
+    ----------
+    columns : list of Column
+    """
+    out = [None] * len(columns)
+    batchable, parts = [], []
+    for i, col in enumerate(columns):
+        if not _is_batchable_column(col):
+            out[i] = col.to_arrow()
+            continue
+        batchable.append((i, col))
+        parts.append((col.data, len(col) * col.dtype.itemsize))
+        if col.nullable:
+            parts.append((col.mask, -(-len(col) // 8)))
+
+    buffers = iter(_to_host(parts))
+    for i, col in batchable:
+        data = pa.py_buffer(next(buffers))
+        mask = pa.py_buffer(next(buffers)) if col.nullable else None
+        arr = pa.Array.from_buffers(
+            type=np_to_pa_dtype(col.dtype),
+            length=len(col),
+            buffers=[mask, data],
+            null_count=col.null_count,
+        )
+        if col.dtype == np.bool_:
+            arr = arr.cast(pa.bool_())
+        out[i] = arr
+    return out
@@ -800,6 +800,29 @@ class ColumnBase(Column):
         """
         return self.as_frame().drop_duplicates(keep="first")._as_column()
 
+    def unique_k(self, k):
+        """
+        Get unique values in the data, provided there are at most ``k``
+
+        The column is deduplicated in chunks of doubling size, merged with
+        the unique values of the previous chunks, so that the search stops
+        as soon as more than ``k`` unique values are found instead of
+        processing the whole column.
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        found = self[0:0].unique()
+        start = 0
+        chunksize = max(2 * k, 1024)
+        while start < len(self):
+            stop = min(start + chunksize, len(self))
+            found = ColumnBase._concat([found, self[start:stop]]).unique()
+            if len(found) > k:
+                raise ValueError("too many unique value (hint: increase k)")
+            start = stop
+            chunksize *= 2
+        return found
+
     def serialize(self):
         header = {}
         frames = []
@@ -1320,6 +1343,10 @@ def as_column(arbitrary, nan_as_null=True, dtype=None, length=None):
 def column_applymap(udf, column, out_dtype):
     """Apply a elemenwise function to transform the values in the Column.
 
+    The kernel is cached in ``cudautils.kernel_cache``, keyed on the
+    function, the input and output dtypes and the nullability of the
+    column, so applying the same function again does not recompile it.
+
     Parameters
     ----------
     udf : function
@@ -1333,10 +1360,30 @@ def column_applymap(udf, column, out_dtype):
     -------
     result : rmm.device_array
     """
-    core = njit(udf)
     results = rmm.device_array(shape=len(column), dtype=out_dtype)
     values = column.data_array_view
+    kernel = cudautils.kernel_cache.get(
+        cudautils.make_cache_key(
+            udf,
+            "applymap",
+            column.dtype,
+            np.dtype(out_dtype),
+            column.nullable,
+        ),
+        lambda: _make_applymap_kernel(udf, column.nullable),
+    )
     if column.nullable:
+        masks = column.mask_array_view
+        kernel.forall(len(column))(values, masks, results)
+    else:
+        kernel.forall(len(column))(values, results)
+
+    return as_column(results)
+
+
+def _make_applymap_kernel(udf, masked):
+    core = njit(udf)
+    if masked:
         # For masked columns
         @cuda.jit
         def kernel_masked(values, masks, results):
@@ -1348,8 +1395,7 @@ def column_applymap(udf, column, out_dtype):
                     # call udf
                     results[i] = core(values[i])
 
-        masks = column.mask_array_view
-        kernel_masked.forall(len(column))(values, masks, results)
+        return kernel_masked
     else:
         # For non-masked columns
         @cuda.jit
@@ -1360,9 +1406,7 @@ def column_applymap(udf, column, out_dtype):
                 # call udf
                 results[i] = core(values[i])
 
-        kernel_non_masked.forall(len(column))(values, results)
-
-    return as_column(results)
+        return kernel_non_masked
 
 
 def _data_from_cuda_array_interface_desc(obj):
@@ -26,7 +26,7 @@ import cudf._lib as libcudf
 import cudf._libxx as libcudfxx
 from cudf._libxx.null_mask import MaskState, create_null_mask
 from cudf._libxx.transform import bools_to_mask
-from cudf.core import column
+from cudf.core import _transfer, column
 from cudf.core._sort import get_sorted_inds
 from cudf.core.column import (
     CategoricalColumn,
@@ -2248,8 +2248,8 @@ class DataFrame(Frame):
             If on is None and not merging on indexes then
             this defaults to the intersection of the columns
             in both DataFrames.
-        how : {‘left’, ‘outer’, ‘inner’}, default ‘inner’
-            Type of merge to be performed.
+        how : {‘left’, ‘outer’, ‘inner’, ‘leftsemi’, ‘leftanti’}
+            Type of merge to be performed, default ‘inner’.
 
             - left : use only keys from left frame, similar to a SQL left
               outer join; preserve key order.
@@ -2258,6 +2258,12 @@ class DataFrame(Frame):
               full outer join; sort keys lexicographically.
             - inner: use intersection of keys from both frames, similar to
               a SQL inner join; preserve the order of the left keys.
+            - leftsemi: keep the rows of the left frame whose keys are
+              found in the right frame; only the left columns are returned
+              and the left row order is preserved.
+            - leftanti: keep the rows of the left frame whose keys are not
+              found in the right frame; only the left columns are returned
+              and the left row order is preserved.
         left_on : label or list, or array-like
             Column or index level names to join on in the left DataFrame.
             Can also be an array or list of arrays of the length of the
@@ -2345,6 +2351,40 @@ class DataFrame(Frame):
 
         return gdf_result
 
+    def prepare_join(self, on):
+        """Prepare this DataFrame as the build side of repeated joins.
+
+        The key columns are sorted once and cached, so that joining many
+        frames against the same right-hand table does not rebuild the join
+        structure for it on every call.
+
+        Parameters
+        ----------
+        on : label or list of labels
+            Column(s) to join on.
+
+        Returns
+        -------
+        prepared : PreparedJoin
+            Object whose ``join(left, how=...)`` method joins ``left``
+            against this DataFrame. ``how`` may be one of 'inner', 'left',
+            'leftsemi' or 'leftanti'.
+
+        Examples
+        --------
+        >>> import cudf
+        >>> dim = cudf.DataFrame({'key': [1, 2, 4], 'vals_b': [10, 11, 12]})
+        >>> prepared = dim.prepare_join(on='key')
+        >>> batch = cudf.DataFrame({'key': [4, 1], 'vals_a': [1.0, 2.0]})
+        >>> prepared.join(batch, how='inner')
+           key  vals_a  vals_b
+        0    4     1.0      12
+        1    1     2.0      10
+        """
+        from cudf.core.join import PreparedJoin
+
+        return PreparedJoin(self, on)
+
     def join(
         self,
         other,
@@ -2610,10 +2650,15 @@ class DataFrame(Frame):
 
     def query(self, expr, local_dict={}):
         """
-        Query with a boolean expression using Numba to compile a GPU kernel.
+        Query with a boolean expression.
 
         See pandas.DataFrame.query.
 
+        Arithmetic, comparisons, ``in``/``not in`` a list and the boolean
+        ``and``, ``or`` and ``not`` operators are evaluated with column
+        operations, which also support string and categorical columns.
+        Other expressions are compiled into a GPU kernel with Numba.
+
         Parameters
         ----------
 
@@ -2700,6 +2745,67 @@ class DataFrame(Frame):
         libcudf.nvtx.nvtx_range_pop()
         return result
 
+    def eval(self, expr, inplace=False, local_dict={}):
+        """
+        Evaluate expressions of the columns of the DataFrame.
+
+        See pandas.DataFrame.eval.
+
+        Parameters
+        ----------
+        expr : str
+            Either a single expression, or one assignment of a column per
+            line, as in ``"z = x * y + w"``. Names in the expressions refer
+            to columns, including those assigned by a previous line, and
+            names starting with ``@`` refer to Python variables.
+
+            Each expression is computed by a single generated GPU kernel,
+            without materializing a column per operator, and repeated
+            subexpressions are computed once. An output value is null if
+            any of the input values are null.
+        inplace : bool, default False
+            Whether to assign the new columns to this DataFrame rather than
+            to a copy.
+        local_dict : dict
+            Containing the local variable to be used in the expressions.
+
+        Returns
+        -------
+        Series for a single expression; otherwise a DataFrame with the
+        assigned columns, or None if ``inplace`` is True.
+
+        Examples
+        --------
+        >>> import cudf
+        >>> df = cudf.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+        >>> df.eval('z = x * y + 1\\nq = (x * y) / 2')
+           x  y   z    q
+        0  1  4   5  2.0
+        1  2  5  11  5.0
+        2  3  6  19  9.0
+        """
+        if not isinstance(local_dict, dict):
+            raise TypeError(
+                "local_dict type: expected dict but found {!r}".format(
+                    type(local_dict)
+                )
+            )
+
+        callframe = inspect.currentframe().f_back
+        callenv = {
+            "locals": callframe.f_locals,
+            "globals": callframe.f_globals,
+            "local_dict": local_dict,
+        }
+        results = queryutils.eval_execute(self, expr, callenv)
+
+        if results[0][0] is None:
+            return results[0][1]
+        out = self if inplace else self.copy(deep=False)
+        for name, series in results:
+            out[name] = series
+        return None if inplace else out
+
     @applyutils.doc_apply()
     def apply_rows(
         self,
@@ -2709,6 +2815,7 @@ class DataFrame(Frame):
         kwargs,
         pessimistic_nulls=True,
         cache_key=None,
+        null_aware=False,
     ):
         """
         Apply a row-wise user defined function.
@@ -2758,6 +2865,22 @@ class DataFrame(Frame):
         0    0    0    0  0.0  0.0
         1    1    1    1  1.0 -2.0
         2    2    2    2  2.0 -4.0
+
+        With ``null_aware=True``, the function receives the validity of the
+        inputs and sets the validity of the outputs, e.g. to treat null
+        inputs as zero:
+
+        >>> df = cudf.DataFrame({'x': [1, None, 3]})
+        >>> def kernel(x, x_valid, out, out_valid):
+        ...     for i, (v, ok) in enumerate(zip(x, x_valid)):
+        ...         out[i] = v if ok else 0
+        ...         out_valid[i] = True
+        >>> df.apply_rows(kernel, incols=['x'], outcols=dict(out=np.int64),
+        ...               kwargs={}, null_aware=True)
+              x  out
+        0     1    1
+        1  null    0
+        2     3    3
         """
         return applyutils.apply_rows(
             self,
@@ -2767,6 +2890,7 @@ class DataFrame(Frame):
             kwargs,
             pessimistic_nulls,
             cache_key=cache_key,
+            null_aware=null_aware,
         )
 
     @applyutils.doc_applychunks()
@@ -2780,6 +2904,7 @@ class DataFrame(Frame):
         chunks=None,
         blkct=None,
         tpb=None,
+        null_aware=False,
     ):
         """
         Transform user-specified chunks using the user-provided function.
@@ -2832,6 +2957,7 @@ class DataFrame(Frame):
             pessimistic_nulls,
             chunks,
             tpb=tpb,
+            null_aware=null_aware,
         )
 
     def hash_columns(self, columns=None):
@@ -3117,8 +3243,11 @@ class DataFrame(Frame):
         else:
             out_columns = self.columns
 
-        for i, col_key in enumerate(self._data):
-            out_data[i] = self._data[col_key].to_pandas(index=out_index)
+        columns = _transfer.columns_to_pandas(
+            list(self._data.values()), index=out_index
+        )
+        for i, col in enumerate(columns):
+            out_data[i] = col
 
         if isinstance(self.columns, Index):
             out_columns = self.columns.to_pandas()
@@ -3153,24 +3282,40 @@ class DataFrame(Frame):
         if not isinstance(dataframe, pd.DataFrame):
             raise TypeError("not a pandas.DataFrame")
 
-        df = cls()
+        data = OrderedDict()
+        batched = OrderedDict()
         # Set columns
         for i, colk in enumerate(dataframe.columns):
             vals = dataframe[colk].values
             # necessary because multi-index can return multiple
             # columns for a single key
             if len(vals.shape) == 1:
-                df[i] = Series(vals, nan_as_null=nan_as_null)
+                data[i] = None
+                if _transfer.is_batchable_array(vals):
+                    batched[i] = vals
+                else:
+                    data[i] = column.as_column(vals, nan_as_null=nan_as_null)
             else:
                 vals = vals.T
                 if vals.shape[0] == 1:
-                    df[i] = Series(vals.flatten(), nan_as_null=nan_as_null)
+                    data[i] = column.as_column(
+                        vals.flatten(), nan_as_null=nan_as_null
+                    )
                 else:
                     if isinstance(colk, tuple):
                         colk = str(colk)
                     for idx in range(len(vals.shape)):
-                        df[i] = Series(vals[idx], nan_as_null=nan_as_null)
+                        data[i] = column.as_column(
+                            vals[idx], nan_as_null=nan_as_null
+                        )
+
+        # fixed-width columns are copied to the device together
+        columns = _transfer.arrays_to_device(
+            list(batched.values()), nan_as_null=nan_as_null
+        )
+        data.update(zip(batched.keys(), columns))
 
+        df = cls(ColumnAccessor(data))
         # Set columns
         df.columns = dataframe.columns
 
@@ -3206,9 +3351,9 @@ class DataFrame(Frame):
         index_columns = []
         index_descriptors = []
 
-        for name, col in self._data.items():
+        columns = _transfer.columns_to_arrow(list(self._data.values()))
+        for name, arrow_col in zip(self._data.keys(), columns):
             names.append(name)
-            arrow_col = col.to_arrow()
             arrays.append(arrow_col)
             types.append(arrow_col.type)
 
@@ -3287,7 +3432,8 @@ class DataFrame(Frame):
                 if "field_name" in col
             }
 
-        df = cls()
+        data = OrderedDict()
+        batched = OrderedDict()
         for name, col in zip(table.schema.names, table.columns):
             if dtypes:
                 dtype = dtypes[name]
@@ -3298,7 +3444,16 @@ class DataFrame(Frame):
             else:
                 dtype = None
 
-            df[name] = column.as_column(col, dtype=dtype)
+            data[name] = None
+            if _transfer.is_batchable_arrow(col, dtype):
+                batched[name] = col
+            else:
+                data[name] = column.as_column(col, dtype=dtype)
+
+        # fixed-width columns are copied to the device together
+        columns = _transfer.arrow_to_device(list(batched.values()))
+        data.update(zip(batched.keys(), columns))
+        df = cls(ColumnAccessor(data))
         if index_col:
             if isinstance(index_col[0], dict):
                 assert index_col[0]["kind"] == "range"
@@ -3855,6 +4010,13 @@ class DataFrame(Frame):
 
         feather.to_feather(self, path, *args, **kwargs)
 
+    @ioutils.doc_to_arrow_stream()
+    def to_arrow_stream(self, sink, *args, **kwargs):
+        """{docstring}"""
+        import cudf.io.arrow as arrow
+
+        arrow.to_arrow_stream(self, sink, *args, **kwargs)
+
     @ioutils.doc_to_json()
     def to_json(self, path_or_buf=None, *args, **kwargs):
         """{docstring}"""
@@ -3887,6 +4049,8 @@ class DataFrame(Frame):
         index=True,
         line_terminator="\n",
         chunksize=None,
+        compression="infer",
+        storage_options=None,
     ):
         """{docstring}"""
         import cudf.io.csv as csv
@@ -3901,6 +4065,8 @@ class DataFrame(Frame):
             index,
             line_terminator,
             chunksize,
+            compression,
+            storage_options,
         )
 
     @ioutils.doc_to_orc()
@@ -4111,6 +4277,59 @@ def from_pandas(obj):
         )
 
 
+def apply_rows(
+    frames,
+    func,
+    incols,
+    outcols,
+    kwargs,
+    pessimistic_nulls=True,
+    cache_key=None,
+    null_aware=False,
+):
+    """
+    Apply a row-wise user defined function to several DataFrames at once.
+
+    The function is compiled once and run by a single kernel launch over
+    the input columns of all the frames, which is much cheaper than one
+    ``DataFrame.apply_rows`` per frame when there are many small frames.
+
+    Parameters
+    ----------
+    frames : list of DataFrame
+        The frames to transform. Their input columns must have the same
+        dtypes.
+
+    See ``DataFrame.apply_rows`` for the other parameters.
+
+    Returns
+    -------
+    list of DataFrame
+        A copy of each frame, with the output columns.
+
+    Examples
+    --------
+    >>> import cudf
+    >>> def kernel(x, out):
+    ...     for i, v in enumerate(x):
+    ...         out[i] = v * 2
+    >>> frames = [cudf.DataFrame({'x': [1, 2]}), cudf.DataFrame({'x': [3]})]
+    >>> [df['out'].to_array() for df in cudf.apply_rows(
+    ...     frames, kernel, ['x'], {'out': 'int64'}, {})]
+    [array([2, 4]), array([6])]
+    """
+    return applyutils.apply_rows_batched(
+        frames,
+        func,
+        incols,
+        outcols,
+        kwargs,
+        pessimistic_nulls,
+        cache_key=cache_key,
+        null_aware=null_aware,
+    )
+
+
 def merge(left, right, *args, **kwargs):
     return left.merge(right, *args, **kwargs)
 
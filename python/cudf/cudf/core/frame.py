@@ -482,6 +482,11 @@ class Frame(libcudfxx.table.Table):
                 "{!r} merge not supported yet".format(how)
             )
 
+        if how in ("leftanti", "leftsemi") and (left_index or right_index):
+            raise NotImplementedError(
+                "{!r} merge on the index not supported yet".format(how)
+            )
+
         # Passing 'on' with 'left_on' or 'right_on' is potentially ambiguous
         if on:
             if left_on or right_on:
@@ -581,6 +586,9 @@ class Frame(libcudfxx.table.Table):
         if not (left_on or right_on) and not (left_index and right_index):
             left_on = right_on = list(same_named_columns)
 
+        if how in ("leftsemi", "leftanti"):
+            return self._semi_anti_merge(rhs, left_on, right_on, how)
+
         no_suffix_cols = []
         for name in same_named_columns:
             if left_on is not None and right_on is not None:
@@ -619,16 +627,27 @@ class Frame(libcudfxx.table.Table):
             lhs, rhs, left_on, right_on, left_index, right_index, how
         )
 
-        gdf_result = libcudfxx.join.join(
-            lhs,
-            rhs,
-            left_on,
-            right_on,
-            how,
-            method,
-            left_index=lhs_full_view,
-            right_index=rhs_full_view,
-        )
+        if self._use_sort_merge(
+            lhs, rhs, left_on, right_on, how, method, left_index, right_index
+        ):
+            from cudf.core.join import PreparedJoin
+
+            # Columns were already renamed above, so no suffixes are needed
+            joined = PreparedJoin(rhs, right_on).join(
+                lhs, how=how, left_on=left_on, suffixes=("", "")
+            )
+            gdf_result = libcudfxx.table.Table(joined._data)
+        else:
+            gdf_result = libcudfxx.join.join(
+                lhs,
+                rhs,
+                left_on,
+                right_on,
+                how,
+                method,
+                left_index=lhs_full_view,
+                right_index=rhs_full_view,
+            )
 
         gdf_data = list(gdf_result._data.items())
 
@@ -701,6 +720,90 @@ class Frame(libcudfxx.table.Table):
 
         return self.__class__._from_table(gdf_result)
 
+    def _semi_anti_merge(self, rhs, left_on, right_on, how):
+        """
+        Compute a left semi (``how="leftsemi"``) or anti (``"leftanti"``)
+        join: the rows of ``self`` with (or without) a match in ``rhs``.
+
+        Only the key columns of both operands take part in the join, and
+        the result is a row selection of ``self``: no column of ``rhs`` is
+        gathered and the left rows keep their order and dtypes.
+        """
+        from cudf.core.join import _key_column
+
+        lkeys = OrderedDict()
+        rkeys = OrderedDict()
+        for i, (lname, rname) in enumerate(zip(left_on, right_on)):
+            lcol = _key_column(self._data[lname])
+            rcol = _key_column(rhs._data[rname])
+            if not pd.api.types.is_dtype_equal(lcol.dtype, rcol.dtype):
+                if (
+                    np.issubdtype(lcol.dtype, np.number)
+                    and np.issubdtype(rcol.dtype, np.number)
+                ) or (
+                    is_datetime_dtype(lcol.dtype)
+                    and is_datetime_dtype(rcol.dtype)
+                ):
+                    to_dtype = np.find_common_type(
+                        [], [lcol.dtype, rcol.dtype]
+                    )
+                    lcol = lcol.astype(to_dtype)
+                    rcol = rcol.astype(to_dtype)
+                else:
+                    raise TypeError(
+                        "Cannot join on keys {!r} and {!r} of types {} and "
+                        "{}".format(lname, rname, lcol.dtype, rcol.dtype)
+                    )
+            lkeys[i] = lcol
+            rkeys[i] = rcol
+
+        # Join the left row numbers along with the keys, so that the result
+        # selects rows of the (untouched) left operand
+        key_names = list(lkeys.keys())
+        row_id = len(key_names)
+        lkeys[row_id] = as_column(cupy.arange(len(self), dtype=np.int32))
+        joined = libcudfxx.join.join(
+            libcudfxx.table.Table(lkeys),
+            libcudfxx.table.Table(rkeys),
+            key_names,
+            key_names,
+            how,
+            "hash",
+        )
+
+        selected = cupy.zeros(len(self), dtype=np.bool_)
+        selected[cupy.asarray(joined._data[row_id].data_array_view)] = True
+        result = self._apply_boolean_mask(selected)
+        return self.__class__._from_table(libcudfxx.table.Table(result._data))
+
+    @staticmethod
+    def _use_sort_merge(
+        lhs, rhs, left_on, right_on, how, method, left_index, right_index
+    ):
+        """
+        Whether to compute a merge with a sort-merge join instead of a hash
+        join: either requested with ``method="sort"`` or both operands are
+        already sorted on their join keys, in which case the result keeps
+        the key order of the inputs.
+        """
+        if left_index or right_index or how not in ("inner", "left"):
+            return False
+        if not (left_on and right_on):
+            return False
+        if method == "sort":
+            return True
+
+        def keys_sorted(frame, on):
+            keys = libcudfxx.table.Table(
+                OrderedDict((name, frame._data[name]) for name in on)
+            )
+            # the sort-merge join expects the nulls last
+            return libcudfxx.sort.is_sorted(
+                keys, null_position=[False] * len(on)
+            )
+
+        return keys_sorted(lhs, left_on) and keys_sorted(rhs, right_on)
+
     def _typecast_before_merge(
         self, lhs, rhs, left_on, right_on, left_index, right_index, how
     ):
@@ -810,12 +913,12 @@ class Frame(libcudfxx.table.Table):
             None or list-like of boolean values indicating expected sort order
             of each column. If list-like, size of list-like must be
             len(columns). If None, all columns expected sort order is set to
-            ascending. False (0) - ascending, True (1) - descending.
+            ascending. False (0) - descending, True (1) - ascending.
         null_position : None or list-like of booleans
             None or list-like of boolean values indicating desired order of
             nulls compared to other elements. If list-like, size of list-like
-            must be len(columns). If None, null order is set to before. False
-            (0) - before, True (1) - after.
+            must be len(columns). If None, null order is set to after. False
+            (0) - after, True (1) - before.
 
         Returns
         -------
@@ -6,7 +6,9 @@ import pickle
 
 import cudf
 import cudf._lib as libcudf
+import cudf._libxx as libcudfxx
 from cudf import MultiIndex
+from cudf.core._sort import get_sorted_inds
 from cudf.core.column import deserialize_columns, serialize_columns
 from cudf.utils.dtypes import is_scalar
 
@@ -42,6 +44,30 @@ class _Groupby(object):
     def count(self):
         return self._apply_aggregation("count")
 
+    def var(self, ddof=1):
+        return self._apply_aggregation("var", ddof=ddof)
+
+    def std(self, ddof=1):
+        return self._apply_aggregation("std", ddof=ddof)
+
+    def median(self):
+        return self._apply_aggregation("median")
+
+    def nunique(self):
+        return self._apply_aggregation("nunique")
+
+    def first(self):
+        return self._apply_aggregation("first")
+
+    def last(self):
+        return self._apply_aggregation("last")
+
+    def idxmin(self):
+        return self._apply_aggregation("idxmin")
+
+    def idxmax(self):
+        return self._apply_aggregation("idxmax")
+
     def agg(self, func):
         return self._apply_aggregation(func)
 
@@ -50,7 +76,28 @@ class _Groupby(object):
 
         nrows = len(self._groupby.obj)
         data = cudf.Series(column_empty(nrows, "int8", masked=False))
-        return data.groupby(self._groupby.key_columns).count()
+        return data.groupby(self._groupby.key_columns).agg("size")
+
+    def rolling(self, window, min_periods=None, center=False):
+        """
+        Returns a `RollingGroupby` object that computes rolling window
+        calculations within each group.
+
+        Parameters
+        ----------
+        window, min_periods, center
+            As for :class:`cudf.core.window.Rolling`. Windows never span
+            more than one group.
+
+        Returns
+        -------
+        RollingGroupby
+        """
+        from cudf.core.window import RollingGroupby
+
+        return RollingGroupby(
+            self, window, min_periods=min_periods, center=center
+        )
 
     def serialize(self):
         header, frames = self._groupby.serialize()
@@ -91,15 +138,12 @@ class SeriesGroupBy(_Groupby):
             obj=self._sr, by=by, level=level, sort=sort, dropna=dropna
         )
 
-    def _apply_aggregation(self, agg):
-        return self._groupby.compute_result(agg)
+    def _apply_aggregation(self, agg, **kwargs):
+        return self._groupby.compute_result(agg, **kwargs)
 
     def quantile(self, q=0.5, interpolation="linear"):
         raise NotImplementedError
 
-    def std(self, ddof=1):
-        raise NotImplementedError
-
 
 class DataFrameGroupBy(_Groupby):
     def __init__(
@@ -125,11 +169,11 @@ class DataFrameGroupBy(_Groupby):
             dropna=dropna,
         )
 
-    def _apply_aggregation(self, agg):
+    def _apply_aggregation(self, agg, **kwargs):
         """
         Applies the aggregation function(s) ``agg`` on all columns
         """
-        result = self._groupby.compute_result(agg)
+        result = self._groupby.compute_result(agg, **kwargs)
         libcudf.nvtx.nvtx_range_pop()
         return result
 
@@ -192,31 +236,32 @@ class DataFrameGroupBy(_Groupby):
             out_key_columns, out_value_columns
         )
 
-    def std(self, ddof=1):
-        # Get Key_cols from _GroupbyHelper. It's generated at init.
-        key_cols = [
-            sr._column
-            if isinstance(sr, cudf.Series)
-            else cudf.Series(sr)._column
-            for sr in self._groupby.key_columns
-        ]
-        # Do the things that'll make it generate the value columns
-        self._groupby.normalize_agg("std")
-        self._groupby.normalize_values()
-        # Get the value_columns
-        val_cols = self._groupby.value_columns
 
-        out_key_columns, out_value_columns = libcudf.reduce.group_std(
-            key_cols, val_cols, ddof
-        )
-        return self._groupby.construct_result(
-            out_key_columns, out_value_columns
-        )
+class _GroupbyHelper(object):
 
+    NAMED_AGGS = (
+        "sum",
+        "mean",
+        "min",
+        "max",
+        "count",
+        "size",
+        "quantile",
+        "std",
+        "var",
+        "median",
+        "nunique",
+        "first",
+        "last",
+        "idxmin",
+        "idxmax",
+    )
 
-class _GroupbyHelper(object):
+    # aggregations computed by libcudf under a different name
+    ENGINE_AGGS = {"idxmin": "argmin", "idxmax": "argmax"}
 
-    NAMED_AGGS = ("sum", "mean", "min", "max", "count", "quantile", "std")
+    # aggregations that are undefined for string and categorical columns
+    NUMERIC_AGGS = ("sum", "mean", "std", "var", "median")
 
     def __init__(
         self, obj, by=None, level=None, as_index=True, sort=None, dropna=True
@@ -349,13 +394,12 @@ class _GroupbyHelper(object):
             key_column = by
         return key_name, key_column
 
-    def compute_result(self, agg):
+    def compute_result(self, agg, ddof=1):
         """
         Computes the groupby result
         """
         self.normalize_agg(agg)
         self.normalize_values()
-        aggs_as_list = self.get_aggs_as_list()
 
         key_columns = [
             sr._column
@@ -364,16 +408,46 @@ class _GroupbyHelper(object):
             for sr in self.key_columns
         ]
 
+        engine_aggs = [
+            [self.ENGINE_AGGS.get(agg_name, agg_name) for agg_name in agg_list]
+            for agg_list in self.value_aggs
+        ]
+
         out_key_columns, out_value_columns = _groupby_engine(
             key_columns,
             self.value_columns,
-            aggs_as_list,
+            engine_aggs,
             self.sort,
             self.dropna,
+            ddof=ddof,
         )
 
+        out_value_columns = [
+            self.labels_from_positions(col)
+            if agg_name in ("idxmin", "idxmax")
+            else col
+            for agg_name, col in zip(
+                self.get_aggs_as_list(), out_value_columns
+            )
+        ]
+
         return self.construct_result(out_key_columns, out_value_columns)
 
+    def labels_from_positions(self, positions):
+        """
+        Convert a column of row positions in ``self.obj`` (the result of
+        an argmin/argmax aggregation) into the corresponding index labels
+        """
+        index = self.obj.index
+        if isinstance(index, MultiIndex):
+            raise NotImplementedError(
+                "idxmin and idxmax are not supported with a MultiIndex"
+            )
+        if positions.has_nulls:
+            labels = index._values.take(positions.fillna(0))
+            return labels.set_mask(positions.mask)
+        return index._values.take(positions)
+
     def normalize_agg(self, agg):
         """
         Normalize agg to a dictionary with column names
@@ -412,7 +486,7 @@ class _GroupbyHelper(object):
                         ),
                     ):
                         for agg_name in agg:
-                            if agg_name in ("mean", "sum"):
+                            if agg_name in self.NUMERIC_AGGS:
                                 drop = True
                     if not drop:
                         value_col_names.append(col_name)
@@ -430,30 +504,30 @@ class _GroupbyHelper(object):
 
     def normalize_values(self):
         """
-        Sets self.value_names and self.value_columns
+        Sets self.value_names, self.value_columns and self.value_aggs.
+
+        Each value column appears once in self.value_columns, with the
+        list of aggregations to compute on it at the same position in
+        self.value_aggs. self.value_names holds one name per aggregation.
         """
         if isinstance(self.obj, cudf.Series):
             # SeriesGroupBy
-            col = self.obj._column
             agg_list = self.aggs[None]
+            self.value_columns = [self.obj._column]
+            self.value_aggs = [agg_list]
             if len(agg_list) == 1:
-                self.value_columns = [col]
                 self.value_names = [self.obj.name]
             else:
-                self.value_columns = [col] * len(agg_list)
-                self.value_names = agg_list
+                self.value_names = list(agg_list)
         else:
             # DataFrameGroupBy
             self.value_columns = []
+            self.value_aggs = []
             self.value_names = []
             for col_name, agg_list in self.aggs.items():
-                col = self.obj[col_name]._column
-                if len(agg_list) == 1:
-                    self.value_columns.append(col)
-                    self.value_names.append(col_name)
-                else:
-                    self.value_columns.extend([col] * len(agg_list))
-                    self.value_names.extend([col_name] * len(agg_list))
+                self.value_columns.append(self.obj[col_name]._column)
+                self.value_aggs.append(agg_list)
+                self.value_names.extend([col_name] * len(agg_list))
 
     def construct_result(self, out_key_columns, out_value_columns):
         if not self.as_index:
@@ -547,64 +621,55 @@ class _GroupbyHelper(object):
         return aggs_as_list
 
 
-def _groupby_engine(key_columns, value_columns, aggs, sort, dropna):
+def _groupby_engine(key_columns, value_columns, aggs, sort, dropna, ddof=1):
     """
     Parameters
     ----------
     key_columns : list of Columns
     value_columns : list of Columns
-    aggs : list of str
+        Each column is aggregated in a single pass, however many
+        aggregations are requested on it.
+    aggs : list of lists of str
+        The aggregations to compute on the column at the same position
+        in ``value_columns``
     sort : bool
     dropna : bool
+    ddof : int
+        Delta degrees of freedom of the ``var`` and ``std`` aggregations
 
     Returns
     -------
     out_key_columns : list of Columns
     out_value_columns : list of Columns
+        One column per aggregation, ordered as the flattened ``aggs``
     """
-    out_key_columns, out_value_columns = libcudf.groupby.groupby(
-        key_columns, value_columns, aggs, dropna=dropna
+    if len(value_columns) == 0:
+        return key_columns, []
+
+    out_key_columns, out_value_columns = libcudfxx.groupby.groupby(
+        dataframe_from_columns(key_columns),
+        value_columns,
+        aggs,
+        dropna=dropna,
+        ddof=ddof,
     )
+    out_value_columns = list(itertools.chain.from_iterable(out_value_columns))
 
     if sort:
-        key_names = ["key_" + str(i) for i in range(len(key_columns))]
-        value_names = ["value_" + str(i) for i in range(len(value_columns))]
-        value_names = _add_prefixes(value_names, aggs)
-
-        # concatenate
-        result = cudf.concat(
-            [
-                dataframe_from_columns(out_key_columns, columns=key_names),
-                dataframe_from_columns(out_value_columns, columns=value_names),
-            ],
-            axis=1,
-        )
-
-        # sort values
-        result = result.sort_values(key_names)
+        # order the groups by the keys alone, then gather the keys and the
+        # aggregated values with that permutation
+        order = get_sorted_inds(dataframe_from_columns(out_key_columns))
+        result = dataframe_from_columns(
+            out_key_columns + out_value_columns
+        )._gather(order)
 
-        # split
-        out_key_columns = columns_from_dataframe(result[key_names])
-        out_value_columns = columns_from_dataframe(result[value_names])
+        out_columns = columns_from_dataframe(result)
+        out_key_columns = out_columns[: len(out_key_columns)]
+        out_value_columns = out_columns[len(out_key_columns) :]
 
     return out_key_columns, out_value_columns
 
 
-def _add_prefixes(names, prefixes):
-    """
-    Return a copy of ``names`` prefixed with ``prefixes``
-    """
-    prefixed_names = names.copy()
-    if isinstance(prefixes, str):
-        prefix = prefixes
-        for i, col_name in enumerate(names):
-            prefixed_names[i] = f"{prefix}_{col_name}"
-    else:
-        for i, (prefix, col_name) in enumerate(zip(prefixes, names)):
-            prefixed_names[i] = f"{prefix}_{col_name}"
-    return prefixed_names
-
-
 def _align_by_and_df(obj, by, how="inner"):
     """
     Returns a pair of dataframes and a list may be containing
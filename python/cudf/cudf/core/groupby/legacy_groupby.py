@@ -4,12 +4,10 @@ from collections import OrderedDict, defaultdict, namedtuple
 from itertools import chain
 
 import numpy as np
-from numba import cuda
-
-import rmm
 
 import cudf
 import cudf._lib as libcudf
+from cudf.core import segmented
 from cudf.core.series import Series
 
 
@@ -35,46 +33,6 @@ result : DataFrame
         members[k] = fn
 
 
-@cuda.jit
-def group_mean(data, segments, output):
-    i = cuda.grid(1)
-    if i < segments.size:
-        s = segments[i]
-        e = segments[i + 1] if (i + 1) < segments.size else data.size
-        # mean calculation
-        carry = 0.0
-        n = e - s
-        for j in range(s, e):
-            carry += data[j]
-        output[i] = carry / n
-
-
-@cuda.jit
-def group_max(data, segments, output):
-    i = cuda.grid(1)
-    if i < segments.size:
-        s = segments[i]
-        e = segments[i + 1] if (i + 1) < segments.size else data.size
-
-        tmp = data[s]
-        for j in range(s + 1, e):
-            tmp = max(tmp, data[j])
-        output[i] = tmp
-
-
-@cuda.jit
-def group_min(data, segments, output):
-    i = cuda.grid(1)
-    if i < segments.size:
-        s = segments[i]
-        e = segments[i + 1] if (i + 1) < segments.size else data.size
-
-        tmp = data[s]
-        for j in range(s + 1, e):
-            tmp = min(tmp, data[j])
-        output[i] = tmp
-
-
 _dfsegs_pack = namedtuple("_dfsegs_pack", ["df", "segs"])
 
 
@@ -233,34 +191,13 @@ class Groupby(object):
         for k, infos in functors_mapping.items():
             values = defaultdict(lambda: np.zeros(size, dtype=np.float64))
             begin = segs
+            offsets = np.append(segs, len(grouped_df))
             sr = grouped_df[k].reset_index(drop=True)
             for newk, functor in infos.items():
-                if functor.__name__ == "mean":
-                    dev_begins = rmm.to_device(np.asarray(begin))
-                    dev_out = rmm.device_array(size, dtype=np.float64)
-                    if size > 0:
-                        group_mean.forall(size)(
-                            sr._column.data_array_view, dev_begins, dev_out
-                        )
-                    values[newk] = dev_out
-
-                elif functor.__name__ == "max":
-                    dev_begins = rmm.to_device(np.asarray(begin))
-                    dev_out = rmm.device_array(size, dtype=sr.dtype)
-                    if size > 0:
-                        group_max.forall(size)(
-                            sr._column.data_array_view, dev_begins, dev_out
-                        )
-                    values[newk] = dev_out
-
-                elif functor.__name__ == "min":
-                    dev_begins = rmm.to_device(np.asarray(begin))
-                    dev_out = rmm.device_array(size, dtype=sr.dtype)
-                    if size > 0:
-                        group_min.forall(size)(
-                            sr._column.data_array_view, dev_begins, dev_out
-                        )
-                    values[newk] = dev_out
+                if functor.__name__ in ("mean", "max", "min"):
+                    values[newk] = segmented.reduce(
+                        sr, offsets, functor.__name__
+                    )
                 else:
                     end = chain(segs[1:], [len(grouped_df)])
                     for i, (s, e) in enumerate(zip(begin, end)):
@@ -0,0 +1,377 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+from collections import OrderedDict
+
+import cupy
+import numpy as np
+import pandas as pd
+
+from cudf._libxx.transform import bools_to_mask
+from cudf.core._sort import get_sorted_inds
+from cudf.core.column import NumericalColumn, as_column, column_empty
+from cudf.core.column_accessor import ColumnAccessor
+from cudf.utils.dtypes import is_categorical_dtype, is_scalar
+
+
+def _key_column(col):
+    """
+    Return the column used for key comparisons: categorical keys are
+    compared by value, not by code.
+    """
+    if is_categorical_dtype(col):
+        return col.astype(col.categories.dtype)
+    return col
+
+
+def _columns_frame(items):
+    """
+    Build a DataFrame with a default index from ``(name, column)`` pairs.
+    """
+    from cudf.core.dataframe import DataFrame
+
+    return DataFrame(ColumnAccessor(OrderedDict(items)))
+
+
+def _as_key_frame(columns):
+    """
+    Build a DataFrame holding only the key columns, named by position so
+    that the left and right keys can be compared column-by-column.
+    """
+    return _columns_frame(
+        (i, _key_column(col)) for i, col in enumerate(columns)
+    )
+
+
+def _mask_unmatched(col, matched):
+    """
+    Null out the rows of ``col`` for which ``matched`` is False.
+    """
+    valid = matched
+    if col.nullable:
+        valid = valid & cupy.asarray(col.notnull().data_array_view)
+    return col.set_mask(bools_to_mask(as_column(valid)))
+
+
+def _expand_matches(lower, counts, keep_unmatched=False):
+    """
+    Turn per-row match ranges into a pair of gather maps.
+
+    Row ``i`` of the probe side matches the ``counts[i]`` build-side rows
+    starting at ``lower[i]``. Returns ``(left_map, right_map, matched)``
+    where ``matched`` is None unless ``keep_unmatched`` is True, in which
+    case unmatched probe rows are emitted once with ``matched`` False.
+    """
+    counts = counts.astype(np.int64)
+    out_counts = cupy.maximum(counts, 1) if keep_unmatched else counts
+    ends = cupy.cumsum(out_counts)
+    total = int(ends[-1]) if len(ends) else 0
+
+    positions = cupy.arange(total, dtype=np.int64)
+    left_map = cupy.searchsorted(ends, positions, side="right")
+    right_map = lower[left_map] + (positions - (ends - out_counts)[left_map])
+
+    matched = None
+    if keep_unmatched:
+        matched = counts[left_map] > 0
+        right_map = cupy.where(matched, right_map, 0)
+    return left_map, right_map, matched
+
+
+def _join_columns(
+    left, left_map, right, right_names, right_map, matched, suffixes
+):
+    """
+    Gather the output columns of a join: every column of ``left`` at
+    ``left_map`` (all rows in order if None) followed by the
+    ``right_names`` columns of ``right`` at ``right_map``. Right rows for
+    which ``matched`` is False are null.
+    """
+    overlap = set(left._data) & set(right_names)
+    lsuffix, rsuffix = suffixes
+    if overlap and not (lsuffix or rsuffix):
+        raise ValueError(
+            "there are overlapping columns but "
+            "lsuffix and rsuffix are not defined"
+        )
+
+    data = OrderedDict()
+    if left_map is None:
+        left_columns = left._data.items()
+        nrows = len(left)
+    else:
+        left_columns = (
+            _columns_frame(left._data.items())._gather(left_map)._data.items()
+        )
+        nrows = len(left_map)
+    for name, col in left_columns:
+        out_name = "%s%s" % (name, lsuffix) if name in overlap else name
+        data[out_name] = col
+
+    if len(right_names) == 0:
+        return data
+
+    if len(right) == 0:
+        right_columns = [
+            column_empty(nrows, right._data[name].dtype, masked=True)
+            for name in right_names
+        ]
+    else:
+        right_gathered = _columns_frame(
+            (name, right._data[name]) for name in right_names
+        )._gather(right_map)
+        right_columns = list(right_gathered._data.columns)
+        if matched is not None and not bool(matched.all()):
+            right_columns = [
+                _mask_unmatched(col, matched) for col in right_columns
+            ]
+    for name, col in zip(right_names, right_columns):
+        out_name = "%s%s" % (name, rsuffix) if name in overlap else name
+        data[out_name] = col
+    return data
+
+
+class PreparedJoin(object):
+    """
+    The build (right-hand) side of a join, prepared once so that it can be
+    probed by many left-hand frames.
+
+    The key columns of the build side are sorted once and cached together
+    with the sort permutation. Each call to :meth:`join` then locates the
+    matching build rows of every probe row with a binary search, instead
+    of rebuilding the join structure for the build side on every merge.
+
+    Parameters
+    ----------
+    frame : DataFrame
+        The build side of the join.
+    on : label or list of labels
+        Column(s) of ``frame`` to join on.
+
+    Notes
+    -----
+    The cached structure holds references to the columns of ``frame``;
+    modifying ``frame`` in place after preparing it is not supported.
+    Rows are returned in the order of the probe frame; for each probe row,
+    the matching build rows are returned in key order.
+
+    Examples
+    --------
+    >>> import cudf
+    >>> dim = cudf.DataFrame({'key': [1, 2, 4], 'name': ['a', 'b', 'd']})
+    >>> prepared = dim.prepare_join(on='key')
+    >>> batch = cudf.DataFrame({'key': [4, 1, 3], 'value': [10, 20, 30]})
+    >>> prepared.join(batch, how='left')
+       key  value  name
+    0    4     10     d
+    1    1     20     a
+    2    3     30  None
+    """
+
+    _supported_hows = ("inner", "left", "leftsemi", "leftanti")
+
+    def __init__(self, frame, on):
+        on = [on] if is_scalar(on) or isinstance(on, tuple) else list(on)
+        if len(on) == 0:
+            raise ValueError("At least one join key is required")
+        for key in on:
+            if key not in frame._data:
+                raise KeyError('Key "{}" not in build operand'.format(key))
+
+        self._frame = frame
+        self._on = on
+
+        keys = _as_key_frame(frame._data[key] for key in on)
+        # the keys are probed with their nulls last
+        if keys._is_sorted(null_position=[False] * len(on)):
+            self._order = None
+            self._keys = keys
+        else:
+            order = get_sorted_inds(keys)
+            self._order = cupy.asarray(order.data_array_view)
+            self._keys = keys.take(order)
+
+    @property
+    def on(self):
+        """The key columns of the build side"""
+        return list(self._on)
+
+    def __len__(self):
+        return len(self._frame)
+
+    def __sizeof__(self):
+        return self.memory_usage()
+
+    def memory_usage(self):
+        """
+        Return the number of device bytes held by the cached build-side
+        structure (sorted keys and sort permutation). The columns of the
+        prepared frame itself are not counted.
+        """
+        n = 0
+        for col in self._keys._data.columns:
+            n += col._memory_usage(deep=True)
+        if self._order is not None:
+            n += self._order.nbytes
+        return n
+
+    def _probe_frame(self, left, left_on):
+        """
+        Return the ``left_on`` keys of ``left`` as a key frame comparable
+        with the cached build keys.
+        """
+        columns = []
+        for lkey, rkey in zip(left_on, self._on):
+            lcol = _key_column(left._data[lkey])
+            rcol = self._keys._data[len(columns)]
+            if not pd.api.types.is_dtype_equal(lcol.dtype, rcol.dtype):
+                if not (
+                    isinstance(lcol, NumericalColumn)
+                    and isinstance(rcol, NumericalColumn)
+                    and lcol.can_cast_safely(rcol.dtype)
+                ):
+                    raise TypeError(
+                        "can't safely cast key {!r} from {} to {}".format(
+                            lkey, lcol.dtype, rcol.dtype
+                        )
+                    )
+                lcol = lcol.astype(rcol.dtype)
+            columns.append(lcol)
+        return _as_key_frame(columns)
+
+    def _probe(self, left, left_on):
+        """
+        Return ``(lower, counts)``: the position of the first matching row
+        in the sorted build keys and the number of matches, per left row.
+        """
+        probe_keys = self._probe_frame(left, left_on)
+        lower = self._keys.searchsorted(probe_keys, side="left")
+        upper = self._keys.searchsorted(probe_keys, side="right")
+        return lower, upper - lower
+
+    def _right_names(self, left_on):
+        """
+        The build-side columns in a join result. The key columns are taken
+        from the left; build keys with the same name as their left
+        counterpart are not repeated.
+        """
+        return [
+            name
+            for name in self._frame._data
+            if not (
+                name in self._on
+                and name in left_on
+                and left_on.index(name) == self._on.index(name)
+            )
+        ]
+
+    def _build_rows(self, right_map):
+        if self._order is not None:
+            return self._order[right_map]
+        return right_map
+
+    def _validate_probe(self, left, how, left_on):
+        """
+        Check the arguments of a probe and return ``left_on`` as a list.
+        """
+        if how not in self._supported_hows:
+            raise NotImplementedError(
+                "{!r} join not supported by a prepared join".format(how)
+            )
+        if left_on is None:
+            left_on = self._on
+        else:
+            left_on = (
+                [left_on]
+                if is_scalar(left_on) or isinstance(left_on, tuple)
+                else list(left_on)
+            )
+        if len(left_on) != len(self._on):
+            raise ValueError(
+                "Merge operands must have same number of join key columns"
+            )
+        for key in left_on:
+            if key not in left._data:
+                raise KeyError('Key "{}" not in left operand'.format(key))
+        return left_on
+
+    def join_size(self, left, how="inner", left_on=None):
+        """
+        Return the number of rows that joining ``left`` would produce,
+        without gathering any column.
+
+        This only probes the cached build keys, so it can be used to size
+        output buffers or to detect a blow-up before calling :meth:`join`.
+
+        Parameters
+        ----------
+        left : DataFrame
+            The probe side of the join.
+        how : {'inner', 'left', 'leftsemi', 'leftanti'}, default 'inner'
+            Type of join to size.
+        left_on : label or list of labels, optional
+            Column(s) of ``left`` to join on. Defaults to the keys the
+            build side was prepared on.
+
+        Returns
+        -------
+        int
+        """
+        left_on = self._validate_probe(left, how, left_on)
+        _, counts = self._probe(left, left_on)
+        if len(counts) == 0:
+            return 0
+        if how == "leftsemi":
+            return int(cupy.count_nonzero(counts))
+        if how == "leftanti":
+            return len(counts) - int(cupy.count_nonzero(counts))
+        if how == "left":
+            counts = cupy.maximum(counts, 1)
+        return int(counts.sum(dtype=np.int64))
+
+    def join(self, left, how="inner", left_on=None, suffixes=("_x", "_y")):
+        """
+        Join ``left`` against the prepared build side.
+
+        Parameters
+        ----------
+        left : DataFrame
+            The probe side of the join.
+        how : {'inner', 'left', 'leftsemi', 'leftanti'}, default 'inner'
+            Type of join to perform. ``leftsemi`` and ``leftanti`` return
+            only the columns of ``left``.
+        left_on : label or list of labels, optional
+            Column(s) of ``left`` to join on. Defaults to the keys the
+            build side was prepared on.
+        suffixes : Tuple[str, str], defaults to ('_x', '_y')
+            Suffixes applied to overlapping column names on the left and
+            right sides.
+
+        Returns
+        -------
+        joined : DataFrame
+        """
+        from cudf.core.dataframe import DataFrame
+
+        left_on = self._validate_probe(left, how, left_on)
+        lower, counts = self._probe(left, left_on)
+
+        if how in ("leftsemi", "leftanti"):
+            mask = counts > 0 if how == "leftsemi" else counts == 0
+            result = left._apply_boolean_mask(mask)
+            return DataFrame(result._data)
+
+        left_map, right_map, matched = _expand_matches(
+            lower, counts, keep_unmatched=(how == "left")
+        )
+        right_map = self._build_rows(right_map)
+
+        data = _join_columns(
+            left,
+            left_map,
+            self._frame,
+            self._right_names(left_on),
+            right_map,
+            matched,
+            suffixes,
+        )
+        return DataFrame(ColumnAccessor(data))
@@ -1,14 +1,16 @@
 # Copyright (c) 2018, NVIDIA CORPORATION.
 
+import cupy
 import numpy as np
 import pandas as pd
 
 import cudf
 from cudf.core import DataFrame, Index, RangeIndex, Series
 from cudf.core.column import build_categorical_column
+from cudf.core.column_accessor import ColumnAccessor
 from cudf.core.index import as_index
 from cudf.utils import cudautils
-from cudf.utils.dtypes import is_categorical_dtype, is_list_like
+from cudf.utils.dtypes import is_categorical_dtype, is_list_like, is_scalar
 
 _axis_map = {0: 0, 1: 1, "index": 0, "columns": 1}
 
@@ -436,3 +438,226 @@ def merge_sorted(
     )
     result._copy_categories(objs[0])
     return result
+
+
+def merge_asof(
+    left,
+    right,
+    on=None,
+    left_on=None,
+    right_on=None,
+    by=None,
+    left_by=None,
+    right_by=None,
+    suffixes=("_x", "_y"),
+    tolerance=None,
+    allow_exact_matches=True,
+    direction="backward",
+):
+    """Perform an asof merge: a left join matching each row of `left` with
+    the row of `right` whose key is nearest to it, rather than equal.
+
+    Every left row is matched with at most one right row. Each match is
+    found with a binary search over the right keys, so no hash table is
+    built and the rows of `left` are returned in their original order.
+
+    Parameters
+    ----------
+    left, right : DataFrame
+    on : label
+        Column name to join on. Must be found in both DataFrames, and must
+        be numeric or datetime to use ``direction='nearest'`` or
+        `tolerance`.
+    left_on, right_on : label
+        Column names to join on in the left and right DataFrames.
+    by : label or list of labels, optional
+        Match on these columns before performing the asof merge.
+    left_by, right_by : label or list of labels, optional
+        Column names to match on in the left and right DataFrames.
+    suffixes : Tuple[str, str], defaults to ('_x', '_y')
+        Suffixes applied to overlapping column names on the left and right
+        sides.
+    tolerance : scalar or timedelta, optional
+        Only match rows whose keys are at most this far apart.
+    allow_exact_matches : bool, default True
+        If False, only match keys that are strictly less than (or greater
+        than, for ``direction='forward'``) the left key.
+    direction : {'backward', 'forward', 'nearest'}, default 'backward'
+        Search for the last right row whose key is less than or equal to
+        the left key ('backward'), the first one whose key is greater than
+        or equal to it ('forward'), or the closest of both ('nearest').
+
+    Returns
+    -------
+    merged : DataFrame
+
+    Notes
+    -----
+    Unlike pandas, the inputs do not need to be sorted on the key. When
+    `right` is already sorted on its `by` and `on` keys, it is not sorted
+    again.
+
+    Examples
+    --------
+    >>> import cudf
+    >>> left = cudf.DataFrame({'t': [1, 5, 10], 'left_val': [1, 2, 3]})
+    >>> right = cudf.DataFrame({'t': [1, 2, 3, 6, 7],
+    ...                         'right_val': [1, 2, 3, 6, 7]})
+    >>> cudf.merge_asof(left, right, on='t')
+        t  left_val  right_val
+    0   1         1          1
+    1   5         2          3
+    2  10         3          7
+    """
+    from cudf.core.join import PreparedJoin, _columns_frame, _join_columns
+
+    if direction not in ("backward", "forward", "nearest"):
+        raise ValueError("direction invalid: {!r}".format(direction))
+
+    if on is not None:
+        if left_on is not None or right_on is not None:
+            raise ValueError(
+                'Can only pass argument "on" OR "left_on" '
+                'and "right_on", not a combination of both.'
+            )
+        left_on = right_on = on
+    if left_on is None or right_on is None:
+        raise ValueError('Must pass "on", or "left_on" and "right_on"')
+    if is_list_like(left_on) or is_list_like(right_on):
+        raise ValueError("can only asof on a single key")
+
+    if by is not None:
+        if left_by is not None or right_by is not None:
+            raise ValueError('Can only pass "by" OR "left_by" and "right_by"')
+        left_by = right_by = by
+    left_by = _as_key_list(left_by)
+    right_by = _as_key_list(right_by)
+    if len(left_by) != len(right_by):
+        raise ValueError("left_by and right_by must be same length")
+
+    for frame, key, side in (
+        (left, left_on, "left"),
+        (right, right_on, "right"),
+    ):
+        if key not in frame._data:
+            raise KeyError('Key "{}" not in {} operand'.format(key, side))
+        if frame._data[key].has_nulls:
+            raise ValueError(
+                "Merge keys contain null values on {} side".format(side)
+            )
+
+    prepared = PreparedJoin(right, right_by + [right_on])
+    probe = prepared._probe_frame(left, left_by + [left_on])
+    keys = prepared._keys
+    nrows = len(keys)
+    on_pos = len(left_by)
+
+    def _search(side, offset):
+        pos = keys.searchsorted(probe, side=side).astype(np.int64) + offset
+        found = (pos >= 0) & (pos < nrows)
+        if nrows == 0:
+            return pos, found
+        pos = cupy.where(found, pos, 0)
+        if left_by:
+            # The match must also have the same "by" keys
+            by_keys = _columns_frame(
+                (i, keys._data[i]) for i in range(on_pos)
+            )._gather(pos)
+            for i in range(on_pos):
+                same = Series(probe._data[i]) == Series(by_keys._data[i])
+                found &= cupy.asarray(
+                    same.fillna(False)._column.data_array_view
+                )
+        return pos, found
+
+    if direction == "backward":
+        pos, found = _search("right" if allow_exact_matches else "left", -1)
+    elif direction == "forward":
+        pos, found = _search("left" if allow_exact_matches else "right", 0)
+
+    if direction == "nearest" or tolerance is not None:
+        key_values = _asof_key_values(keys._data[on_pos])
+        probe_values = _asof_key_values(probe._data[on_pos])
+
+        def _distance(pos):
+            return cupy.abs(probe_values - key_values[pos])
+
+    if direction == "nearest":
+        back_pos, back_found = _search(
+            "right" if allow_exact_matches else "left", -1
+        )
+        fwd_pos, fwd_found = _search(
+            "left" if allow_exact_matches else "right", 0
+        )
+        if nrows > 0:
+            # Ties are resolved in favour of the backward match
+            use_fwd = fwd_found & (
+                ~back_found | (_distance(fwd_pos) < _distance(back_pos))
+            )
+            pos = cupy.where(use_fwd, fwd_pos, back_pos)
+        else:
+            pos = back_pos
+        found = back_found | fwd_found
+
+    if tolerance is not None and nrows > 0:
+        found &= _distance(pos) <= _asof_tolerance(
+            tolerance, keys._data[on_pos]
+        )
+
+    # "on" and "by" keys sharing a name with their left counterpart are
+    # taken from the left
+    same_keys = set(
+        rkey
+        for lkey, rkey in zip(left_by + [left_on], right_by + [right_on])
+        if lkey == rkey
+    )
+    right_names = [name for name in right._data if name not in same_keys]
+    data = _join_columns(
+        left,
+        None,
+        right,
+        right_names,
+        prepared._build_rows(pos),
+        found,
+        suffixes,
+    )
+    return DataFrame(ColumnAccessor(data))
+
+
+def _as_key_list(keys):
+    if keys is None:
+        return []
+    if is_list_like(keys):
+        return list(keys)
+    return [keys]
+
+
+def _asof_key_values(col):
+    """
+    Return the values of an asof key column as a 64-bit cupy array, for
+    computing distances between keys.
+    """
+    if pd.api.types.is_datetime64_dtype(col.dtype):
+        col = col.as_numerical
+    elif not np.issubdtype(col.dtype, np.number):
+        raise TypeError(
+            "asof key must be numeric or datetime for direction='nearest' "
+            "or a tolerance, got {}".format(col.dtype)
+        )
+    values = cupy.asarray(col.data_array_view)
+    if values.dtype.kind == "f":
+        return values.astype(np.float64)
+    return values.astype(np.int64)
+
+
+def _asof_tolerance(tolerance, col):
+    """
+    Convert ``tolerance`` to the units of the key column ``col``.
+    """
+    if pd.api.types.is_datetime64_dtype(col.dtype):
+        unit, _ = np.datetime_data(col.dtype)
+        tolerance = pd.Timedelta(tolerance).to_timedelta64()
+        return int(tolerance.astype("timedelta64[%s]" % unit).astype(np.int64))
+    if not is_scalar(tolerance) or tolerance < 0:
+        raise ValueError("tolerance must be a non-negative scalar")
+    return float(tolerance)
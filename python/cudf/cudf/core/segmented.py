@@ -0,0 +1,340 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+"""
+Operations on the segments of a column.
+
+A column is split into contiguous segments by ``offsets``: segment ``i``
+holds the rows ``offsets[i]`` to ``offsets[i + 1]`` (exclusive), so that
+``len(offsets)`` is one more than the number of segments. The offsets of
+the runs of equal values of sorted data are given by :func:`find_offsets`.
+
+The work is split across threads by rows rather than by segment, so that
+a few large segments don't serialize onto a few threads.
+"""
+
+import cupy
+import numpy as np
+from numba import cuda
+
+import rmm
+
+from cudf._libxx.transform import bools_to_mask
+from cudf.core._sort import get_sorted_inds
+from cudf.core.column import as_column, column_empty
+from cudf.core.series import Series
+from cudf.utils import cudautils
+
+_SCAN_TILE = 256
+
+_scan_ops = {
+    "sum": lambda x, y: x + y,
+    "prod": lambda x, y: x * y,
+    "min": lambda x, y: min(x, y),
+    "max": lambda x, y: max(x, y),
+}
+
+
+def find_offsets(values):
+    """
+    Return the offsets of the runs of equal values of ``values``, which is
+    typically sorted, as a device array of ``len(segments) + 1`` offsets.
+
+    Parameters
+    ----------
+    values : Series or array-like
+    """
+    col = as_column(values)
+    if col.has_nulls:
+        raise ValueError("cannot find the segments of a column with nulls")
+    starts, _ = cudautils.find_segments(col.data_array_view)
+    out = cupy.empty(len(starts) + 1, dtype=np.int32)
+    out[:-1] = cupy.asarray(starts)
+    out[-1] = len(col)
+    return out
+
+
+def _normalize(values, offsets):
+    """
+    Return ``values`` as a Series, ``offsets`` as a cupy array and the
+    segment of each row.
+    """
+    values = Series(values)
+    offsets = cupy.asarray(as_column(offsets).data_array_view).astype(np.int64)
+    if len(offsets) == 0:
+        raise ValueError("offsets must have at least one element")
+    if int(offsets[0]) != 0 or int(offsets[-1]) != len(values):
+        raise ValueError(
+            "offsets must start at 0 and end at the length of the values"
+        )
+    if len(offsets) > 1 and bool((offsets[1:] < offsets[:-1]).any()):
+        raise ValueError("offsets must be non-decreasing")
+    rows = cupy.arange(len(values), dtype=np.int64)
+    segment_ids = cupy.searchsorted(offsets[1:], rows, side="right")
+    return values, offsets, segment_ids
+
+
+def reduce(values, offsets, op, ddof=1):
+    """
+    Reduce each segment of ``values``.
+
+    Parameters
+    ----------
+    values : Series or array-like
+    offsets : array-like of int
+        The boundaries of the segments.
+    op : str
+        The reduction: any aggregation supported by ``groupby``, such as
+        ``sum``, ``min``, ``max``, ``mean``, ``count``, ``var`` or
+        ``nunique``.
+    ddof : int
+        Delta degrees of freedom of the ``var`` and ``std`` reductions.
+
+    Returns
+    -------
+    Series
+        One value per segment; null for an empty segment.
+
+    Examples
+    --------
+    >>> import cudf
+    >>> values = cudf.Series([1, 2, 3, 4, 5])
+    >>> cudf.segmented.reduce(values, [0, 2, 2, 5], "sum")
+    0       3
+    1    null
+    2      12
+    dtype: int64
+    """
+    from cudf.core.groupby.groupby import _groupby_engine
+
+    values, offsets, segment_ids = _normalize(values, offsets)
+    nsegments = len(offsets) - 1
+
+    _, [result] = _groupby_engine(
+        [as_column(segment_ids)],
+        [values._column],
+        [[op]],
+        sort=True,
+        dropna=True,
+        ddof=ddof,
+    )
+    # the groups are the non-empty segments, in order
+    nonempty = offsets[1:] > offsets[:-1]
+    if len(result) == nsegments:
+        return Series(result, name=values.name)
+    if len(result) == 0:
+        result = column_empty(nsegments, result.dtype, masked=True)
+        return Series(result, name=values.name)
+
+    positions = cupy.maximum(cupy.cumsum(nonempty) - 1, 0)
+    result = result.take(as_column(positions))
+    valid = nonempty
+    if result.nullable:
+        valid = valid & cupy.asarray(result.notnull().data_array_view)
+    result = result.set_mask(bools_to_mask(as_column(valid)))
+    return Series(result, name=values.name)
+
+
+def _make_scan_kernels(op):
+    combine = cuda.jit(device=True)(_scan_ops[op])
+
+    @cuda.jit
+    def scan_tiles(
+        values, valid, heads, out, out_has, tile_acc, tile_has, first_head
+    ):
+        """
+        Scan each tile of rows sequentially, restarting at segment heads,
+        and record what each tile carries over to the next one.
+        """
+        tile = cuda.grid(1)
+        start = tile * _SCAN_TILE
+        if start >= values.size:
+            return
+        stop = min(start + _SCAN_TILE, values.size)
+        acc = values[start]
+        has = False
+        # no segment starts in the tile unless first is updated
+        first = start + _SCAN_TILE
+        for i in range(start, stop):
+            if heads[i]:
+                has = False
+                first = min(first, i)
+            if valid[i]:
+                if has:
+                    acc = combine(acc, values[i])
+                else:
+                    acc = values[i]
+                has = True
+            out[i] = acc
+            out_has[i] = has
+        tile_acc[tile] = acc
+        tile_has[tile] = has
+        first_head[tile] = first
+
+    @cuda.jit
+    def apply_carry(out, out_has, first_head, carry_acc, carry_has):
+        """
+        Combine the value carried into each tile, the scan of the tiles
+        before it, into the rows of the tile preceding its first segment
+        head.
+        """
+        i = cuda.grid(1)
+        if i < out.size:
+            tile = i // _SCAN_TILE
+            if tile > 0 and i < first_head[tile] and carry_has[tile - 1]:
+                if out_has[i]:
+                    out[i] = combine(carry_acc[tile - 1], out[i])
+                else:
+                    out[i] = carry_acc[tile - 1]
+                out_has[i] = True
+
+    return scan_tiles, apply_carry
+
+
+def _scan_rows(kernels, values, valid, heads):
+    """
+    The inclusive segmented scan of ``values``, restarting at ``heads``, and
+    whether each row follows a valid value of its segment.
+
+    Each tile of rows is scanned by a thread. The values carried across
+    tiles are the segmented scan of the tiles' aggregates, restarting at
+    the tiles holding a head, which is computed the same way in turn.
+    """
+    scan_tiles, apply_carry = kernels
+    size = len(values)
+    ntiles = (size + _SCAN_TILE - 1) // _SCAN_TILE
+    out = rmm.device_array(size, dtype=values.dtype)
+    out_has = rmm.device_array(size, dtype=np.bool_)
+    tile_acc = rmm.device_array(ntiles, dtype=values.dtype)
+    tile_has = rmm.device_array(ntiles, dtype=np.bool_)
+    first_head = rmm.device_array(ntiles, dtype=np.int64)
+
+    scan_tiles.forall(ntiles)(
+        values, valid, heads, out, out_has, tile_acc, tile_has, first_head
+    )
+    if ntiles > 1:
+        tile_stops = (cupy.arange(ntiles, dtype=np.int64) + 1) * _SCAN_TILE
+        tile_heads = cupy.asarray(first_head) < tile_stops
+        carry_acc, carry_has = _scan_rows(
+            kernels, tile_acc, tile_has, tile_heads
+        )
+        apply_carry.forall(size)(
+            out, out_has, first_head, carry_acc, carry_has
+        )
+    return out, out_has
+
+
+_scan_kernels = {}
+
+
+def _scan_dtype(dtype, op):
+    if op in ("sum", "prod") and dtype.kind in "biu":
+        return np.dtype(np.int64)
+    return dtype
+
+
+def scan(values, offsets, op="sum"):
+    """
+    Compute the cumulative ``op`` of each segment of ``values``.
+
+    Each thread scans a tile of a fixed number of rows, whatever the
+    segments, then the values crossing tile boundaries are scanned in
+    parallel in the same way, so that the work is balanced however skewed
+    the segment sizes are. Nulls are skipped and remain null in the
+    result.
+
+    Parameters
+    ----------
+    values : Series or array-like
+        Numeric values.
+    offsets : array-like of int
+        The boundaries of the segments.
+    op : {'sum', 'prod', 'min', 'max', 'count'}
+        The scan. ``count`` is the cumulative number of valid values.
+
+    Returns
+    -------
+    Series
+
+    Examples
+    --------
+    >>> import cudf
+    >>> values = cudf.Series([1, 2, 3, 4, 5])
+    >>> cudf.segmented.scan(values, [0, 2, 5], "sum")
+    0     1
+    1     3
+    2     3
+    3     7
+    4    12
+    dtype: int64
+    """
+    values, offsets, _ = _normalize(values, offsets)
+    if op == "count":
+        counts = values.notnull().astype(np.int64)
+        return scan(counts, offsets, "sum").rename(values.name)
+    if op not in _scan_ops:
+        raise NotImplementedError("segmented {!r} scan".format(op))
+    if not np.issubdtype(values.dtype, np.number):
+        raise TypeError("segmented scan requires numeric values")
+
+    col = values._column.astype(_scan_dtype(values.dtype, op))
+    size = len(col)
+    if size == 0:
+        return Series(col, name=values.name)
+
+    if op not in _scan_kernels:
+        _scan_kernels[op] = _make_scan_kernels(op)
+
+    data = col.data_array_view
+    if col.nullable:
+        valid = col.notnull().data_array_view
+    else:
+        valid = cudautils.ones(size, dtype=np.bool_)
+    heads = cupy.zeros(size, dtype=np.bool_)
+    heads[offsets[:-1][offsets[:-1] < size]] = True
+    out, _ = _scan_rows(_scan_kernels[op], data, valid, heads)
+
+    result = as_column(out)
+    if col.nullable:
+        result = result.set_mask(col.mask)
+    return Series(result, name=values.name)
+
+
+def sort(values, offsets, ascending=True, na_position="last"):
+    """
+    Sort the values of each segment, keeping the segments in place.
+
+    Parameters
+    ----------
+    values : Series or array-like
+    offsets : array-like of int
+        The boundaries of the segments.
+    ascending : bool, default True
+    na_position : {'first', 'last'}, default 'last'
+        Where to put the nulls of each segment.
+
+    Returns
+    -------
+    Series
+
+    Examples
+    --------
+    >>> import cudf
+    >>> values = cudf.Series([3, 1, 2, 5, 4])
+    >>> cudf.segmented.sort(values, [0, 3, 5])
+    0    1
+    1    2
+    2    3
+    3    4
+    4    5
+    dtype: int64
+    """
+    from cudf.core.groupby.groupby import dataframe_from_columns
+
+    values, offsets, segment_ids = _normalize(values, offsets)
+    # with a descending sort, negated segment ids keep segments in order
+    if not ascending:
+        segment_ids = -segment_ids
+    keys = dataframe_from_columns([as_column(segment_ids), values._column])
+    order = get_sorted_inds(keys, ascending=ascending, na_position=na_position)
+    result = values._column.take(order)
+    return Series(result, name=values.name)
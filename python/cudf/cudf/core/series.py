@@ -2068,18 +2068,38 @@ class Series(Frame):
             lhs = lhs.fillna(lhs._column.default_na_value())
             rhs = rhs.fillna(lhs._column.default_na_value())
 
+        # A semi join only selects the matching rows of lhs, so duplicates
+        # in the test values do not multiply the output
         lhs = DataFrame({"x": lhs, "orig_order": cudautils.arange(len(lhs))})
-        rhs = DataFrame({"x": rhs, "bool": cudautils.ones(len(rhs), "bool")})
-        res = lhs.merge(rhs, on="x", how="left").sort_values(by="orig_order")
-        res = res.drop_duplicates(subset="orig_order").reset_index(drop=True)
-        res = res["bool"].fillna(False)
+        rhs = DataFrame({"x": rhs})
+        matched = lhs.merge(rhs, on="x", how="leftsemi")["orig_order"]
+        res = Series(cudautils.zeros(len(self), dtype="bool"))
+        if len(matched):
+            res[matched] = True
         res.name = self.name
 
         return res
 
     def unique_k(self, k):
-        warnings.warn("Use .unique() instead", DeprecationWarning)
-        return self.unique()
+        """
+        Returns the unique values of this Series, which must have at most
+        ``k`` unique values.
+
+        The search stops as soon as more than ``k`` unique values are
+        found, so this is cheaper than ``unique`` to check that a Series
+        has a low cardinality.
+
+        Parameters
+        ----------
+        k : int
+            The maximum number of unique values.
+
+        Raises
+        ------
+        ValueError if there are more than ``k`` unique values.
+        """
+        res = self._column.unique_k(k)
+        return Series(res, name=self.name)
 
     def unique(self):
         """
@@ -1 +1 @@
-from cudf.core.window.rolling import Rolling
+from cudf.core.window.rolling import Rolling, RollingGroupby
@@ -1,10 +1,18 @@
+import collections
+from collections import OrderedDict
+
+import cupy
 import numba
+import numpy as np
 import pandas as pd
 
 import cudf
 import cudf._libxx as libcudf
+from cudf._libxx.transform import bools_to_mask
+from cudf.core._sort import get_sorted_inds
 from cudf.core.column.column import as_column
 from cudf.utils import cudautils
+from cudf.utils.dtypes import is_categorical_dtype
 
 
 class Rolling:
@@ -162,6 +170,7 @@ class Rolling:
         self.window = window
         self.min_periods = min_periods
         self.center = center
+        self._order = None
         self._normalize()
         if axis != 0:
             raise NotImplementedError("axis != 0 is not supported yet.")
@@ -177,25 +186,33 @@ class Rolling:
     def __getattr__(self, key):
         if key == "obj":
             raise AttributeError()
-        return self.obj[key].rolling(
-            window=self.window,
-            min_periods=self.min_periods,
-            center=self.center,
-        )
+        return self._rolling_of(self.obj[key])
 
     def __getitem__(self, arg):
         if isinstance(arg, tuple):
             arg = list(arg)
-        return self.obj[arg].rolling(
+        return self._rolling_of(self.obj[arg])
+
+    def _rolling_of(self, obj):
+        """
+        Return a Rolling object over ``obj``, a subset of the columns of
+        self.obj, reusing the normalized window
+        """
+        rolling = obj.rolling(
             window=self.window,
             min_periods=self.min_periods,
             center=self.center,
         )
+        rolling._order = self._order
+        return rolling
 
-    def _apply_agg_series(self, sr, agg_name):
+    def _apply_agg_column(self, source_column, agg_name):
+        """
+        Apply a single libcudf rolling window aggregation to a column
+        """
         if isinstance(self.window, int):
-            result_col = libcudf.rolling.rolling(
-                sr._column,
+            return libcudf.rolling.rolling(
+                source_column,
                 None,
                 None,
                 self.window,
@@ -204,10 +221,8 @@ class Rolling:
                 agg_name,
             )
         else:
-            from cudf.utils import cudautils
-
-            result_col = libcudf.rolling.rolling(
-                sr._column,
+            return libcudf.rolling.rolling(
+                source_column,
                 as_column(self.window),
                 as_column(
                     cudautils.full(self.window.size, 0, self.window.dtype)
@@ -217,21 +232,187 @@ class Rolling:
                 self.center,
                 agg_name,
             )
-        return sr._copy_construct(data=result_col)
 
-    def _apply_agg_dataframe(self, df, agg_name):
-        result_df = cudf.DataFrame({})
-        for i, col_name in enumerate(df.columns):
-            result_col = self._apply_agg_series(df[col_name], agg_name)
-            result_df.insert(i, col_name, result_col)
-        result_df.index = df.index
-        return result_df
+    def _apply_aggs_column(self, source_column, agg_names, ddof=1):
+        """
+        Apply the rolling aggregations ``agg_names`` to a column.
 
-    def _apply_agg(self, agg_name):
-        if isinstance(self.obj, cudf.Series):
-            return self._apply_agg_series(self.obj, agg_name)
+        Window reductions shared by several aggregations, such as the
+        window sums and counts behind ``sum``, ``count``, ``var`` and
+        ``std``, are computed only once per column.
+        """
+        computed = {}
+
+        def window_agg(agg_name):
+            if agg_name not in computed:
+                if agg_name in ("var", "std"):
+                    computed[agg_name] = self._window_variance(
+                        source_column, window_agg, ddof, agg_name == "std"
+                    )
+                elif agg_name == "centered_sum_of_squares":
+                    # center on the column mean to limit cancellation
+                    centered = cudf.Series(source_column).astype("float64")
+                    shift = centered.mean()
+                    shift = shift if np.isfinite(shift) else 0.0
+                    centered = centered - shift
+                    computed[agg_name] = (
+                        shift,
+                        self._apply_agg_column(
+                            (centered * centered)._column, "sum"
+                        ),
+                    )
+                else:
+                    computed[agg_name] = self._apply_agg_column(
+                        source_column, agg_name
+                    )
+            return computed[agg_name]
+
+        return [window_agg(agg_name) for agg_name in agg_names]
+
+    def _window_variance(self, source_column, window_agg, ddof, std):
+        """
+        Compute the rolling variance (or standard deviation) of a column
+        from its window sums, counts and centered sums of squares.
+        """
+        shift, sum_of_squares = window_agg("centered_sum_of_squares")
+        sums = window_agg("sum")
+
+        valid = cupy.asarray(sums.notnull().data_array_view).astype(bool)
+        counts = cupy.asarray(
+            window_agg("count").fillna(0).data_array_view
+        ).astype("float64")
+        sums = cupy.asarray(
+            sums.astype("float64").fillna(0).data_array_view
+        ) - (counts * shift)
+        sum_of_squares = cupy.asarray(sum_of_squares.fillna(0).data_array_view)
+
+        valid &= counts > ddof
+        denominator = cupy.where(valid, counts - ddof, 1)
+        variance = cupy.maximum(
+            sum_of_squares - sums * sums / cupy.where(valid, counts, 1), 0
+        )
+        variance /= denominator
+        if std:
+            variance = cupy.sqrt(variance)
+
+        result = as_column(variance)
+        if not bool(valid.all()):
+            result = result.set_mask(bools_to_mask(as_column(valid)))
+        return result
+
+    def _source(self):
+        """
+        The frame the windows are computed over
+        """
+        if self._order is not None:
+            # offset windows are computed over the index in sorted order
+            return self.obj._gather(self._order)
+        return self.obj
+
+    def _finalize(self, result):
+        """
+        Arrange the result computed over ``self._source()`` like self.obj
+        """
+        if self._order is not None:
+            # restore the original row order
+            inverse = cupy.empty(len(self._order), dtype="int32")
+            inverse[cupy.asarray(self._order.data_array_view)] = cupy.arange(
+                len(self._order), dtype="int32"
+            )
+            result = result._gather(inverse)
+        return result
+
+    def _apply_agg(self, agg_name, ddof=1):
+        return self._apply(agg_name, ddof=ddof)
+
+    def _apply(self, func, ddof=1):
+        """
+        Apply ``func``, an aggregation, a list of aggregations or a dict
+        mapping column names to aggregations, to the windows of self.obj.
+        """
+        obj = self._source()
+
+        if isinstance(obj, cudf.Series):
+            if isinstance(func, (list, tuple)):
+                columns = self._apply_aggs_column(obj._column, func, ddof)
+                result = cudf.DataFrame(
+                    OrderedDict(
+                        (_agg_label(agg_name), col)
+                        for agg_name, col in zip(func, columns)
+                    ),
+                    index=obj.index,
+                )
+            else:
+                (col,) = self._apply_aggs_column(obj._column, [func], ddof)
+                result = obj._copy_construct(data=col)
+            return self._finalize(result)
+
+        if isinstance(func, collections.abc.Mapping):
+            aggs = OrderedDict(func)
+        else:
+            aggs = OrderedDict((col_name, func) for col_name in obj.columns)
+        multi_index = any(
+            isinstance(agg_names, (list, tuple)) for agg_names in aggs.values()
+        )
+
+        labels = []
+        columns = []
+        for col_name, agg_names in aggs.items():
+            if not isinstance(agg_names, (list, tuple)):
+                agg_names = [agg_names]
+            columns.extend(
+                self._apply_aggs_column(obj[col_name]._column, agg_names, ddof)
+            )
+            for agg_name in agg_names:
+                if multi_index:
+                    labels.append((col_name, _agg_label(agg_name)))
+                else:
+                    labels.append(col_name)
+
+        result = cudf.DataFrame(
+            OrderedDict(enumerate(columns)), index=obj.index
+        )
+        if multi_index:
+            result.columns = cudf.MultiIndex.from_tuples(labels)
         else:
-            return self._apply_agg_dataframe(self.obj, agg_name)
+            result.columns = labels
+        return self._finalize(result)
+
+    def agg(self, func):
+        """
+        Aggregate the rolling windows using one or more aggregations.
+
+        Parameters
+        ----------
+        func : str, callable, list or dict
+            An aggregation, a list of aggregations, or a dict mapping
+            column names to an aggregation or a list of aggregations.
+            Aggregations are the names of the rolling methods (``sum``,
+            ``min``, ``max``, ``mean``, ``count``, ``var``, ``std``) or
+            a user defined function as accepted by :meth:`apply`.
+
+        Returns
+        -------
+        Series or DataFrame
+            A list of aggregations produces one column per aggregation,
+            labelled by the aggregation name (and the column name for a
+            DataFrame).
+
+        Examples
+        --------
+        >>> import cudf
+        >>> a = cudf.Series([1, 2, 3, 4, 5])
+        >>> a.rolling(2, min_periods=1).agg(["sum", "max"])
+           sum  max
+        0    1    1
+        1    3    2
+        2    5    3
+        3    7    4
+        4    9    5
+        """
+        return self._apply(func)
+
+    aggregate = agg
 
     def sum(self):
         return self._apply_agg("sum")
@@ -248,6 +429,12 @@ class Rolling:
     def count(self):
         return self._apply_agg("count")
 
+    def var(self, ddof=1):
+        return self._apply_agg("var", ddof=ddof)
+
+    def std(self, ddof=1):
+        return self._apply_agg("std", ddof=ddof)
+
     def apply(self, func, *args, **kwargs):
         """
         Counterpart of pandas.core.window.Rolling.apply
@@ -286,7 +473,8 @@ class Rolling:
         * A timedelta offset, in which case it is used to generate
           a column of window sizes to use for each element.
           If *min_periods* is unspecified, it is set to 1.
-          Only valid for datetime index.
+          Only valid for datetime index. If the index is not sorted,
+          the windows are computed over the rows in index order.
         """
         window, min_periods = self.window, self.min_periods
         if pd.api.types.is_number(window):
@@ -320,8 +508,20 @@ class Rolling:
                     "window must be integer or " "convertible to a timedelta"
                 ) from e
 
+            if window <= pd.Timedelta(0):
+                raise ValueError("window cannot be zero or negative")
+
+            index_values = self.obj.index._values
+            if index_values.has_nulls:
+                raise ValueError(
+                    "index cannot contain nulls for an offset window"
+                )
+            if not index_values.is_monotonic_increasing:
+                self._order = get_sorted_inds(index_values)
+                index_values = index_values.take(self._order)
+
             window = cudautils.window_sizes_from_offset(
-                self.obj.index._values.data_array_view, window
+                index_values.data_array_view, window
             )
             if self.min_periods is None:
                 min_periods = 1
@@ -333,3 +533,209 @@ class Rolling:
         return "{} [window={},min_periods={},center={}]".format(
             self.__class__.__name__, self.window, self.min_periods, self.center
         )
+
+
+class RollingGroupby(Rolling):
+    """
+    Grouped rolling window calculations, returned by
+    ``groupby(...).rolling(...)``.
+
+    The rows are ordered by group once and the window of every row is
+    limited to the rows of its own group, so that all the groups are
+    computed by the same rolling window calls instead of splitting the
+    frame into one piece per group.
+
+    The result is indexed by the group keys followed by the original
+    index, with the groups in sorted order. With a fixed window the rows
+    of each group are in their original order; with an offset window
+    they are sorted by the index, rows with equal index values keeping
+    their original order.
+
+    See Also
+    --------
+    cudf.core.window.Rolling
+    """
+
+    def __init__(self, groupby, window, min_periods=None, center=False):
+        helper = groupby._groupby
+        obj = helper.obj
+        if isinstance(obj, cudf.DataFrame):
+            obj = obj[
+                [
+                    name
+                    for name in obj.columns
+                    if name not in helper.df_key_names
+                ]
+            ]
+        self._key_names = helper.key_names
+        self._key_columns = [
+            key._column if isinstance(key, cudf.Series) else as_column(key)
+            for key in helper.key_columns
+        ]
+        self._dropna = helper.dropna
+        super().__init__(obj, window, min_periods=min_periods, center=center)
+
+    def _rolling_of(self, obj):
+        rolling = object.__new__(type(self))
+        rolling.__dict__.update(self.__dict__)
+        rolling.obj = obj
+        return rolling
+
+    def _normalize(self):
+        """
+        Order the rows by group and compute the preceding and following
+        window of every row, limited to the bounds of its group.
+        """
+        window, min_periods = self.window, self.min_periods
+        nkeys = len(self._key_columns)
+
+        sort_columns = list(self._key_columns)
+        if pd.api.types.is_number(window):
+            if not pd.api.types.is_integer(window):
+                raise ValueError("window must be an integer")
+            if window <= 0:
+                raise ValueError("window cannot be zero or negative")
+            window = int(window)
+            if min_periods is None:
+                min_periods = window
+        else:
+            if not isinstance(self.obj.index, cudf.core.index.DatetimeIndex):
+                raise ValueError(
+                    "window must be an integer for " "non datetime index"
+                )
+            if self.center:
+                raise NotImplementedError(
+                    "center is not implemented for offset-based windows"
+                )
+            try:
+                window = pd.to_timedelta(window)
+                if not isinstance(window, pd.Timedelta):
+                    raise ValueError
+                window = window.to_timedelta64()
+            except ValueError as e:
+                raise ValueError(
+                    "window must be integer or " "convertible to a timedelta"
+                ) from e
+            if window <= pd.Timedelta(0):
+                raise ValueError("window cannot be zero or negative")
+            if self.obj.index._values.has_nulls:
+                raise ValueError(
+                    "index cannot contain nulls for an offset window"
+                )
+            sort_columns.append(self.obj.index._values.as_numerical)
+            if min_periods is None:
+                min_periods = 1
+
+        # sort by the keys (and time), breaking ties by row position so
+        # that the rows of each group (at each time) keep their original
+        # order
+        sort_columns.append(
+            as_column(cupy.arange(len(self.obj), dtype="int32"))
+        )
+        rows = cudf.DataFrame(OrderedDict(enumerate(sort_columns)))
+        if self._dropna:
+            rows = rows.dropna(subset=list(range(nkeys)))
+        rows = rows._gather(get_sorted_inds(rows))
+        sorted_columns = list(rows._data.columns)
+        self._order = sorted_columns[-1]
+        self._sorted_key_columns = sorted_columns[:nkeys]
+
+        nrows = len(rows)
+        positions = cupy.arange(nrows, dtype="int64")
+        group_starts = _group_starts(self._sorted_key_columns)
+        group_ids = cupy.cumsum(group_starts) - 1
+        if isinstance(window, int):
+            starts = cupy.flatnonzero(group_starts)
+            ends = cupy.append(starts[1:], nrows)
+            if self.center:
+                preceding = window // 2 + 1
+                following = window - preceding
+            else:
+                preceding, following = window, 0
+            preceding = cupy.minimum(
+                preceding, positions - starts[group_ids] + 1
+            )
+            following = cupy.minimum(
+                following, ends[group_ids] - 1 - positions
+            )
+        else:
+            # the window of a row starts at the first row of its group
+            # within the offset, found with a binary search on
+            # (group, time)
+            unit, _ = np.datetime_data(self.obj.index.dtype)
+            offset = int(np.ceil(window / np.timedelta64(1, unit)))
+            times = cupy.asarray(sorted_columns[nkeys].data_array_view)
+            group_ids = as_column(group_ids)
+            haystack = cudf.DataFrame(
+                OrderedDict([(0, group_ids), (1, as_column(times))])
+            )
+            needles = cudf.DataFrame(
+                OrderedDict([(0, group_ids), (1, as_column(times - offset))])
+            )
+            preceding = (
+                positions - haystack.searchsorted(needles, side="right") + 1
+            )
+            following = cupy.zeros(nrows, dtype="int64")
+
+        self.window = window
+        self.min_periods = min_periods
+        self._preceding = as_column(preceding.astype("int32"))
+        self._following = as_column(following.astype("int32"))
+
+    def _apply_agg_column(self, source_column, agg_name):
+        min_periods = self.min_periods
+        if agg_name == "count" and isinstance(self.window, int):
+            min_periods = 0
+        return libcudf.rolling.rolling(
+            source_column,
+            self._preceding,
+            self._following,
+            None,
+            min_periods,
+            False,
+            agg_name,
+        )
+
+    def _finalize(self, result):
+        index = result.index
+        result.index = cudf.MultiIndex(
+            source_data=cudf.DataFrame(
+                OrderedDict(
+                    enumerate(self._sorted_key_columns + [index._values])
+                )
+            ),
+            names=list(self._key_names) + [index.name],
+        )
+        return result
+
+
+def _group_starts(key_columns):
+    """
+    Return a boolean cupy array flagging the first row of every group of
+    the sorted ``key_columns``
+    """
+    nrows = len(key_columns[0]) if key_columns else 0
+    starts = cupy.zeros(nrows, dtype=bool)
+    if nrows == 0:
+        return starts
+    starts[0] = True
+    for col in key_columns:
+        if is_categorical_dtype(col):
+            col = col.codes
+        this, prev = cudf.Series(col[1:]), cudf.Series(col[:-1])
+        differs = (this != prev).fillna(True)
+        if col.has_nulls:
+            differs = differs & ~(this.isnull() & prev.isnull())
+        starts[1:] |= cupy.asarray(differs._column.data_array_view).astype(
+            bool
+        )
+    return starts
+
+
+def _agg_label(agg):
+    """
+    The column label of the result of the aggregation ``agg``
+    """
+    if callable(agg):
+        return agg.__name__
+    return agg
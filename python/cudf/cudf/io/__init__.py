@@ -1,10 +1,11 @@
 # Copyright (c) 2018, NVIDIA CORPORATION.
 
+from cudf.io.arrow import read_arrow_stream
 from cudf.io.avro import read_avro
 from cudf.io.csv import read_csv, to_csv
 from cudf.io.dlpack import from_dlpack
 from cudf.io.feather import read_feather
 from cudf.io.hdf import read_hdf
-from cudf.io.json import read_json
+from cudf.io.json import read_json, read_json_schema
 from cudf.io.orc import read_orc, read_orc_metadata, to_orc
 from cudf.io.parquet import read_parquet, read_parquet_metadata
@@ -0,0 +1,121 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import json
+import os
+import socket
+from contextlib import ExitStack
+
+import fsspec
+import pyarrow as pa
+
+from cudf.core.dataframe import DataFrame
+from cudf.utils import ioutils
+
+
+def _open(stack, path_or_file, mode):
+    """
+    Return a file for the stream ``path_or_file``, registering any file
+    opened here with ``stack`` so that it is closed afterwards.
+    """
+    if isinstance(path_or_file, str):
+        path = os.path.expanduser(path_or_file)
+        return stack.enter_context(fsspec.open(path, mode=mode).open())
+    if isinstance(path_or_file, socket.socket):
+        return stack.enter_context(path_or_file.makefile(mode))
+    if isinstance(path_or_file, (bytes, bytearray, memoryview, pa.Buffer)):
+        return pa.BufferReader(path_or_file)
+    return path_or_file
+
+
+def _batch_nbytes(batch):
+    return sum(
+        buf.size
+        for col in batch.columns
+        for buf in col.buffers()
+        if buf is not None
+    )
+
+
+def _select(table, columns):
+    """
+    Select ``columns`` of ``table``, along with its index columns.
+    """
+    names = list(columns)
+    metadata = table.schema.pandas_metadata
+    if metadata is not None:
+        names += [
+            name
+            for name in metadata["index_columns"]
+            if isinstance(name, str) and name not in names
+        ]
+    arrays = []
+    for name in names:
+        # -1, for a missing field, would select the last column
+        index = table.schema.get_field_index(name)
+        if index == -1:
+            raise KeyError(name)
+        arrays.append(table.column(index))
+    return pa.Table.from_arrays(
+        arrays, names=names, metadata=table.schema.metadata
+    )
+
+
+def _with_range_index(table, start):
+    """
+    Shift the range index described by the pandas metadata of ``table``,
+    which describes the whole stream, to the rows of ``table`` starting
+    at row ``start`` of the stream.
+    """
+    metadata = table.schema.pandas_metadata
+    if metadata is None or not metadata["index_columns"]:
+        return table
+    index = metadata["index_columns"][0]
+    if not isinstance(index, dict) or index["kind"] != "range":
+        return table
+    index["start"] += start * index["step"]
+    index["stop"] = index["start"] + table.num_rows * index["step"]
+    schema_metadata = dict(table.schema.metadata)
+    schema_metadata[b"pandas"] = json.dumps(metadata).encode("utf8")
+    return table.replace_schema_metadata(schema_metadata)
+
+
+@ioutils.doc_read_arrow_stream()
+def read_arrow_stream(
+    source, columns=None, batch_rows=None, batch_bytes=64 * 1024 ** 2
+):
+    """{docstring}"""
+
+    with ExitStack() as stack:
+        reader = pa.ipc.open_stream(_open(stack, source, "rb"))
+        pending, nrows, nbytes, start = [], 0, 0, 0
+
+        def flush():
+            table = pa.Table.from_batches(pending, schema=reader.schema)
+            if columns is not None:
+                table = _select(table, columns)
+            return DataFrame.from_arrow(_with_range_index(table, start))
+
+        for batch in reader:
+            pending.append(batch)
+            nrows += batch.num_rows
+            nbytes += _batch_nbytes(batch)
+            if (batch_rows is not None and nrows >= batch_rows) or (
+                batch_bytes is not None and nbytes >= batch_bytes
+            ):
+                yield flush()
+                pending, start, nrows, nbytes = [], start + nrows, 0, 0
+        if pending:
+            yield flush()
+
+
+@ioutils.doc_to_arrow_stream()
+def to_arrow_stream(df, sink, preserve_index=True, chunksize=None):
+    """{docstring}"""
+
+    table = df.to_arrow(preserve_index=preserve_index)
+    with ExitStack() as stack:
+        writer = pa.RecordBatchStreamWriter(
+            _open(stack, sink, "wb"), table.schema
+        )
+        writer.write_table(table, max_chunksize=chunksize)
+        writer.close()
@@ -1,7 +1,15 @@
 # Copyright (c) 2018, NVIDIA CORPORATION.
 
-from io import BytesIO, IOBase, StringIO
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from io import BytesIO, StringIO, TextIOBase, TextIOWrapper
 
+import fsspec
+from fsspec.compression import compr
+from fsspec.utils import infer_compression
+
+import cudf
 import cudf._lib as libcudf
 from cudf.utils import ioutils
 
@@ -83,6 +91,85 @@ def read_csv(
     )
 
 
+# the device data formatted at once when no chunksize is given, so that
+# the device memory used for the text is bounded
+_DEFAULT_CHUNK_BYTES = 64 * 1024 ** 2
+
+
+class _TextWriter:
+    """Write bytes to a text file"""
+
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, data):
+        self.file.write(data.decode())
+
+
+def _index_columns(df):
+    """
+    The columns of the index of ``df``, named as ``reset_index`` names
+    them, without copying them.
+    """
+    index = df.index
+    if isinstance(index, cudf.MultiIndex):
+        if all(name is None for name in index.names):
+            names = ["level_{}".format(i) for i in range(len(index.names))]
+        else:
+            names = list(index.names)
+    else:
+        names = ["" if index.name is None else index.name]
+    return OrderedDict(zip(names, index._data.columns))
+
+
+def _default_chunksize(df):
+    nbytes = df.__sizeof__()
+    if nbytes == 0:
+        return len(df)
+    return max(len(df) * _DEFAULT_CHUNK_BYTES // nbytes, 8)
+
+
+@contextmanager
+def _open_output(path, compression, storage_options):
+    """
+    Yield the binary file the CSV data is written to and None, or None and
+    the local file ``path`` refers to, written by libcudf directly.
+    """
+    if isinstance(path, str):
+        fs, _, _ = fsspec.get_fs_token_paths(
+            path, mode="wb", storage_options=storage_options
+        )
+        if compression == "infer":
+            compression = infer_compression(path)
+        if compression is None and ioutils._is_local_filesystem(fs):
+            yield None, fs._strip_protocol(path)
+        else:
+            with fsspec.open(
+                path,
+                mode="wb",
+                compression=compression,
+                **(storage_options or {}),
+            ) as f:
+                yield f, None
+        return
+
+    if isinstance(path, TextIOBase):
+        if compression not in (None, "infer"):
+            raise ValueError("Cannot compress CSV data written to a text file")
+        if isinstance(path, TextIOWrapper):
+            path.flush()
+            yield path.buffer, None
+        else:
+            yield _TextWriter(path), None
+        return
+
+    if compression in (None, "infer"):
+        yield path, None
+    else:
+        with compr[compression](path, mode="wb") as f:
+            yield f, None
+
+
 @ioutils.doc_to_csv()
 def to_csv(
     df,
@@ -94,30 +181,44 @@ def to_csv(
     index=True,
     line_terminator="\n",
     chunksize=None,
+    compression="infer",
+    storage_options=None,
 ):
     """{docstring}"""
+
+    cols = df._data
     if index:
-        from cudf import MultiIndex
-
-        if not isinstance(df.index, MultiIndex):
-            if df.index.name is None:
-                df.index.name = ""
-            if columns is not None:
-                columns = columns.copy()
-                columns.insert(0, df.index.name)
-        df = df.reset_index()
-    rows_per_chunk = chunksize if chunksize else len(df)
-
-    if isinstance(path, IOBase):
-        path = path.name
-
-    return libcudf.csv.write_csv(
-        cols=df._data,
-        path=path,
-        sep=sep,
-        na_rep=na_rep,
-        columns=columns,
-        header=header,
-        line_terminator=line_terminator,
-        rows_per_chunk=rows_per_chunk,
-    )
+        # the index is written as the first columns, as by reset_index
+        # but without copying the frame
+        cols = _index_columns(df)
+        index_names = list(cols)
+        for name, col in df._data.items():
+            if name in cols:
+                raise NameError("duplicated column name {!r}".format(name))
+            cols[name] = col
+        if columns is not None:
+            columns = index_names + list(columns)
+    rows_per_chunk = chunksize if chunksize else _default_chunksize(df)
+
+    return_string = path is None
+    if return_string:
+        path = StringIO()
+    elif isinstance(path, os.PathLike):
+        path = os.fspath(path)
+    if isinstance(path, str):
+        path = os.path.expanduser(path)
+
+    with _open_output(path, compression, storage_options) as (file, local):
+        libcudf.csv.write_csv(
+            cols=cols,
+            path=local,
+            sep=sep,
+            na_rep=na_rep,
+            columns=columns,
+            header=header,
+            line_terminator=line_terminator,
+            rows_per_chunk=rows_per_chunk,
+            file=file,
+        )
+    if return_string:
+        return path.getvalue()
@@ -1,7 +1,8 @@
 # Copyright (c) 2019, NVIDIA CORPORATION.
 
-import warnings
+import os
 
+import pyarrow as pa
 from pyarrow import feather
 
 from cudf.core.dataframe import DataFrame
@@ -9,24 +10,30 @@ from cudf.utils import ioutils
 
 
 @ioutils.doc_read_feather()
-def read_feather(path, *args, **kwargs):
+def read_feather(path, columns=None, memory_map=True, **kwargs):
     """{docstring}"""
 
-    warnings.warn(
-        "Using CPU via PyArrow to read feather dataset, this may "
-        "be GPU accelerated in the future"
-    )
-    pa_table = feather.read_table(path, *args, **kwargs)
-    return DataFrame.from_arrow(pa_table)
+    if isinstance(path, os.PathLike):
+        path = os.fspath(path)
+    if isinstance(path, str):
+        path = os.path.expanduser(path)
+    if not (isinstance(path, str) and os.path.isfile(path)):
+        path, _ = ioutils.get_filepath_or_buffer(path, None, **kwargs)
+    if not (isinstance(path, str) and os.path.isfile(path)):
+        pa_table = feather.read_table(path, columns=columns)
+        return DataFrame.from_arrow(pa_table)
+
+    # a memory-mapped file is read lazily, so that the columns not selected
+    # are never read and the selected ones are copied straight to the device
+    source = pa.memory_map(path) if memory_map else pa.OSFile(path)
+    with source:
+        pa_table = feather.read_table(source, columns=columns)
+        return DataFrame.from_arrow(pa_table)
 
 
 @ioutils.doc_to_feather()
 def to_feather(df, path, *args, **kwargs):
     """{docstring}"""
-    warnings.warn(
-        "Using CPU via PyArrow to write Feather dataset, this may "
-        "be GPU accelerated in the future"
-    )
     # Feather doesn't support using an index
     pa_table = df.to_arrow(preserve_index=False)
     feather_writer = feather.FeatherWriter(path)
@@ -1,16 +1,240 @@
 # Copyright (c) 2019, NVIDIA CORPORATION.
 
+import os
 import warnings
+from collections import OrderedDict
 
+import numpy as np
 import pandas as pd
 
 import cudf
+from cudf.core import _transfer
+from cudf.core.column import as_column
+from cudf.core.column_accessor import ColumnAccessor
 from cudf.utils import ioutils
 
+# the rows read at once when no chunksize is given, so that host memory
+# use is bounded by the staging buffers rather than by the dataset
+_DEFAULT_CHUNK_BYTES = 64 * 1024 ** 2
 
-@ioutils.doc_read_hdf()
-def read_hdf(path_or_buf, *args, **kwargs):
-    """{docstring}"""
+# pandas' default chunksize for iterator=True
+_DEFAULT_ITERATOR_CHUNKSIZE = 100000
+
+
+def _is_native(dtype):
+    """
+    Whether the values of ``dtype`` are read by ``_HDFFrameReader``
+    itself rather than by pandas.
+    """
+    return isinstance(dtype, np.dtype) and (
+        dtype.kind in "biuf" or dtype == np.dtype("datetime64[ns]")
+    )
+
+
+class _HDFBlock:
+    """
+    Columns stored together in a 2D (or 1D for a single column) HDF5
+    array of ``nrows`` rows.
+    """
+
+    def __init__(self, names, dtype, read):
+        self.names = names
+        self.dtype = dtype
+        self._read = read
+        self._buffer = None
+
+    def read(self, start, stop):
+        """
+        Read the rows from ``start`` to ``stop`` into a staging buffer,
+        which is reused by the next read.
+        """
+        nrows = stop - start
+        # datetimes are stored as int64 nanoseconds
+        dtype = np.dtype("int64") if self.dtype.kind == "M" else self.dtype
+        if self._buffer is None or len(self._buffer) < nrows:
+            self._buffer = np.empty((nrows, len(self.names)), dtype=dtype)
+        out = self._buffer[:nrows]
+        self._read(start, stop, out)
+        return out.view(self.dtype)
+
+
+class _HDFFrameReader:
+    """
+    Read the rows of a DataFrame stored by pandas in an HDF5 file.
+
+    The numeric and datetime blocks are read straight from the HDF5
+    arrays into reused host staging buffers, and copied to the device
+    together; only the rows and columns requested are read. Other
+    columns are read by pandas.
+    """
+
+    def __init__(self, store, key, nrows, columns=None):
+        self.store = store
+        self.key = key
+        self.storer = store.get_storer(key)
+        self.nrows = nrows
+
+        # pandas itself describes the names and types of the columns
+        self.meta = store.select(key, start=0, stop=1).iloc[:0]
+        if columns is None:
+            columns = list(self.meta.columns)
+        self.columns = columns
+
+        if self.storer.is_table:
+            blocks, other_blocks = self._table_blocks(), []
+        else:
+            blocks, other_blocks = self._fixed_blocks()
+        selected = set(columns)
+        self.blocks = [
+            block for block in blocks if selected.intersection(block.names)
+        ]
+        self.other_columns = [
+            name
+            for name in columns
+            if not any(name in block.names for block in self.blocks)
+        ]
+        # the blocks of a fixed format frame holding the other columns
+        self.other_blocks = [
+            (key, names)
+            for key, names in other_blocks
+            if selected.intersection(names)
+        ]
+
+    @classmethod
+    def open(cls, store, key, columns=None):
+        """
+        Return a reader of the DataFrame ``key`` of ``store``, or None if
+        it is not a non-empty DataFrame.
+        """
+        storer = store.get_storer(key)
+        if getattr(storer, "pandas_type", None) not in (
+            "frame",
+            "frame_table",
+        ):
+            return None
+        storer.infer_axes()
+        if storer.is_table:
+            nrows = storer.nrows
+        else:
+            nrows = getattr(storer.group, "axis1").shape[0]
+        if not nrows:
+            return None
+        return cls(store, key, nrows, columns)
+
+    def _table_blocks(self):
+        table = self.storer.table
+        blocks = []
+        for axis in self.storer.values_axes:
+            names = list(axis.values)
+            dtype = self.meta.dtypes[names[0]]
+            if not all(_is_native(self.meta.dtypes[n]) for n in names):
+                continue
+
+            def read(start, stop, out, field=axis.cname):
+                # a data column is stored alone, as a 1D field
+                if not table.coldescrs[field].shape:
+                    out = out[:, 0]
+                table.read(start, stop, field=field, out=out)
+
+            blocks.append(_HDFBlock(names, dtype, read))
+        return blocks
+
+    def _fixed_blocks(self):
+        """
+        Return the blocks read natively, and the ``(key, names)`` of the
+        other blocks, which are read by pandas.
+        """
+        group = self.storer.group
+        blocks, other_blocks = [], []
+        for i in range(self.storer.nblocks):
+            names = list(self.storer.read_index("block{}_items".format(i)))
+            key = "block{}_values".format(i)
+            node = getattr(group, key)
+            dtype = self.meta.dtypes[names[0]]
+            if not (
+                getattr(node._v_attrs, "transposed", False)
+                and all(_is_native(self.meta.dtypes[n]) for n in names)
+            ):
+                other_blocks.append((key, names))
+                continue
+
+            def read(start, stop, out, node=node):
+                node.read(start, stop, out=out)
+
+            blocks.append(_HDFBlock(names, dtype, read))
+        return blocks, other_blocks
+
+    def _read_other_blocks(self, start, stop):
+        """
+        Read the rows from ``start`` to ``stop`` of the other columns of a
+        fixed format frame from the blocks holding them only.
+        """
+        columns = {}
+        for key, names in self.other_blocks:
+            values = self.storer.read_array(key, start=start, stop=stop)
+            if values.ndim == 1:
+                # a block of an extension type holds a single column
+                values = [values]
+            for name, column in zip(names, values):
+                if name in self.other_columns:
+                    columns[name] = as_column(pd.Series(column).values)
+        return columns
+
+    def _read_index(self, start, stop):
+        if self.storer.is_table:
+            values = self.store.select_column(
+                self.key, "index", start=start, stop=stop
+            )
+            index = pd.Index(values.values, name=self.meta.index.name)
+        else:
+            index = self.storer.read_index("axis1", start=start, stop=stop)
+        return cudf.from_pandas(index)
+
+    def read(self, start, stop):
+        """
+        Return the rows from ``start`` to ``stop`` as a DataFrame.
+        """
+        arrays = OrderedDict()
+        for block in self.blocks:
+            values = block.read(start, stop)
+            for i, name in enumerate(block.names):
+                if name in self.columns:
+                    arrays[name] = values[:, i]
+        columns = dict(
+            zip(arrays.keys(), _transfer.arrays_to_device(arrays.values()))
+        )
+
+        if self.other_columns and self.storer.is_table:
+            other = self.store.select(
+                self.key, columns=self.other_columns, start=start, stop=stop,
+            )
+            for name in self.other_columns:
+                columns[name] = as_column(other[name].values)
+        elif self.other_columns:
+            columns.update(self._read_other_blocks(start, stop))
+
+        data = OrderedDict((name, columns[name]) for name in self.columns)
+        return cudf.DataFrame(
+            ColumnAccessor(data), index=self._read_index(start, stop)
+        )
+
+    def chunks(self, start=None, stop=None, chunksize=None):
+        """
+        Yield the rows from ``start`` to ``stop`` as DataFrames of
+        ``chunksize`` rows.
+        """
+        start, stop, _ = slice(start, stop).indices(self.nrows)
+        if chunksize is None:
+            row_bytes = sum(
+                len(block.names) * block.dtype.itemsize
+                for block in self.blocks
+            )
+            chunksize = max(_DEFAULT_CHUNK_BYTES // max(row_bytes, 1), 1)
+        for chunk_start in range(start, stop, chunksize):
+            yield self.read(chunk_start, min(chunk_start + chunksize, stop))
+
+
+def _read_hdf_pandas(path_or_buf, *args, **kwargs):
     warnings.warn(
         "Using CPU via Pandas to read HDF dataset, this may "
         "be GPU accelerated in the future"
@@ -19,6 +243,75 @@ def read_hdf(path_or_buf, *args, **kwargs):
     return cudf.from_pandas(pd_value)
 
 
+def _iterate(store, owned, reader, start, stop, chunksize):
+    try:
+        yield from reader.chunks(start, stop, chunksize)
+    finally:
+        if owned:
+            store.close()
+
+
+@ioutils.doc_read_hdf()
+def read_hdf(
+    path_or_buf,
+    key=None,
+    mode="r",
+    columns=None,
+    start=None,
+    stop=None,
+    iterator=False,
+    chunksize=None,
+    **kwargs,
+):
+    """{docstring}"""
+
+    pandas_kwargs = dict(
+        mode=mode,
+        columns=columns,
+        start=start,
+        stop=stop,
+        iterator=iterator,
+        chunksize=chunksize,
+        **kwargs,
+    )
+    # selections such as ``where`` are left to pandas
+    if kwargs:
+        return _read_hdf_pandas(path_or_buf, key, **pandas_kwargs)
+
+    if isinstance(path_or_buf, pd.HDFStore):
+        store, owned = path_or_buf, False
+    else:
+        if isinstance(path_or_buf, os.PathLike):
+            path_or_buf = os.fspath(path_or_buf)
+        store, owned = pd.HDFStore(path_or_buf, mode=mode), True
+
+    try:
+        if key is None:
+            keys = store.keys()
+            if len(keys) != 1:
+                raise ValueError(
+                    "key must be provided when HDF5 file "
+                    "contains multiple datasets."
+                )
+            key = keys[0]
+        reader = _HDFFrameReader.open(store, key, columns)
+        if reader is not None and (iterator or chunksize is not None):
+            # the store is closed by the iterator
+            close, owned = owned, False
+            if chunksize is None:
+                chunksize = _DEFAULT_ITERATOR_CHUNKSIZE
+            return _iterate(store, close, reader, start, stop, chunksize)
+        if reader is not None:
+            frames = list(reader.chunks(start, stop))
+            if len(frames) == 0:
+                return reader.read(0, 0)
+            return frames[0] if len(frames) == 1 else cudf.concat(frames)
+    finally:
+        if owned:
+            store.close()
+    return _read_hdf_pandas(path_or_buf, key, **pandas_kwargs)
+
+
 @ioutils.doc_to_hdf()
 def to_hdf(path_or_buf, key, value, *args, **kwargs):
     """{docstring}"""
@@ -1,14 +1,399 @@
 # Copyright (c) 2019-2020, NVIDIA CORPORATION.
 
+import json
+import os
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO, StringIO
+from itertools import islice
 
+import fsspec
+import numpy as np
 import pandas as pd
 
 import cudf
 import cudf._libxx.json as libjson
+from cudf.core import _transfer
+from cudf.core.column import as_column
+from cudf.core.column_accessor import ColumnAccessor
 from cudf.utils import ioutils
 
+# inputs smaller than this are parsed in a single chunk, in process
+_PARALLEL_JSON_BYTES = 8 * 1024 ** 2
+
+# the bytes scanned at once for the boundaries between records
+_SCAN_BLOCK_BYTES = 4 * 1024 ** 2
+
+# the classes of the bytes telling where the records of an array end
+_QUOTE, _BACKSLASH, _OPENING, _CLOSING, _CLOSING_BRACE = range(1, 6)
+
+_compression_extensions = (".gz", ".bz2", ".zip", ".xz")
+
+_pool = None
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor()
+    return _pool
+
+
+class _NotRecords(Exception):
+    pass
+
+
+def _records_values_to_array(values):
+    """
+    Convert the values of a column into a numpy array, as ``pd.DataFrame``
+    would from a list of records.
+    """
+    types = set(map(type, values))
+    try:
+        if types == {bool}:
+            return np.array(values, dtype=np.bool_)
+        if types == {int}:
+            return np.array(values, dtype=np.int64)
+        if types <= {int, float, type(None)}:
+            return np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+    except OverflowError:
+        pass
+    out = np.empty(len(values), dtype=object)
+    if types & {list, dict}:
+        # nested values are set one by one rather than broadcast
+        for i, value in enumerate(values):
+            out[i] = value
+    else:
+        out[:] = values
+    return out
+
+
+def _parse_records(data):
+    """
+    Parse a JSON array of records into columns of numpy arrays.
+
+    Returns the number of records and an ordered mapping of the keys, in
+    order of first appearance, to their values, missing values being NaN
+    as in a DataFrame built from the records.
+    """
+    records = json.loads(data)
+    if not isinstance(records, list):
+        raise _NotRecords()
+    columns = OrderedDict()
+    for i, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise _NotRecords()
+        for key, value in record.items():
+            if key not in columns:
+                columns[key] = [np.nan] * i
+            columns[key].append(value)
+        for values in columns.values():
+            if len(values) == i:
+                values.append(np.nan)
+    arrays = OrderedDict(
+        (key, _records_values_to_array(values))
+        for key, values in columns.items()
+    )
+    return len(records), arrays
+
+
+def _byte_classes():
+    """
+    A ``bytes.translate`` table of the bytes to their class, 0 for the
+    bytes of no class.
+    """
+    table = bytearray(256)
+    table[ord('"')] = _QUOTE
+    table[ord("\\")] = _BACKSLASH
+    table[ord("[")] = table[ord("{")] = _OPENING
+    table[ord("]")] = _CLOSING
+    table[ord("}")] = _CLOSING_BRACE
+    return bytes(table)
+
+
+_BYTE_CLASSES = _byte_classes()
+
+
+def _record_ends(data, start, stop, targets):
+    """
+    The position after the first record of the top-level array ending at
+    or after each of the increasing ``targets``.
+
+    The nesting depth of ``data[start:stop]`` outside strings is computed
+    with numpy a block at a time, from the positions of the quotes,
+    backslashes and brackets only, so that only the ends of the records of
+    the array itself are found, not those of the objects nested within
+    them.
+    """
+    ends = []
+    targets = iter(targets)
+    target = next(targets, None)
+    # the state carried from one block to the next
+    depth = quotes = backslashes = 0
+    for offset in range(start, stop, _SCAN_BLOCK_BYTES):
+        if target is None:
+            break
+        block = data[offset : min(offset + _SCAN_BLOCK_BYTES, stop)]
+        classes = np.frombuffer(block.translate(_BYTE_CLASSES), np.uint8)
+        position = np.flatnonzero(classes)
+        kind = classes[position]
+        quote = kind == _QUOTE
+
+        # a quote is escaped by an odd run of backslashes before it
+        escaped = np.array(
+            [0] if backslashes % 2 and classes[0] == _QUOTE else [],
+            dtype=np.int64,
+        )
+        backslash = position[kind == _BACKSLASH]
+        carried, backslashes = backslashes, 0
+        if len(backslash):
+            first = np.flatnonzero(np.diff(backslash, prepend=-2) != 1)
+            last = np.append(first[1:], len(backslash)) - 1
+            length = last - first + 1
+            if backslash[0] == 0:
+                length[0] += carried
+            after = backslash[last] + 1
+            if after[-1] == len(block):
+                backslashes = int(length[-1])
+            after = after[(length % 2 == 1) & (after < len(block))]
+            escaped = np.append(escaped, after[classes[after] == _QUOTE])
+        quote[np.searchsorted(position, escaped)] = False
+
+        # the brackets after an odd number of quotes are within strings
+        in_string = (np.cumsum(quote) + quotes) % 2 == 1
+        quotes += int(quote.sum())
+        bracket = (kind >= _OPENING) & ~in_string
+        level = np.cumsum(np.where(kind[bracket] == _OPENING, 1, -1)) + depth
+        if len(level):
+            depth = int(level[-1])
+
+        # a record ends where a closing brace returns to the array itself
+        closes = (level == 0) & (kind[bracket] == _CLOSING_BRACE)
+        block_ends = position[bracket][closes] + offset + 1
+        while target is not None:
+            i = np.searchsorted(block_ends, target)
+            if i == len(block_ends):
+                break
+            ends.append(int(block_ends[i]))
+            target = next(targets, None)
+    return ends
+
+
+def _split_records(data, nchunks):
+    """
+    Split the body of a top-level JSON array into about ``nchunks``
+    pieces between its records.
+    """
+    start, stop = data.index(b"[") + 1, data.rindex(b"]")
+    targets = [
+        start + (stop - start) * i // nchunks for i in range(1, nchunks)
+    ]
+    bounds = [start] + _record_ends(data, start, stop, targets) + [stop]
+    return [
+        (begin, end)
+        for begin, end in zip(bounds[:-1], bounds[1:])
+        if end > begin
+    ]
+
+
+def _piece(data, begin, end):
+    """
+    A piece of the array body as an array of its own.
+    """
+    return b"[" + data[begin:end].strip().lstrip(b",") + b"]"
+
+
+def _parse_records_parallel(data):
+    """
+    Parse a JSON array of records concurrently, in chunks.
+    """
+    if len(data) < _PARALLEL_JSON_BYTES:
+        return [_parse_records(data)]
+
+    pieces = _split_records(data, 4 * (os.cpu_count() or 1))
+    futures = [
+        _get_pool().submit(_parse_records, _piece(data, begin, end))
+        for begin, end in pieces
+    ]
+    return [future.result() for future in futures]
+
+
+def _try_convert(values):
+    """
+    Coerce values as ``pd.read_json`` does with ``dtype=True``.
+    """
+    if values.dtype == object:
+        try:
+            values = values.astype(np.float64)
+        except (TypeError, ValueError):
+            pass
+    if len(values) and values.dtype.kind in "fO":
+        try:
+            as_int = values.astype(np.int64)
+            if (as_int == values).all():
+                values = as_int
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return values
+
+
+def _concat_values(chunks):
+    kinds = {values.dtype.kind for values in chunks}
+    if len(kinds) > 1 and kinds & {"b", "O"}:
+        chunks = [values.astype(object) for values in chunks]
+    return np.concatenate(chunks)
+
+
+def _is_date_like(key):
+    if not isinstance(key, str):
+        return False
+    key = key.lower()
+    return (
+        key.endswith("_at")
+        or key.endswith("_time")
+        or key.startswith("timestamp")
+        or key in ("modified", "date", "datetime")
+    )
+
+
+def _read_json_records(data, convert_dates=True):
+    """
+    Read a JSON array of records into a DataFrame, parsing it in chunks
+    in a pool of processes and building the columns from the parsed
+    values directly. Returns None if ``data`` is not an array of records,
+    or needs date conversions.
+    """
+    try:
+        results = _parse_records_parallel(data)
+    except (_NotRecords, ValueError):
+        # left to pandas, which reports errors
+        return None
+
+    keys = OrderedDict()
+    for _, arrays in results:
+        keys.update(OrderedDict.fromkeys(arrays))
+    if len(keys) == 0:
+        return None
+    if convert_dates and any(map(_is_date_like, keys)):
+        return None
+
+    data = OrderedDict()
+    for key in keys:
+        chunks = [
+            arrays[key] if key in arrays else np.full(nrows, np.nan)
+            for nrows, arrays in results
+        ]
+        data[key] = _try_convert(_concat_values(chunks))
+
+    batched = [key for key in data if _transfer.is_batchable_array(data[key])]
+    columns = _transfer.arrays_to_device([data[key] for key in batched])
+    columns = dict(zip(batched, columns))
+    for key, values in data.items():
+        if key not in columns:
+            columns[key] = as_column(values)
+    # the keys are converted as pandas converts the axes
+    labels = _try_convert(np.array(list(data), dtype=object)).tolist()
+    return cudf.DataFrame(
+        ColumnAccessor(
+            OrderedDict(
+                (label, columns[key]) for label, key in zip(labels, data)
+            )
+        )
+    )
+
+
+def _records_bytes(path_or_buf, compression):
+    """
+    The bytes of the JSON input, or None if they are compressed.
+    """
+    if isinstance(path_or_buf, str) and os.path.isfile(path_or_buf):
+        if compression not in (None, "infer") or (
+            compression == "infer"
+            and path_or_buf.endswith(_compression_extensions)
+        ):
+            return None
+        with open(path_or_buf, "rb") as f:
+            return f.read()
+    if isinstance(path_or_buf, str):
+        return path_or_buf.encode("utf8")
+    if isinstance(path_or_buf, StringIO):
+        return path_or_buf.getvalue().encode("utf8")
+    if isinstance(path_or_buf, BytesIO) and compression in (None, "infer"):
+        return path_or_buf.getvalue()
+    return None
+
+
+def _dtype_name(dtype):
+    """
+    The name of ``dtype`` understood by the libcudf JSON reader, which
+    also accepts its own names such as ``'str'`` or ``'timestamp[ms]'``.
+    """
+    if isinstance(dtype, str) and not (
+        dtype.startswith("datetime64") or dtype in ("object", "O")
+    ):
+        return dtype
+    dtype = np.dtype(dtype)
+    if dtype.kind in "OSU":
+        return "str"
+    if dtype.kind == "M":
+        return "timestamp[{}]".format(np.datetime_data(dtype)[0])
+    return dtype.name
+
+
+def _dtype_names(dtype):
+    if dtype is True or dtype is False:
+        return dtype
+    if isinstance(dtype, dict):
+        return {k: _dtype_name(v) for k, v in dtype.items()}
+    return [_dtype_name(v) for v in dtype]
+
+
+def _head(path_or_buf, nrows, compression, storage_options=None):
+    """
+    The first ``nrows`` lines of JSON Lines input, as bytes; the rest of
+    the input is not read.
+    """
+    if isinstance(path_or_buf, os.PathLike):
+        path_or_buf = os.fspath(path_or_buf)
+    if isinstance(path_or_buf, str):
+        if path_or_buf.lstrip().startswith(("{", "[")):
+            # the input is the JSON data itself
+            return b"".join(islice(BytesIO(path_or_buf.encode()), nrows))
+        with fsspec.open(
+            os.path.expanduser(path_or_buf),
+            mode="rb",
+            compression=compression,
+            **(storage_options or {}),
+        ) as f:
+            return b"".join(islice(f, nrows))
+    if isinstance(path_or_buf, (bytes, bytearray)):
+        return b"".join(islice(BytesIO(path_or_buf), nrows))
+
+    # the buffer is left where it was, to be read again
+    position = path_or_buf.tell() if path_or_buf.seekable() else None
+    lines = list(islice(path_or_buf, nrows))
+    if position is not None:
+        path_or_buf.seek(position)
+    if lines and isinstance(lines[0], str):
+        return "".join(lines).encode()
+    return b"".join(lines)
+
+
+@ioutils.doc_read_json_schema()
+def read_json_schema(
+    path_or_buf, nrows=1000, columns=None, compression="infer", **kwargs
+):
+    """{docstring}"""
+
+    data = _head(
+        path_or_buf, nrows, compression, kwargs.get("storage_options")
+    )
+    df = libjson.read_json(data, True, True, None, None, columns)
+    return OrderedDict(zip(df.columns, df.dtypes))
+
 
 @ioutils.doc_read_json()
 def read_json(
@@ -19,6 +404,7 @@ def read_json(
     compression="infer",
     byte_range=None,
     *args,
+    columns=None,
     **kwargs,
 ):
     """{docstring}"""
@@ -32,10 +418,34 @@ def read_json(
         path_or_buf, compression, (BytesIO, StringIO), **kwargs
     )
     if engine == "cudf":
+        if columns is not None and not isinstance(dtype, (bool, dict)):
+            # a list of dtypes is in the order of ``columns``
+            dtype = dict(zip(columns, dtype))
         df = libjson.read_json(
-            path_or_buf, dtype, lines, compression, byte_range
+            path_or_buf,
+            _dtype_names(dtype),
+            lines,
+            compression,
+            byte_range,
+            columns,
         )
     else:
+        # arrays of records are parsed in parallel, without pandas
+        if (
+            not lines
+            and dtype is True
+            and not args
+            and kwargs.get("orient") in (None, "columns", "records")
+            and set(kwargs) <= {"orient", "convert_dates"}
+        ):
+            data = _records_bytes(path_or_buf, compression)
+            if data is not None and data.lstrip().startswith(b"["):
+                df = _read_json_records(
+                    data, convert_dates=kwargs.get("convert_dates", True)
+                )
+                if df is not None:
+                    return df if columns is None else df[list(columns)]
+
         warnings.warn(
             "Using CPU via Pandas to read JSON dataset, this may "
             "be GPU accelerated in the future"
@@ -59,6 +469,9 @@ def read_json(
             )
         df = cudf.from_pandas(pd_value)
 
+    if columns is not None:
+        # the cudf engine returns the columns in the order of the fields
+        df = df[list(columns)]
     return df
 
 
@@ -81,4 +81,5 @@ def read_orc(
 def to_orc(df, fname, compression=None, enable_statistics=False):
     """{docstring}"""
 
+    df = ioutils.decode_categorical_columns(df)
     libcudfxx.orc.write_orc(df, fname, compression, enable_statistics)
@@ -53,6 +53,11 @@ def read_parquet(
             strings_to_categorical,
             use_pandas_metadata,
         )
+        if strings_to_categorical:
+            # the columns with plain-encoded pages are read as strings
+            for name, col in list(df._data.items()):
+                if col.dtype == "object":
+                    df[name] = df[name].astype("category")
     else:
         warnings.warn("Using CPU via PyArrow to read Parquet dataset.")
         pa_table = pq.read_pandas(
@@ -84,14 +89,7 @@ def to_parquet(
                 + "gpu accelerated parquet writer"
             )
 
-        # Ensure that no columns dtype is 'category'
-        for col in df.columns:
-            if df[col].dtype.name == "category":
-                raise ValueError(
-                    "'category' column dtypes are currently not "
-                    + "supported by the gpu accelerated parquet writer"
-                )
-
+        df = ioutils.decode_categorical_columns(df)
         return libparquet.write_parquet(
             df, path, index, compression=compression, statistics=statistics
         )
@@ -1,4 +1,5 @@
 import pytest
+from numba import cuda
 
 import cudf
 from cudf.core.column import column
@@ -50,3 +51,97 @@ def test_dataframe_apply_rows(dtype, has_nulls, pessimistic):
     )
 
     assert_eq(df_expected, df_actual)
+
+
+def test_dataframe_apply_rows_content_token():
+    from cudf.utils import cudautils
+
+    factor = 2
+
+    def scale(a, out):
+        for i, x in enumerate(a):
+            out[i] = x * factor
+
+    def scale_by(a, out, k):
+        for i, x in enumerate(a):
+            out[i] = x * k
+
+    token = cudautils.function_content_token(scale)
+    assert token is not None
+    assert token == cudautils.function_content_token(scale)
+
+    factor = 3
+    assert token != cudautils.function_content_token(scale)
+
+    # functions capturing arbitrary objects aren't content addressable
+    captured = object()
+    assert cudautils.function_content_token(lambda a, out: captured) is None
+
+    df = cudf.DataFrame({"a": [1.0, 2.0, 3.0]})
+    got = df.apply_rows(scale_by, ["a"], {"out": "float64"}, {"k": 2.0})
+    assert_eq(got["out"], df["a"] * 2.0, check_names=False)
+
+
+def _kernel_fill_nulls(a, a_valid, b, b_valid, out, out_valid):
+    for i in range(a.size):
+        if a_valid[i] and b_valid[i]:
+            out[i] = a[i] + b[i]
+        elif a_valid[i]:
+            out[i] = a[i]
+        else:
+            out_valid[i] = False
+
+
+def _chunk_fill_nulls(a, a_valid, b, b_valid, out, out_valid):
+    for i in range(cuda.threadIdx.x, a.size, cuda.blockDim.x):
+        if a_valid[i] and b_valid[i]:
+            out[i] = a[i] + b[i]
+        elif a_valid[i]:
+            out[i] = a[i]
+        else:
+            out_valid[i] = False
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_dataframe_apply_rows_null_aware(chunked):
+    df = cudf.DataFrame(
+        {"a": [1.0, None, 3.0, 4.0, None], "b": [1.0, 2.0, None, 4.0, 5.0]}
+    )
+    kwargs = dict(
+        incols=["a", "b"],
+        outcols={"out": "float64"},
+        kwargs={},
+        null_aware=True,
+    )
+    if chunked:
+        got = df.apply_chunks(_chunk_fill_nulls, chunks=2, tpb=2, **kwargs)
+    else:
+        got = df.apply_rows(_kernel_fill_nulls, **kwargs)
+
+    expect = cudf.Series([2.0, None, 3.0, 8.0, None], name="out")
+    assert_eq(got["out"], expect)
+    # the inputs are left as is
+    assert_eq(got[["a", "b"]], df)
+
+
+def test_apply_rows_batched():
+    frames = [
+        cudf.DataFrame({"a": [1.0, 2.0, None], "b": [3.0, 4.0, 5.0]}),
+        cudf.DataFrame({"a": [6.0], "b": [7.0]}, index=[10]),
+        cudf.DataFrame({"a": [8.0, 9.0], "b": [None, 1.0]}),
+    ]
+    got = cudf.apply_rows(
+        frames, _kernel_multiply, ["a", "b"], {"out": "float64"}, {}
+    )
+    assert len(got) == len(frames)
+    for df, res in zip(frames, got):
+        expect = df.apply_rows(
+            _kernel_multiply, ["a", "b"], {"out": "float64"}, {}
+        )
+        assert_eq(res, expect)
+
+    frames[1]["a"] = frames[1]["a"].astype("float32")
+    with pytest.raises(ValueError):
+        cudf.apply_rows(
+            frames, _kernel_multiply, ["a", "b"], {"out": "float64"}, {}
+        )
@@ -60,3 +60,47 @@ def test_applymap_change_out_dtype():
     expect = np.array(data, dtype=float)
     got = out.to_array()
     np.testing.assert_array_equal(expect, got)
+
+
+def test_applymap_kernel_cache():
+    from cudf.utils.cudautils import kernel_cache
+
+    sr = Series(np.arange(10, dtype=np.float64))
+
+    def add(k):
+        return lambda x: x + k
+
+    kernel_cache.clear()
+    for _ in range(3):
+        got = sr.applymap(add(1))
+        np.testing.assert_array_equal(got.to_array(), np.arange(1, 11))
+    info = kernel_cache.info()
+    assert (info.hits, info.misses) == (2, 1)
+
+    # a different closure value compiles a new kernel
+    got = sr.applymap(add(2))
+    np.testing.assert_array_equal(got.to_array(), np.arange(2, 12))
+    assert kernel_cache.info().misses == 2
+
+    # so does a different input dtype
+    got = sr.astype(np.int32).applymap(add(2))
+    np.testing.assert_array_equal(got.to_array(), np.arange(2, 12))
+    assert kernel_cache.info().misses == 3
+
+
+@pytest.mark.parametrize("masked", [True, False])
+def test_column_applymap_kernel_cache(masked):
+    from cudf.utils.cudautils import kernel_cache
+
+    sr = Series([1.0, None, 3.0] if masked else [1.0, 2.0, 3.0])
+
+    kernel_cache.clear()
+    for _ in range(2):
+        got = Series(sr._column.applymap(lambda x: x * 2))
+        if masked:
+            assert got.null_count == 1
+        np.testing.assert_array_equal(
+            got.fillna(0).to_array(), sr.fillna(0).to_array() * 2
+        )
+    info = kernel_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
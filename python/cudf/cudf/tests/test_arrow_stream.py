@@ -0,0 +1,75 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import socket
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+
+@pytest.fixture
+def pdf():
+    np.random.seed(0)
+    nrows = 1000
+    return pd.DataFrame(
+        {
+            "a": np.arange(nrows),
+            "b": np.random.random(nrows),
+            "c": ["x", "yy", None, "zzz"] * (nrows // 4),
+        }
+    )
+
+
+@pytest.mark.parametrize("batch_rows", [None, 1, 300, 5000])
+def test_arrow_stream_file(tmpdir, pdf, batch_rows):
+    fname = tmpdir.join("stream.arrow")
+    gdf = cudf.from_pandas(pdf)
+    gdf.to_arrow_stream(str(fname), chunksize=100)
+
+    frames = list(cudf.read_arrow_stream(str(fname), batch_rows=batch_rows))
+    if batch_rows is None:
+        assert len(frames) == 1
+    else:
+        assert all(len(df) >= batch_rows for df in frames[:-1])
+    assert_eq(cudf.concat(frames), gdf)
+
+
+def test_arrow_stream_columns(pdf):
+    gdf = cudf.from_pandas(pdf).set_index("a")
+    sink = pa.BufferOutputStream()
+    gdf.to_arrow_stream(sink)
+
+    stream = sink.getvalue()
+    got = cudf.concat(list(cudf.read_arrow_stream(stream, columns=["c"])))
+    assert_eq(got, gdf[["c"]])
+
+
+def test_arrow_stream_missing_column(pdf):
+    sink = pa.BufferOutputStream()
+    cudf.from_pandas(pdf).to_arrow_stream(sink)
+
+    with pytest.raises(KeyError):
+        list(cudf.read_arrow_stream(sink.getvalue(), columns=["typo"]))
+
+
+def test_arrow_stream_socket(pdf):
+    gdf = cudf.from_pandas(pdf)
+    reader, writer = socket.socketpair()
+
+    def produce():
+        with writer:
+            gdf.to_arrow_stream(writer, chunksize=10)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    with reader:
+        frames = list(cudf.read_arrow_stream(reader, batch_bytes=4096))
+    producer.join()
+
+    assert len(frames) > 1
+    assert_eq(cudf.concat(frames), gdf)
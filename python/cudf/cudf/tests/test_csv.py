@@ -1442,3 +1442,55 @@ def test_csv_writer_chunksize(chunksize, tmpdir):
     expect = pd.read_csv(pdf_df_fname)
     got = pd.read_csv(gdf_df_fname)
     assert_eq(expect, got)
+
+
+def test_csv_writer_index_not_modified():
+    gdf = cudf.DataFrame({"a": [1, 2, 3], "b": ["x", "yy", "zzz"]})
+    gdf.index = [10, 20, 30]
+
+    got = gdf.to_csv(columns=["b"])
+    assert got.splitlines() == ['"","b"', '10,"x"', '20,"yy"', '30,"zzz"']
+    assert gdf.index.name is None
+    assert list(gdf.columns) == ["a", "b"]
+
+
+@pytest.mark.parametrize("chunksize", [None, 8, 24])
+@pytest.mark.parametrize("target", ["bytes_io", "string_io", "text_file"])
+def test_csv_writer_file_like(tmpdir, chunksize, target):
+    pdf = make_numpy_mixed_dataframe()
+    pdf = pd.concat([pdf] * 10, ignore_index=True)
+    gdf = cudf.from_pandas(pdf)
+    expect = gdf.to_csv(index=False)
+
+    if target == "bytes_io":
+        buffer = BytesIO()
+        gdf.to_csv(buffer, index=False, chunksize=chunksize)
+        got = buffer.getvalue().decode()
+    elif target == "string_io":
+        buffer = StringIO()
+        gdf.to_csv(buffer, index=False, chunksize=chunksize)
+        got = buffer.getvalue()
+    else:
+        fname = tmpdir.join("file_like.csv")
+        with open(fname, "w") as f:
+            f.write("# comment\n")
+            gdf.to_csv(f, index=False, chunksize=chunksize)
+        with open(fname) as f:
+            assert f.readline() == "# comment\n"
+            got = f.read()
+    assert got == expect
+
+
+@pytest.mark.parametrize(
+    "ext, compression", [(".csv.gz", "infer"), (".csv", "gzip")]
+)
+def test_csv_writer_compression(tmpdir, ext, compression):
+    pdf = make_numeric_dataframe(100, np.int32)
+    gdf = cudf.from_pandas(pdf)
+    fname = str(tmpdir.join("compressed" + ext))
+
+    gdf.to_csv(fname, index=False, chunksize=16, compression=compression)
+
+    with gzip.open(fname, "rt") as f:
+        got = pd.read_csv(f)
+    assert_eq(pdf, got)
@@ -1033,6 +1033,40 @@ def test_from_pandas():
     pd.testing.assert_series_equal(s, gs.to_pandas())
 
 
+@pytest.mark.parametrize("pool_size", [None, 1024])
+def test_from_pandas_to_pandas_batched(pool_size):
+    from cudf.core import _transfer
+
+    np.random.seed(0)
+    nrows = 1000
+    pdf = pd.DataFrame()
+    for i, dtype in enumerate(["int8", "int32", "int64", "float32"] * 25):
+        pdf["c%d" % i] = np.random.randint(-9, 9, nrows).astype(dtype)
+    pdf["nans"] = np.where(np.arange(nrows) % 3, 1.5, np.nan)
+    pdf["bools"] = np.arange(nrows) % 2 == 0
+    pdf["times"] = pd.date_range("2020-01-01", periods=nrows, freq="s")
+    pdf.loc[::7, "times"] = None
+    pdf["strings"] = ["a", "bb", None, "ccc"] * (nrows // 4)
+
+    pool = _transfer.pinned_memory_pool
+    default_size = pool.max_bytes
+    if pool_size is not None:
+        pool.max_bytes = pool_size
+    try:
+        gdf = gd.DataFrame.from_pandas(pdf)
+        assert gdf["nans"].null_count == pdf["nans"].isna().sum()
+        assert gdf["times"].null_count == pdf["times"].isna().sum()
+        assert_eq(pdf, gdf)
+        assert_eq(pdf, gdf.to_pandas())
+
+        # null integers come back filled, as by Series.to_pandas
+        gdf["nulls"] = gd.Series([1, None] * (nrows // 2))
+        expect = gdf["nulls"].to_pandas()
+        pd.testing.assert_series_equal(gdf.to_pandas()["nulls"], expect)
+    finally:
+        pool.max_bytes = default_size
+
+
 @pytest.mark.parametrize("dtypes", [int, float])
 def test_from_records(dtypes):
     h_ary = np.ndarray(shape=(10, 4), dtype=dtypes)
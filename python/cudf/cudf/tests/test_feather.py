@@ -99,3 +99,30 @@ def test_feather_writer(tmpdir, pdf, gdf):
     got = pa.feather.read_table(gdf_fname)
 
     assert pa.Table.equals(expect, got)
+
+
+@pytest.mark.filterwarnings("ignore:Strings are not yet supported")
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_feather_reader_memory_map(feather_file, memory_map):
+    columns = ["col_int64", "col_float32"]
+    expect = pa.feather.read_table(feather_file, columns=columns).to_pandas()
+    got = cudf.read_feather(
+        str(feather_file), columns=columns, memory_map=memory_map
+    )
+
+    assert_eq(expect, got)
+
+
+def test_feather_roundtrip_nulls(tmpdir):
+    gdf = cudf.DataFrame(
+        {
+            "a": [1, None, 3, None],
+            "b": [0.5, 1.5, None, 3.5],
+            "c": cudf.Series([1, 2, 3, 4], dtype="datetime64[ms]"),
+        }
+    )
+    fname = tmpdir.join("nulls.feather")
+    gdf.to_feather(fname)
+
+    assert_eq(pa.feather.read_table(fname).to_pandas(), gdf.to_pandas())
+    assert_eq(cudf.read_feather(fname), gdf)
@@ -692,6 +692,29 @@ def test_groupby_datetime_multi_agg_multi_groupby():
     assert_eq(pdg, gdg)
 
 
+@pytest.mark.parametrize("sort", [True, False])
+def test_groupby_many_aggs_per_column(sort):
+    pdf = pd.DataFrame(
+        {
+            "a": np.random.randint(0, 10, 100),
+            "b": np.random.randint(0, 3, 100),
+            "x": np.random.random(100),
+            "y": np.random.randint(0, 100, 100),
+        }
+    )
+    pdf.loc[::7, "x"] = np.nan
+    gdf = cudf.from_pandas(pdf)
+
+    aggs = {"x": ["min", "max", "sum", "count", "mean"], "y": ["sum", "max"]}
+    pdg = pdf.groupby(["a", "b"], sort=sort).agg(aggs)
+    gdg = gdf.groupby(["a", "b"], sort=sort).agg(aggs)
+    if not sort:
+        pdg = pdg.sort_index()
+        gdg = gdg.sort_index()
+
+    assert_eq(pdg, gdg, check_dtype=False)
+
+
 @pytest.mark.parametrize("agg", ["min", "max", "sum", "count", "mean"])
 def test_groupby_nulls_basic(agg):
     check_dtype = False if agg == "count" else True
@@ -850,6 +873,52 @@ def test_groupby_std():
     assert_eq(pdresult, gdresult)
 
 
+@pytest.mark.parametrize(
+    "agg",
+    ["var", "std", "median", "nunique", "first", "last", "idxmin", "idxmax"],
+)
+def test_groupby_extended_aggs(agg):
+    pdf = pd.DataFrame(
+        {
+            "a": np.random.randint(0, 5, 50),
+            "x": np.random.random(50),
+            "y": np.random.randint(0, 10, 50),
+        },
+        index=np.random.permutation(np.arange(100, 150)),
+    )
+    pdf.loc[pdf.index[::6], "x"] = np.nan
+    gdf = cudf.from_pandas(pdf)
+
+    assert_eq(
+        getattr(pdf.groupby("a"), agg)(),
+        getattr(gdf.groupby("a"), agg)(),
+        check_dtype=False,
+    )
+    assert_eq(
+        getattr(pdf.groupby("a").x, agg)(),
+        getattr(gdf.groupby("a").x, agg)(),
+        check_dtype=False,
+    )
+
+
+def test_groupby_extended_aggs_single_pass():
+    pdf = pd.DataFrame(
+        {
+            "a": np.random.randint(0, 5, 50),
+            "x": np.random.random(50),
+            "y": np.random.randint(0, 10, 50),
+        }
+    )
+    gdf = cudf.from_pandas(pdf)
+
+    aggs = {"x": ["var", "median", "first", "size"], "y": ["nunique", "last"]}
+    assert_eq(
+        pdf.groupby("a").agg(aggs),
+        gdf.groupby("a").agg(aggs),
+        check_dtype=False,
+    )
+
+
 def test_groupby_size():
     pdf = pd.DataFrame(
         {
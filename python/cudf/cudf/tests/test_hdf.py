@@ -113,6 +113,39 @@ def test_hdf_reader(hdf_files, columns):
         assert_eq(expect_series, got_series)
 
 
+@pytest.mark.filterwarnings("ignore:Strings are not yet supported")
+@pytest.mark.parametrize("format", ["fixed", "table"])
+@pytest.mark.parametrize("columns", [None, ["b", "d"], ["c"]])
+@pytest.mark.parametrize("start, stop", [(None, None), (10, 777), (500, None)])
+def test_hdf_reader_rows_and_columns(tmpdir, format, columns, start, stop):
+    nrows = 1000
+    pdf = pd.DataFrame(
+        {
+            "a": np.arange(nrows, dtype="int32"),
+            "b": np.where(np.arange(nrows) % 5, 0.5, np.nan),
+            "c": ["x", "yy", "zzz", "w"] * (nrows // 4),
+            "d": pd.date_range("2020-01-01", periods=nrows, freq="min"),
+        },
+        index=pd.Index(np.arange(nrows) * 2, name="idx"),
+    )
+    fname = tmpdir.join("rows.hdf")
+    pdf.to_hdf(fname, "df", format=format)
+
+    expect = pdf.iloc[slice(start, stop)]
+    if columns is not None:
+        expect = expect[columns]
+    got = cudf.read_hdf(fname, columns=columns, start=start, stop=stop)
+    assert_eq(expect, got)
+
+    chunks = list(
+        cudf.read_hdf(
+            fname, columns=columns, start=start, stop=stop, chunksize=128
+        )
+    )
+    assert all(len(chunk) == 128 for chunk in chunks[:-1])
+    assert_eq(expect, cudf.concat(chunks))
+
+
 @pytest.mark.parametrize("format", ["fixed", "table"])
 @pytest.mark.parametrize("complib", ["zlib", "bzip2", "lzo", "blosc"])
 @pytest.mark.filterwarnings("ignore:Using CPU")
@@ -159,3 +192,42 @@ def test_hdf_writer(tmpdir, pdf, gdf, complib, format):
         got_series = pd.read_hdf(gdf_series_fname)
 
         assert_eq(expect_series, got_series)
+
+
+@pytest.mark.filterwarnings("ignore:Strings are not yet supported")
+def test_hdf_reader_fixed_mixed_blocks(tmpdir, monkeypatch):
+    nrows = 1000
+    pdf = pd.DataFrame(
+        {
+            "a": np.arange(nrows, dtype="int64"),
+            "b": ["x", "yy", "zzz", "w"] * (nrows // 4),
+            "c": np.arange(nrows) * 0.5,
+            "d": pd.date_range("2020-01-01", periods=nrows, freq="min"),
+        }
+    )
+    fname = tmpdir.join("mixed.hdf")
+    pdf.to_hdf(fname, "df", format="fixed")
+
+    # past the first row, which describes the columns, pandas reads the
+    # block of the strings only, not the native blocks
+    read_keys = []
+    read_array = pd.io.pytables.GenericFixed.read_array
+
+    def spy(self, key, start=None, stop=None):
+        if start:
+            read_keys.append(key)
+        return read_array(self, key, start=start, stop=stop)
+
+    monkeypatch.setattr(pd.io.pytables.GenericFixed, "read_array", spy)
+    chunks = list(cudf.read_hdf(fname, start=10, stop=900, chunksize=128))
+    assert_eq(pdf.iloc[10:900], cudf.concat(chunks))
+
+    with pd.HDFStore(fname) as store:
+        storer = store.get_storer("df")
+        storer.infer_axes()
+        object_blocks = {
+            "block{}_values".format(i)
+            for i in range(storer.nblocks)
+            if "b" in list(storer.read_index("block{}_items".format(i)))
+        }
+    assert read_keys and set(read_keys) == object_blocks
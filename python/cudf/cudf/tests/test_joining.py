@@ -1001,3 +1001,246 @@ def test_typecast_on_join_categorical(dtype_l, dtype_r):
 
     got = gdf_l.merge(gdf_r, on="join_col", how="inner")
     assert_eq(expect, got, check_dtype=False)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "leftsemi", "leftanti"])
+@pytest.mark.parametrize("on", ["a", ["a", "b"]])
+def test_prepared_join(how, on):
+    np.random.seed(0)
+    pdf_right = pd.DataFrame(
+        {
+            "a": np.random.randint(0, 10, 20),
+            "b": np.random.randint(0, 3, 20),
+            "r": np.arange(20, dtype="float64"),
+        }
+    )
+    gdf_right = DataFrame.from_pandas(pdf_right)
+    prepared = gdf_right.prepare_join(on=on)
+    assert prepared.memory_usage() > 0
+
+    # Probe the same prepared build side with several batches
+    for seed in range(3):
+        np.random.seed(seed)
+        pdf_left = pd.DataFrame(
+            {
+                "a": np.random.randint(0, 15, 30),
+                "b": np.random.randint(0, 3, 30),
+                "l": np.arange(30, dtype="float64"),
+            }
+        )
+        gdf_left = DataFrame.from_pandas(pdf_left)
+
+        if how in ["leftsemi", "leftanti"]:
+            keys = pdf_right[on if isinstance(on, list) else [on]]
+            keys = keys.drop_duplicates()
+            merged = pdf_left.merge(keys, on=on, how="left", indicator=True)
+            matched = (merged["_merge"] == "both").values
+            expect = pdf_left[matched if how == "leftsemi" else ~matched]
+        else:
+            expect = pdf_left.merge(pdf_right, on=on, how=how)
+        got = prepared.join(gdf_left, how=how)
+
+        sort_by = list(expect.columns)
+        assert_eq(
+            expect.sort_values(sort_by).reset_index(drop=True),
+            got.sort_values(sort_by).reset_index(drop=True),
+            check_dtype=False,
+        )
+
+
+def test_prepared_join_suffixes():
+    left = DataFrame({"key": [1, 2, 3], "val": [1.0, 2.0, 3.0]})
+    right = DataFrame({"key": [3, 1, 1], "val": [10.0, 11.0, 12.0]})
+
+    expect = left.to_pandas().merge(right.to_pandas(), on="key", how="inner")
+    got = right.prepare_join(on="key").join(left, how="inner")
+
+    assert list(got.columns) == ["key", "val_x", "val_y"]
+    assert_eq(
+        expect.sort_values(["key", "val_y"]).reset_index(drop=True),
+        got.sort_values(["key", "val_y"]).reset_index(drop=True),
+    )
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_prepared_join_null_keys(how):
+    # sorted with the nulls first, which the probe doesn't expect
+    right = DataFrame({"key": [None, None, 1, 2, 4], "r": np.arange(5.0)})
+    left = DataFrame({"key": [4, 1, 3, 2], "l": np.arange(4.0)})
+
+    expect = left.merge(right, on="key", how=how, method="hash")
+    got = right.prepare_join(on="key").join(left, how=how)
+    assert_eq(
+        expect.sort_values("l").reset_index(drop=True),
+        got.sort_values("l").reset_index(drop=True),
+    )
+
+
+def test_prepared_join_invalid():
+    right = DataFrame({"key": [1, 2, 3]})
+    with pytest.raises(KeyError):
+        right.prepare_join(on="missing")
+
+    prepared = right.prepare_join(on="key")
+    with pytest.raises(NotImplementedError):
+        prepared.join(DataFrame({"key": [1]}), how="outer")
+    with pytest.raises(TypeError):
+        prepared.join(DataFrame({"key": [1.5]}), how="inner")
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+@pytest.mark.parametrize("presorted", [True, False])
+def test_sort_merge_join(how, presorted):
+    np.random.seed(0)
+    pdf_left = pd.DataFrame(
+        {"key": np.random.randint(0, 20, 50), "l": np.arange(50.0)}
+    )
+    pdf_right = pd.DataFrame(
+        {"key": np.random.randint(0, 20, 30), "r": np.arange(30.0)}
+    )
+    if presorted:
+        pdf_left = pdf_left.sort_values("key").reset_index(drop=True)
+        pdf_right = pdf_right.sort_values("key").reset_index(drop=True)
+    gdf_left = DataFrame.from_pandas(pdf_left)
+    gdf_right = DataFrame.from_pandas(pdf_right)
+
+    expect = pdf_left.merge(pdf_right, on="key", how=how)
+    got = gdf_left.merge(gdf_right, on="key", how=how, method="sort")
+    if presorted:
+        # Both inputs are sorted, so the output is sorted without a re-sort
+        assert got["key"].is_monotonic_increasing
+        assert_eq(
+            expect.sort_values(["key", "l", "r"]).reset_index(drop=True),
+            got.sort_values(["key", "l", "r"]).reset_index(drop=True),
+        )
+        # method="hash" detects the sorted inputs and agrees
+        assert_eq(got, gdf_left.merge(gdf_right, on="key", how=how))
+    else:
+        assert_eq(
+            expect.sort_values(["key", "l", "r"]).reset_index(drop=True),
+            got.sort_values(["key", "l", "r"]).reset_index(drop=True),
+        )
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_sort_merge_join_null_keys(how):
+    # sorted with the nulls first, so not merged as sorted inputs
+    pdf_left = pd.DataFrame(
+        {"key": [None, None, 1, 2, 2, 4], "l": np.arange(6.0)}
+    )
+    pdf_right = pd.DataFrame({"key": [1, 2, 3, 4], "r": np.arange(4.0)})
+    gdf_left = DataFrame.from_pandas(pdf_left)
+    gdf_right = DataFrame.from_pandas(pdf_right)
+
+    expect = pdf_left.merge(pdf_right, on="key", how=how)
+    got = gdf_left.merge(gdf_right, on="key", how=how)
+    assert_eq(
+        expect.sort_values("l").reset_index(drop=True),
+        got.sort_values("l").reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize("direction", ["backward", "forward", "nearest"])
+@pytest.mark.parametrize("allow_exact_matches", [True, False])
+@pytest.mark.parametrize("by", [None, "sym"])
+def test_merge_asof(direction, allow_exact_matches, by):
+    np.random.seed(0)
+    left = pd.DataFrame(
+        {
+            "t": np.sort(np.random.choice(100, 20, replace=False)),
+            "sym": np.random.randint(0, 3, 20),
+            "lval": np.arange(20.0),
+        }
+    )
+    right = pd.DataFrame(
+        {
+            "t": np.sort(np.random.choice(100, 30, replace=False)),
+            "sym": np.random.randint(0, 3, 30),
+            "rval": np.arange(30.0),
+        }
+    )
+    if by is None:
+        left = left.drop(columns="sym")
+        right = right.drop(columns="sym")
+
+    kwargs = dict(
+        on="t",
+        by=by,
+        direction=direction,
+        allow_exact_matches=allow_exact_matches,
+    )
+    expect = pd.merge_asof(left, right, **kwargs)
+    got = cudf.merge_asof(
+        DataFrame.from_pandas(left), DataFrame.from_pandas(right), **kwargs
+    )
+    assert_eq(expect, got, check_dtype=False)
+
+
+def test_merge_asof_tolerance_datetime():
+    left = pd.DataFrame(
+        {
+            "t": pd.to_datetime(
+                ["2020-01-01 00:00:05", "2020-01-01 00:01:00"]
+            ),
+            "lval": [1, 2],
+        }
+    )
+    right = pd.DataFrame(
+        {
+            "t": pd.to_datetime(
+                ["2020-01-01 00:00:00", "2020-01-01 00:00:30"]
+            ),
+            "rval": [10.0, 20.0],
+        }
+    )
+    expect = pd.merge_asof(left, right, on="t", tolerance=pd.Timedelta("10s"))
+    got = cudf.merge_asof(
+        DataFrame.from_pandas(left),
+        DataFrame.from_pandas(right),
+        on="t",
+        tolerance=pd.Timedelta("10s"),
+    )
+    assert_eq(expect, got, check_dtype=False)
+
+
+@pytest.mark.parametrize("how", ["leftsemi", "leftanti"])
+def test_merge_semi_anti(how):
+    np.random.seed(0)
+    pdf_left = pd.DataFrame(
+        {
+            "key": np.random.randint(0, 20, 50),
+            "val": np.arange(50.0),
+            "other": np.arange(50),
+        }
+    )
+    pdf_right = pd.DataFrame(
+        {"key": np.random.randint(0, 20, 30), "val": np.arange(30.0)}
+    )
+    gdf_left = DataFrame.from_pandas(pdf_left)
+    gdf_right = DataFrame.from_pandas(pdf_right).astype({"key": "int32"})
+
+    matched = pdf_left["key"].isin(pdf_right["key"])
+    expect = pdf_left[matched if how == "leftsemi" else ~matched]
+    got = gdf_left.merge(gdf_right, on="key", how=how)
+
+    # Only the left columns, in the left row order and dtypes
+    assert list(got.columns) == list(pdf_left.columns)
+    assert_eq(expect.reset_index(drop=True), got)
+
+
+def test_merge_semi_anti_index_not_supported():
+    left = DataFrame({"key": [1, 2, 3]})
+    right = DataFrame({"key": [1, 2]})
+    with pytest.raises(NotImplementedError):
+        left.merge(right, left_index=True, right_index=True, how="leftsemi")
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "leftsemi", "leftanti"])
+def test_prepared_join_size(how):
+    right = DataFrame({"key": [1, 1, 2, 4, 4, 4]})
+    left = DataFrame({"key": [1, 3, 4, 4], "val": [1, 2, 3, 4]})
+    prepared = right.prepare_join(on="key")
+    assert prepared.join_size(left, how=how) == len(
+        prepared.join(left, how=how)
+    )
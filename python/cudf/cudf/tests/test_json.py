@@ -2,6 +2,7 @@
 
 import copy
 import itertools
+import json
 import os
 from io import BytesIO, StringIO
 from pathlib import Path
@@ -302,3 +303,136 @@ def test_json_null_literal(buffer):
     np.testing.assert_array_equal(df.dtypes, ["float64", "int8"])
     np.testing.assert_array_equal(df["0"], [None, 1.0])
     np.testing.assert_array_equal(df["1"], [None, None])
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_json_records_array(monkeypatch, parallel):
+    import cudf.io.json
+
+    if parallel:
+        monkeypatch.setattr(cudf.io.json, "_PARALLEL_JSON_BYTES", 0)
+
+    records = []
+    for i in range(500):
+        record = {"a": i, "b": i * 0.5, "c": "s%d" % i, "d": i % 2 == 0}
+        if i % 7 == 0:
+            # a false record boundary within a string
+            record["c"] = '}, {"a": 1}, {'
+        if i % 11 == 0:
+            del record["b"]
+        records.append(record)
+    buffer = json.dumps(records)
+
+    expect = pd.read_json(buffer)
+    got = cudf.read_json(buffer)
+    assert_eq(expect, got)
+
+
+@pytest.mark.parametrize("scan_block_bytes", [5, 4096])
+def test_json_records_array_nested(monkeypatch, scan_block_bytes):
+    import cudf.io.json
+
+    monkeypatch.setattr(cudf.io.json, "_PARALLEL_JSON_BYTES", 0)
+    monkeypatch.setattr(cudf.io.json, "_SCAN_BLOCK_BYTES", scan_block_bytes)
+
+    records = []
+    for i in range(500):
+        # false record boundaries between nested objects, and in strings
+        # with escaped quotes and backslashes
+        items = [{"k": j, "s": '\\"}, {' * (j % 3)} for j in range(i % 4)]
+        records.append({"a": i, "items": items, "c": "\\" * (i % 3)})
+    data = json.dumps(records).encode()
+
+    pieces = cudf.io.json._split_records(data, 16)
+    assert len(pieces) > 1
+    for begin, end in pieces:
+        json.loads(cudf.io.json._piece(data, begin, end))
+
+    results = cudf.io.json._parse_records_parallel(data)
+    assert len(results) == len(pieces)
+    assert sum(nrows for nrows, _ in results) == len(records)
+    got = np.concatenate([arrays["items"] for _, arrays in results])
+    assert got.tolist() == [record["items"] for record in records]
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_json_records_array_missing_keys(monkeypatch, parallel):
+    import cudf.io.json
+
+    if parallel:
+        monkeypatch.setattr(cudf.io.json, "_PARALLEL_JSON_BYTES", 0)
+
+    # missing values are NaN, so that the bools become floats
+    buffer = '[{"a": true, "b": 1}, {"b": 2}, {"a": false}]'
+    expect = pd.read_json(buffer)
+    got = cudf.read_json(buffer)
+    assert got["a"].dtype == np.dtype("float64")
+    assert_eq(expect, got)
+
+
+def test_json_records_array_numeric_keys():
+    buffer = '[{"1": 1, "2": "a"}, {"1": 2, "2": "3"}]'
+    assert_eq(pd.read_json(buffer), cudf.read_json(buffer))
+
+
+@pytest.fixture
+def json_lines_records():
+    np.random.seed(0)
+    nrows = 100
+    return pd.DataFrame(
+        {
+            "a": np.arange(nrows),
+            "b": np.random.random(nrows),
+            "c": ["x", "yy", "zzz", "w"] * (nrows // 4),
+            "d": np.random.randint(0, 2, nrows).astype(bool),
+            "e": np.arange(nrows) * 2,
+        }
+    )
+
+
+@pytest.mark.filterwarnings("ignore:Using CPU")
+@pytest.mark.parametrize("engine", ["cudf", "pandas"])
+@pytest.mark.parametrize("columns", [["c", "a"], ["b"], ["e"]])
+def test_json_lines_columns(json_lines_records, engine, columns):
+    buffer = json_lines_records.to_json(orient="records", lines=True)
+    got = cudf.read_json(buffer, lines=True, engine=engine, columns=columns)
+    assert_eq(got, json_lines_records[columns])
+
+
+def test_json_lines_columns_dtype(json_lines_records):
+    buffer = json_lines_records.to_json(orient="records", lines=True)
+
+    got = cudf.read_json(
+        buffer, lines=True, columns=["e", "a"], dtype=["int32", "int16"]
+    )
+    assert list(got.dtypes) == ["int32", "int16"]
+
+    # the columns without a dtype have their dtypes inferred
+    got = cudf.read_json(buffer, lines=True, dtype={"b": "float32"})
+    expect = json_lines_records.astype({"b": "float32"})
+    assert_eq(got, expect)
+
+    with pytest.raises(RuntimeError):
+        cudf.read_json(buffer, lines=True, columns=["missing"])
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_read_json_schema(tmpdir, json_lines_records, compression):
+    fname = str(tmpdir.join("records.json"))
+    json_lines_records.to_json(
+        fname, orient="records", lines=True, compression=compression
+    )
+
+    schema = cudf.io.read_json_schema(fname, nrows=10, compression=compression)
+    assert list(schema) == list(json_lines_records.columns)
+    assert list(schema.values()) == list(json_lines_records.dtypes)
+
+    got = cudf.read_json(
+        fname, lines=True, compression=compression, dtype=schema
+    )
+    assert_eq(got, json_lines_records)
+
+    schema = cudf.io.read_json_schema(
+        fname, columns=["c", "b"], compression=compression
+    )
+    assert list(schema) == ["b", "c"]
@@ -318,3 +318,15 @@ def test_orc_writer_strings(tmpdir, dtypes):
     got = pa.orc.ORCFile(gdf_fname).read().to_pandas()
 
     assert_eq(expect, got)
+
+
+def test_orc_writer_categorical(tmpdir):
+    gdf_fname = tmpdir.join("gdf_categorical.orc")
+
+    expect = pd.DataFrame(
+        {"a": pd.Series(["x", "yy", None, "zzz"] * 5, dtype="category")}
+    )
+    cudf.from_pandas(expect).to_orc(gdf_fname)
+    got = pa.orc.ORCFile(gdf_fname).read().to_pandas()
+
+    assert_eq(expect.astype(object), got)
@@ -198,17 +198,37 @@ def test_parquet_reader_strings(tmpdir, strings_to_categorical, has_null):
         gdf = cudf.read_parquet(fname, engine="cudf")
 
     if strings_to_categorical:
-        if has_null:
-            hash_ref = [989983842, None, 1169108191]
-        else:
-            hash_ref = [989983842, 429364346, 1169108191]
-        assert gdf["b"].dtype == np.dtype("int32")
-        assert list(gdf["b"]) == list(hash_ref)
+        assert gdf["b"].dtype == "category"
+        assert_eq(
+            gdf["b"], df["b"].astype("category"), check_categorical=False
+        )
     else:
         assert gdf["b"].dtype == np.dtype("object")
         assert list(gdf["b"]) == list(df["b"])
 
 
+@pytest.mark.parametrize("row_group_size", [None, 7])
+def test_parquet_reader_strings_to_categorical(tmpdir, row_group_size):
+    np.random.seed(0)
+    nrows = 100
+    words = np.array(["x", "yy", "zzz", "wwww", None], dtype=object)
+    df = pd.DataFrame(
+        {"a": np.arange(nrows), "b": words[np.random.randint(0, 5, nrows)]}
+    )
+    fname = tmpdir.join("test_pq_reader_strings_to_categorical.parquet")
+    # each row group holds its own dictionary of a subset of the words
+    pa.parquet.write_table(
+        pa.Table.from_pandas(df), fname.strpath, row_group_size=row_group_size
+    )
+
+    got = cudf.read_parquet(fname, strings_to_categorical=True)
+    assert got["b"].dtype == "category"
+    assert_eq(got["b"].astype("str"), df["b"])
+    assert sorted(got["b"].cat.categories.to_pandas()) == sorted(
+        words[:-1].tolist()
+    )
+
+
 @pytest.mark.parametrize("columns", [None, ["b"]])
 @pytest.mark.parametrize("index_col", ["b", "Nameless", None])
 def test_parquet_reader_index_col(tmpdir, index_col, columns):
@@ -550,3 +570,22 @@ def test_parquet_writer_gpu_multi_index(tmpdir, simple_pdf, simple_gdf):
     got = pd.read_parquet(gdf_fname)
 
     assert_eq(expect, got, check_categorical=False)
+
+
+def test_parquet_writer_categorical(tmpdir):
+    pdf = pd.DataFrame(
+        {
+            "a": np.arange(20),
+            "b": pd.Series(["x", "yy", None, "zzz"] * 5, dtype="category"),
+        }
+    )
+    gdf = cudf.from_pandas(pdf)
+    fname = tmpdir.join("gdf_categorical.parquet")
+    gdf.to_parquet(fname.strpath, index=None)
+
+    # the categories are written as the dictionary of a string column
+    got = pd.read_parquet(fname)
+    assert_eq(pdf.astype({"b": object}), got)
+
+    got = cudf.read_parquet(fname, strings_to_categorical=True)
+    assert_eq(gdf, got, check_categorical=False)
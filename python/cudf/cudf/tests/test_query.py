@@ -4,6 +4,7 @@ from __future__ import division, print_function
 
 import datetime
 import inspect
+import os
 from itertools import product
 
 import numpy as np
@@ -155,3 +156,134 @@ def test_query_empty_frames():
 
     # assert euqal results
     assert_frame_equal(got, expect)
+
+
+def test_query_disk_kernel_cache(tmpdir, monkeypatch):
+    from cudf.utils import cudautils
+
+    disk_cache = cudautils.DiskKernelCache(path=str(tmpdir))
+    monkeypatch.setattr(cudautils, "disk_kernel_cache", disk_cache)
+    monkeypatch.setattr(
+        cudautils, "specialized_kernel_cache", cudautils.KernelCache()
+    )
+
+    pdf = pd.DataFrame({"a": np.arange(10), "b": np.arange(10) * 0.5})
+    gdf = DataFrame.from_pandas(pdf)
+    # conditional expressions are compiled into a kernel
+    expr = "a > 3 if b < 4 else False"
+    expect = pdf[(pdf.a > 3) & (pdf.b < 4)]
+    assert_frame_equal(gdf.query(expr).to_pandas(), expect)
+    assert len(disk_cache) == 1
+
+    # a new process starts with an empty in-memory cache
+    monkeypatch.setattr(
+        cudautils, "specialized_kernel_cache", cudautils.KernelCache()
+    )
+    monkeypatch.setattr(queryutils, "_cache", cudautils.KernelCache())
+    assert_frame_equal(gdf.query(expr).to_pandas(), expect)
+    assert len(disk_cache) == 1
+
+    # other argument types are compiled and stored separately
+    gdf["a"] = gdf["a"].astype("float32")
+    assert_frame_equal(gdf.query(expr).to_pandas(), expect)
+    assert len(disk_cache) == 2
+
+
+def test_disk_kernel_cache_size_limit(tmpdir):
+    from cudf.utils.cudautils import DiskKernelCache
+
+    disk_cache = DiskKernelCache(path=str(tmpdir))
+    for i in range(5):
+        disk_cache.store(("entry", i), b"x" * 1000)
+    # distinct times of last use, whatever the clock of the file system
+    for i in range(5):
+        t = (i + 1) * 10 ** 9
+        os.utime(disk_cache._filename(("entry", i)), ns=(t, t))
+    entry_bytes = disk_cache.size() // 5
+
+    # the entries used last are kept: 0 and 5, then 4
+    assert disk_cache.load(("entry", 0)) == b"x" * 1000
+    disk_cache.max_bytes = 3 * entry_bytes
+    disk_cache.store(("entry", 5), b"x" * 1000)
+    assert disk_cache.size() <= disk_cache.max_bytes
+    for i in (1, 2, 3):
+        assert disk_cache.load(("entry", i)) is None
+    for i in (0, 4, 5):
+        assert disk_cache.load(("entry", i)) == b"x" * 1000
+
+    disk_cache.clear()
+    assert len(disk_cache) == 0
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "a > 3 and b == @x",
+        "not (a < 2 or b != @x)",
+        "1 < a <= 6",
+        "a in [1, 3, 5] and b not in (0.5,)",
+        "-a + 2 * b > @x",
+        "s == 'b' or s > 'c'",
+        "c == 'y'",
+    ],
+)
+def test_query_vectorized(expr):
+    from cudf.utils import cudautils
+
+    pdf = pd.DataFrame(
+        {
+            "a": np.arange(8),
+            "b": np.arange(8) % 3 * 0.5,
+            "s": list("abcdabcd"),
+            "c": pd.Categorical(list("xyzxyzxy")),
+        }
+    )
+    gdf = DataFrame.from_pandas(pdf)
+    x = 0.5  # noqa: F841
+
+    cache = cudautils.KernelCache()
+    queryutils._cache, saved = cache, queryutils._cache
+    try:
+        got = gdf.query(expr)
+    finally:
+        queryutils._cache = saved
+    assert cache.info().misses == 0
+    assert_eq(got, pdf.query(expr))
+
+
+def test_query_vectorized_nulls():
+    gdf = DataFrame({"a": [1, None, 3, 4], "s": ["x", "y", None, "x"]})
+    # rows with a null in any referenced column are dropped
+    got = gdf.query("a > 0 or s == 'x'")
+    np.testing.assert_array_equal(got.index.to_array(), [0, 3])
+
+
+def test_eval_assignments():
+    pdf = pd.DataFrame(
+        {"x": np.arange(6), "y": np.arange(6) * 0.5, "w": np.arange(6) % 2}
+    )
+    gdf = DataFrame.from_pandas(pdf)
+    k = 3  # noqa: F841
+    expr = "z = x * y + w\nq = (x * y) / 2\nr = z > @k"
+
+    assert_eq(gdf.eval(expr), pdf.eval(expr))
+    assert_eq(gdf.eval("x * y + w"), pdf.eval("x * y + w"))
+
+    gdf.eval(expr, inplace=True)
+    pdf.eval(expr, inplace=True)
+    assert_eq(gdf, pdf)
+
+
+def test_eval_common_subexpressions():
+    builder = queryutils._EvalSourceBuilder()
+    [(_, node)] = queryutils.eval_parser("(x * y) + (x * y) / (x * y)")
+    source = builder.build(node, "f")
+    assert source.count("*") == 1
+    assert builder.args == ["x", "y"]
+
+
+def test_eval_nulls_and_strings():
+    gdf = DataFrame({"a": [1, None, 3], "s": ["x", "y", "z"]})
+    got = gdf.eval("b = a + 1\nc = s == 'y'")
+    assert got["b"].null_count == 1
+    np.testing.assert_array_equal(got["c"].to_array(), [False, True, False])
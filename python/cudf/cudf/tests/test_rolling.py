@@ -116,6 +116,49 @@ def test_rolling_with_offset(agg):
     )
 
 
+@pytest.mark.parametrize("window", ["1ms", "5ms", "1s"])
+def test_rolling_with_offset_dense_index(window):
+    index = pd.to_datetime(
+        np.sort(np.random.randint(0, 10 ** 9, 1000)), unit="us"
+    )
+    psr = pd.Series(np.random.random(1000), index=index)
+    gsr = cudf.from_pandas(psr)
+    assert_eq(psr.rolling(window).sum(), gsr.rolling(window).sum())
+    assert_eq(
+        psr.rolling(window).count(),
+        gsr.rolling(window).count(),
+        check_dtype=False,
+    )
+
+
+def test_rolling_with_offset_unsorted_index():
+    index = pd.to_datetime(
+        np.random.permutation(np.arange(0, 10 ** 6, 1000)), unit="ms"
+    )
+    pdf = pd.DataFrame(
+        {"a": np.random.random(len(index)), "b": np.arange(len(index))},
+        index=index,
+    )
+    gdf = cudf.from_pandas(pdf)
+
+    expect = pdf.sort_index().rolling("5s").sum().loc[pdf.index]
+    got = gdf.rolling("5s").sum()
+    assert_eq(expect, got, check_dtype=False)
+    assert_eq(expect["a"], got["a"], check_dtype=False)
+    assert_eq(expect["a"], gdf.rolling("5s")["a"].sum(), check_dtype=False)
+
+
+def test_rolling_with_offset_invalid():
+    gsr = cudf.Series(
+        [1, 2, 3],
+        index=pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03"]),
+    )
+    with pytest.raises(ValueError):
+        gsr.rolling("-1s")
+    with pytest.raises(ValueError):
+        gsr.rolling("0s")
+
+
 def test_rolling_getattr():
     pdf = pd.DataFrame({"a": [1, 2, 3, 4], "b": [1, 2, 3, 4]})
     gdf = cudf.from_pandas(pdf)
@@ -245,3 +288,84 @@ def test_rolling_numba_udf_with_offset():
         gsr.rolling("2s").apply(some_func).fillna(-1),
         check_dtype=False,
     )
+
+
+@pytest.mark.parametrize("agg", ["var", "std"])
+@pytest.mark.parametrize("window,min_periods", [(3, None), (4, 2), ("3s", 1)])
+def test_rolling_var_std(agg, window, min_periods):
+    psr = pd.Series(
+        np.random.random(50) * 1000 + 10 ** 6,
+        index=pd.date_range("2020-01-01", periods=50, freq="s"),
+    )
+    psr.iloc[::7] = np.nan
+    gsr = cudf.from_pandas(psr)
+
+    assert_eq(
+        getattr(psr.rolling(window, min_periods=min_periods), agg)(),
+        getattr(gsr.rolling(window, min_periods=min_periods), agg)(),
+    )
+
+
+def test_rolling_agg_list():
+    pdf = pd.DataFrame(
+        {"a": np.random.random(20), "b": np.random.randint(0, 10, 20)}
+    )
+    gdf = cudf.from_pandas(pdf)
+    aggs = ["sum", "mean", "max", "std"]
+
+    assert_eq(
+        pdf.rolling(3).agg(aggs), gdf.rolling(3).agg(aggs), check_dtype=False
+    )
+    assert_eq(
+        pdf.a.rolling(3).agg(aggs),
+        gdf.a.rolling(3).agg(aggs),
+        check_dtype=False,
+    )
+    assert_eq(
+        pdf.rolling(3).agg({"a": "sum", "b": "max"}),
+        gdf.rolling(3).agg({"a": "sum", "b": "max"}),
+        check_dtype=False,
+    )
+    assert_eq(
+        pdf.rolling(3).agg({"a": ["sum", "var"], "b": "max"}),
+        gdf.rolling(3).agg({"a": ["sum", "var"], "b": "max"}),
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize("agg", ["sum", "max", "mean", "count", "std"])
+@pytest.mark.parametrize("window,center", [(1, False), (3, False), (3, True)])
+def test_rolling_groupby(agg, window, center):
+    pdf = pd.DataFrame(
+        {
+            "key": np.random.randint(0, 4, 40),
+            "val": np.random.random(40),
+            "other": np.arange(40),
+        },
+        index=np.random.permutation(40),
+    )
+    gdf = cudf.from_pandas(pdf)
+
+    expect = getattr(
+        pdf.groupby("key").val.rolling(window, center=center), agg
+    )()
+    got = getattr(gdf.groupby("key").val.rolling(window, center=center), agg)()
+    assert_eq(expect, got, check_dtype=False)
+
+    got = getattr(gdf.groupby("key").rolling(window, center=center), agg)()
+    assert_eq(expect, got["val"], check_dtype=False)
+    assert "key" not in got.columns
+
+
+def test_rolling_groupby_offset():
+    pdf = pd.DataFrame(
+        {"key": np.random.randint(0, 3, 60), "val": np.random.random(60)},
+        index=pd.to_datetime(
+            np.sort(np.random.randint(0, 10 ** 4, 60)), unit="s"
+        ),
+    )
+    gdf = cudf.from_pandas(pdf)
+
+    expect = pdf.groupby("key").val.rolling("10min").sum()
+    got = gdf.groupby("key").val.rolling("10min").sum()
+    assert_eq(expect, got)
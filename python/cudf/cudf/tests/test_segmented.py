@@ -0,0 +1,95 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+
+def _segments(offsets):
+    """The segment of each row, for pandas"""
+    return np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+
+
+def _skewed(nrows=5000):
+    """One huge segment among many tiny and empty ones"""
+    offsets = np.concatenate(
+        [[0, 0], np.arange(1, 50), [4000], np.arange(4001, nrows + 1, 7)]
+    )
+    if offsets[-1] != nrows:
+        offsets = np.append(offsets, nrows)
+    np.random.seed(0)
+    values = np.random.randint(-100, 100, size=nrows)
+    return values, offsets
+
+
+@pytest.mark.parametrize("op", ["sum", "min", "max", "mean", "count"])
+def test_segmented_reduce(op):
+    values, offsets = _skewed()
+    got = cudf.segmented.reduce(cudf.Series(values), offsets, op)
+
+    expect = getattr(pd.Series(values).groupby(_segments(offsets)), op)()
+    expect = expect.reindex(range(len(offsets) - 1))
+    assert_eq(got.to_pandas(), expect, check_dtype=False)
+
+
+@pytest.mark.parametrize("op", ["sum", "prod", "min", "max", "count"])
+def test_segmented_scan(op):
+    values, offsets = _skewed()
+    if op == "prod":
+        values = values % 3 - 1
+    values = pd.Series(values, dtype="float64")
+    values[::13] = None
+    got = cudf.segmented.scan(cudf.Series(values), offsets, op)
+
+    grouped = values.groupby(_segments(offsets))
+    if op == "count":
+        expect = values.notna().groupby(_segments(offsets)).cumsum()
+    else:
+        expect = getattr(grouped, "cum" + op)()
+    assert_eq(got.to_pandas(), expect, check_dtype=False)
+
+
+@pytest.mark.parametrize("op", ["sum", "max"])
+def test_segmented_scan_many_tiles(op):
+    # the values carried across tiles are themselves scanned over tiles
+    nrows = 300000
+    offsets = np.array([0, 3, 70000, nrows])
+    np.random.seed(0)
+    values = pd.Series(np.random.randint(-100, 100, size=nrows))
+    got = cudf.segmented.scan(cudf.Series(values), offsets, op)
+
+    expect = getattr(values.groupby(_segments(offsets)), "cum" + op)()
+    assert_eq(got.to_pandas(), expect, check_dtype=False)
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_segmented_sort(ascending):
+    values, offsets = _skewed()
+    got = cudf.segmented.sort(cudf.Series(values), offsets, ascending)
+
+    expect = np.concatenate(
+        [
+            np.sort(values[start:stop])[:: 1 if ascending else -1]
+            for start, stop in zip(offsets[:-1], offsets[1:])
+        ]
+    )
+    np.testing.assert_array_equal(got.to_array(), expect)
+
+
+def test_segmented_find_offsets():
+    values = cudf.Series([1, 1, 2, 5, 5, 5])
+    offsets = cudf.segmented.find_offsets(values)
+    np.testing.assert_array_equal(offsets.get(), [0, 2, 3, 6])
+    got = cudf.segmented.reduce(values, offsets, "sum")
+    assert_eq(got, cudf.Series([2, 2, 15]))
+
+
+def test_segmented_invalid_offsets():
+    values = cudf.Series([1, 2, 3])
+    with pytest.raises(ValueError):
+        cudf.segmented.reduce(values, [0, 2], "sum")
+    with pytest.raises(ValueError):
+        cudf.segmented.scan(values, [0, 2, 1, 3])
@@ -82,6 +82,24 @@ def test_series_unique():
         assert len(set(arr[mask])) == sr.nunique()
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        np.arange(10000) % 5000,
+        np.random.randint(0, 50, size=3000),
+        ["a", "bb", "a", "ccc", "bb"] * 500,
+    ],
+)
+def test_series_unique_k(data):
+    sr = Series(data)
+    expect = set(sr.to_pandas())
+    got = sr.unique_k(k=len(expect))
+    assert sorted(got.to_pandas()) == sorted(expect)
+
+    with pytest.raises(ValueError):
+        sr.unique_k(k=len(expect) - 1)
+
+
 @pytest.mark.parametrize(
     "nan_as_null, dropna",
     [(True, True), (True, False), (False, True), (False, False)],
@@ -2,10 +2,14 @@
 
 import functools
 
+import numpy as np
 from numba import cuda, six
 from numba.utils import exec_, pysignature
 
+import rmm
+
 import cudf._lib as libcudf
+from cudf._libxx.transform import bools_to_mask
 from cudf.core.column import column
 from cudf.core.series import Series
 from cudf.utils import cudautils, utils
@@ -30,6 +34,13 @@ pessimistic_nulls : bool
     input is null. If False, all outputs will be non-null, but will be the
     result of applying func against the underlying column data, which
     may be garbage.
+null_aware : bool
+    Whether or not ``func`` handles null values itself. If True, for any
+    input or output argument ``x``, ``func`` can take an argument named
+    ``x_valid``: a boolean array which is True for the non-null rows.
+    Input validities are read-only. Output validities are all True when
+    ``func`` is invoked; setting a row to False makes the output null.
+    ``pessimistic_nulls`` is ignored.
 """
 
 _doc_applychunkparams = """
@@ -63,7 +74,14 @@ doc_applychunks = docfmt_partial(
 
 @doc_apply()
 def apply_rows(
-    df, func, incols, outcols, kwargs, pessimistic_nulls, cache_key
+    df,
+    func,
+    incols,
+    outcols,
+    kwargs,
+    pessimistic_nulls,
+    cache_key,
+    null_aware=False,
 ):
     """Row-wise transformation
 
@@ -72,11 +90,44 @@ def apply_rows(
     {params}
     """
     applyrows = ApplyRowsCompiler(
-        func, incols, outcols, kwargs, pessimistic_nulls, cache_key=cache_key
+        func,
+        incols,
+        outcols,
+        kwargs,
+        pessimistic_nulls,
+        cache_key=cache_key,
+        null_aware=null_aware,
     )
     return applyrows.run(df)
 
 
+def apply_rows_batched(
+    frames,
+    func,
+    incols,
+    outcols,
+    kwargs,
+    pessimistic_nulls,
+    cache_key,
+    null_aware=False,
+):
+    """Row-wise transformation of several frames with one kernel launch
+
+    See ``apply_rows`` for the parameters; ``frames`` is a list of
+    dataframes whose input columns have the same dtypes.
+    """
+    applyrows = ApplyRowsCompiler(
+        func,
+        incols,
+        outcols,
+        kwargs,
+        pessimistic_nulls,
+        cache_key=cache_key,
+        null_aware=null_aware,
+    )
+    return applyrows.run_batched(frames)
+
+
 @doc_applychunks()
 def apply_chunks(
     df,
@@ -88,6 +139,7 @@ def apply_chunks(
     chunks,
     blkct=None,
     tpb=None,
+    null_aware=False,
 ):
     """Chunk-wise transformation
 
@@ -97,7 +149,13 @@ def apply_chunks(
     {params_chunks}
     """
     applychunks = ApplyChunksCompiler(
-        func, incols, outcols, kwargs, pessimistic_nulls, cache_key=None
+        func,
+        incols,
+        outcols,
+        kwargs,
+        pessimistic_nulls,
+        cache_key=None,
+        null_aware=null_aware,
     )
     return applychunks.run(df, chunks=chunks, tpb=tpb)
 
@@ -124,7 +182,14 @@ def make_aggregate_nullmask(df, columns=None, op="and"):
 
 class ApplyKernelCompilerBase(object):
     def __init__(
-        self, func, incols, outcols, kwargs, pessimistic_nulls, cache_key
+        self,
+        func,
+        incols,
+        outcols,
+        kwargs,
+        pessimistic_nulls,
+        cache_key,
+        null_aware=False,
     ):
         # Get signature of user function
         sig = pysignature(func)
@@ -134,74 +199,183 @@ class ApplyKernelCompilerBase(object):
         self.kwargs = kwargs
         self.pessimistic_nulls = pessimistic_nulls
         self.cache_key = cache_key
-        self.kernel = self.compile(func, sig.parameters.keys(), kwargs.keys())
+        self.null_aware = null_aware
+        self.validity = self.validity_args() if null_aware else ()
+        argnames = tuple(sig.parameters.keys())
+        extra_argnames = tuple(kwargs.keys())
+        self.kernel = self.compile(func, argnames, extra_argnames)
+        self.content = self.content_token(func, argnames, extra_argnames)
+
+    def input_args(self):
+        """
+        Map the name of each input column to its function argument.
+        """
+        if isinstance(self.incols, dict):
+            return dict(self.incols)
+        return {k: k for k in self.incols}
+
+    def validity_args(self):
+        """
+        The validity arguments taken by the function, as a tuple of
+        ``(argument, is_input)`` pairs.
+        """
+        params = self.sig.parameters
+        validity = [
+            (arg + "_valid", True)
+            for arg in self.input_args().values()
+            if arg + "_valid" in params
+        ]
+        validity.extend(
+            (k + "_valid", False)
+            for k in sorted(self.outcols)
+            if k + "_valid" in params
+        )
+        return tuple(validity)
+
+    def content_token(self, func, argnames, extra_argnames):
+        """
+        Identify the kernel by the content of ``func`` and the arguments,
+        so that the compiled kernel is found in the on-disk cache by other
+        processes. None if ``func`` can't be identified by content.
+        """
+        token = cudautils.function_content_token(func)
+        if token is None:
+            return None
+        return (
+            type(self).__name__,
+            token,
+            argnames,
+            extra_argnames,
+            self.validity,
+        )
+
+    def specialized_kernel(self, args):
+        return cudautils.specialize_kernel(self.kernel, self.content, args)
 
     def run(self, df, **launch_params):
+        outputs = self.compute(df, **launch_params)
+        # Prepare output frame
+        outdf = df.copy()
+        for k in sorted(self.outcols):
+            outdf[k] = outputs[k]
+        return outdf
+
+    def run_batched(self, frames, **launch_params):
+        """
+        Run the kernel once over the concatenated input columns of
+        ``frames`` and return a copy of each frame with its outputs.
+        """
+        from cudf.core.reshape import concat
+
+        if len(frames) == 0:
+            return []
+        names = list(self.input_args())
+        dtypes = [frames[0][k].dtype for k in names]
+        for df in frames[1:]:
+            if [df[k].dtype for k in names] != dtypes:
+                raise ValueError(
+                    "all frames must have the same input column dtypes"
+                )
+        inputs = concat([df[names] for df in frames], ignore_index=True)
+        outputs = self.compute(inputs, **launch_params)
+
+        results = []
+        start = 0
+        for df in frames:
+            stop = start + len(df)
+            outdf = df.copy()
+            for k in sorted(self.outcols):
+                outdf[k] = Series(
+                    outputs[k]._column[start:stop], index=df.index
+                )
+            results.append(outdf)
+            start = stop
+        return results
+
+    def compute(self, df, **launch_params):
+        """
+        Launch the kernel over ``df`` and return the output Series by name.
+        """
         # Get input columns
-        if isinstance(self.incols, dict):
-            inputs = {
-                v: df[k]._column.data_array_view
-                for (k, v) in self.incols.items()
-            }
-        else:
-            inputs = {k: df[k]._column.data_array_view for k in self.incols}
+        incols = self.input_args()
+        inputs = {v: df[k]._column.data_array_view for k, v in incols.items()}
         # Allocate output columns
         outputs = {}
         for k, dt in self.outcols.items():
             outputs[k] = column.column_empty(
                 len(df), dt, False
             ).data_array_view
+        # Allocate validities, filled by the kernel from the input masks
+        validities = {}
+        masks = []
+        input_columns = {v: df[k]._column for k, v in incols.items()}
+        for name, is_input in self.validity:
+            validities[name] = rmm.device_array(len(df), dtype=np.bool_)
+            if is_input:
+                col = input_columns[name[: -len("_valid")]]
+                if col.nullable:
+                    masks.append(col.mask_array_view)
+                else:
+                    masks.append(rmm.device_array(0, dtype=utils.mask_dtype))
         # Bind argument
         args = {}
-        for dct in [inputs, outputs, self.kwargs]:
+        for dct in [inputs, outputs, validities, self.kwargs]:
             args.update(dct)
         bound = self.sig.bind(**args)
         # Launch kernel
-        self.launch_kernel(df, bound.args, **launch_params)
+        self.launch_kernel(df, bound.args + tuple(masks), **launch_params)
         # Prepare pessimistic nullmask
-        if self.pessimistic_nulls:
+        if self.pessimistic_nulls and not self.null_aware:
             out_mask = make_aggregate_nullmask(df, columns=self.incols)
         else:
             out_mask = None
-        # Prepare output frame
-        outdf = df.copy()
+        # Prepare output series
+        results = {}
         for k in sorted(self.outcols):
-            outdf[k] = Series(outputs[k], nan_as_null=False)
+            results[k] = Series(outputs[k], nan_as_null=False)
             if out_mask is not None:
-                outdf[k] = outdf[k].set_mask(out_mask.data_array_view)
-
-        return outdf
+                results[k] = results[k].set_mask(out_mask.data_array_view)
+            elif k + "_valid" in validities:
+                valid = column.as_column(validities[k + "_valid"])
+                results[k] = results[k].set_mask(bools_to_mask(valid))
+        return results
 
 
 class ApplyRowsCompiler(ApplyKernelCompilerBase):
     def compile(self, func, argnames, extra_argnames):
         # Compile kernel
+        cache_key = self.cache_key
+        if cache_key is not None and self.validity:
+            cache_key = (cache_key, self.validity)
         kernel = _load_cache_or_make_row_wise_kernel(
-            self.cache_key, func, argnames, extra_argnames
+            cache_key, func, argnames, extra_argnames, self.validity
         )
         return kernel
 
     def launch_kernel(self, df, args):
-        self.kernel.forall(len(df))(*args)
+        kernel = self.specialized_kernel(args)
+        kernel.forall(len(df))(*args)
 
 
 class ApplyChunksCompiler(ApplyKernelCompilerBase):
     def compile(self, func, argnames, extra_argnames):
         # Compile kernel
         kernel = _load_cache_or_make_chunk_wise_kernel(
-            func, argnames, extra_argnames
+            func, argnames, extra_argnames, self.validity
         )
         return kernel
 
     def launch_kernel(self, df, args, chunks, blkct=None, tpb=None):
         chunks = self.normalize_chunks(len(df), chunks)
+        args = (len(df), chunks) + tuple(args)
+        kernel = self.specialized_kernel(args)
         if blkct is None and tpb is None:
-            self.kernel.forall(len(df))(len(df), chunks, *args)
+            kernel.forall(len(df))(*args)
         else:
             assert tpb is not None
             if blkct is None:
                 blkct = chunks.size
-            self.kernel[blkct, tpb](len(df), chunks, *args)
+            kernel[blkct, tpb](*args)
 
     def normalize_chunks(self, size, chunks):
         if isinstance(chunks, six.integer_types):
@@ -213,18 +387,46 @@ class ApplyChunksCompiler(ApplyKernelCompilerBase):
             return chunks.data_array_view
 
 
-def _make_row_wise_kernel(func, argnames, extras):
+def _fill_validity(validity, rows):
+    """
+    Generate the source filling the validity arguments over ``rows``: input
+    validities from the null mask passed with them, if any, and output
+    validities with True.
+    """
+    lines = []
+    for name, is_input in validity:
+        valid = _mangle_user(name)
+        lines.append("for __i in {}:".format(rows.format(valid=valid)))
+        if is_input:
+            lines.append(
+                "    {valid}[__i] = {mask}.size == 0 or "
+                "mask_get({mask}, __i) != 0".format(
+                    valid=valid, mask=_mask_arg(name)
+                )
+            )
+        else:
+            lines.append("    {}[__i] = True".format(valid))
+    return lines
+
+
+def _make_row_wise_kernel(func, argnames, extras, validity=()):
     """
     Make a kernel that does a stride loop over the input rows.
 
     Each thread is responsible for a row in each iteration.
     Several iteration may be needed to handling a large number of rows.
 
+    For each ``(name, is_input)`` pair of ``validity``, the kernel fills
+    the validity argument ``name`` of its rows before calling ``func``.
+    The null masks of the input validities are passed to the kernel after
+    the arguments of ``func``.
+
     The resulting kernel can be used with any 1D grid size and 1D block size.
     """
     # Build kernel source
     argnames = list(map(_mangle_user, argnames))
     extras = list(map(_mangle_user, extras))
+    maskargs = [_mask_arg(name) for name, is_input in validity if is_input]
     source = """
 def row_wise_kernel({args}):
 {body}
@@ -235,6 +437,7 @@ def row_wise_kernel({args}):
 
     body.append("tid = cuda.grid(1)")
     body.append("ntid = cuda.gridsize(1)")
+    body.extend(_fill_validity(validity, "range(tid, {valid}.size, ntid)"))
 
     for a in argnames:
         if a not in extras:
@@ -250,16 +453,22 @@ def row_wise_kernel({args}):
 
     indented = ["{}{}".format(" " * 4, ln) for ln in body]
     # Finalize source
-    concrete = source.format(args=args, body="\n".join(indented))
+    concrete = source.format(
+        args=", ".join(argnames + maskargs), body="\n".join(indented)
+    )
     # Get bytecode
-    glbs = {"inner": cuda.jit(device=True)(func), "cuda": cuda}
+    glbs = {
+        "inner": cuda.jit(device=True)(func),
+        "cuda": cuda,
+        "mask_get": utils.mask_get,
+    }
     exec_(concrete, glbs)
     # Compile as CUDA kernel
     kernel = cuda.jit(glbs["row_wise_kernel"])
     return kernel
 
 
-def _make_chunk_wise_kernel(func, argnames, extras):
+def _make_chunk_wise_kernel(func, argnames, extras, validity=()):
     """
     Make a kernel that does a stride loop over the input chunks.
 
@@ -269,18 +478,22 @@ def _make_chunk_wise_kernel(func, argnames, extras):
     The user function *func* will have all threads in the block for its
     computation.
 
+    The validity arguments are filled as in ``_make_row_wise_kernel``, by
+    the block processing the chunk.
+
     The resulting kernel can be used with any 1D grid size and 1D block size.
     """
 
     # Build kernel source
     argnames = list(map(_mangle_user, argnames))
     extras = list(map(_mangle_user, extras))
+    maskargs = [_mask_arg(name) for name, is_input in validity if is_input]
     source = """
 def chunk_wise_kernel(nrows, chunks, {args}):
 {body}
 """
 
-    args = ", ".join(argnames)
+    args = ", ".join(argnames + maskargs)
     body = []
 
     body.append("blkid = cuda.blockIdx.x")
@@ -298,6 +511,14 @@ def chunk_wise_kernel(nrows, chunks, {args}):
         + "stop = chunks[curblk + 1]"
         + " if curblk + 1 < chunks.size else nrows"
     )
+    if validity:
+        body.extend(
+            indent + line
+            for line in _fill_validity(
+                validity, "range(start + tid, stop, ntid)"
+            )
+        )
+        body.append(indent + "cuda.syncthreads()")
 
     slicedargs = {}
     for a in argnames:
@@ -315,14 +536,18 @@ def chunk_wise_kernel(nrows, chunks, {args}):
     # Finalize source
     concrete = source.format(args=args, body="\n".join(indented))
     # Get bytecode
-    glbs = {"inner": cuda.jit(device=True)(func), "cuda": cuda}
+    glbs = {
+        "inner": cuda.jit(device=True)(func),
+        "cuda": cuda,
+        "mask_get": utils.mask_get,
+    }
     exec_(concrete, glbs)
     # Compile as CUDA kernel
     kernel = cuda.jit(glbs["chunk_wise_kernel"])
     return kernel
 
 
-_cache = dict()  # WeakKeyDictionary()
+_cache = cudautils.KernelCache()
 
 
 @functools.wraps(_make_row_wise_kernel)
@@ -330,31 +555,30 @@ def _load_cache_or_make_row_wise_kernel(cache_key, func, *args, **kwargs):
     """Caching version of ``_make_row_wise_kernel``.
     """
     if cache_key is None:
-        cache_key = func
-    try:
-        out = _cache[cache_key]
-        # print("apply cache loaded", cache_key)
-        return out
-    except KeyError:
-        # print("apply cache NOT loaded", cache_key)
-        kernel = _make_row_wise_kernel(func, *args, **kwargs)
-        _cache[cache_key] = kernel
-        return kernel
+        cache_key = cudautils.make_cache_key(func, "row_wise", *args)
+    return _cache.get(
+        cache_key, lambda: _make_row_wise_kernel(func, *args, **kwargs)
+    )
 
 
 @functools.wraps(_make_chunk_wise_kernel)
 def _load_cache_or_make_chunk_wise_kernel(func, *args, **kwargs):
-    """Caching version of ``_make_row_wise_kernel``.
+    """Caching version of ``_make_chunk_wise_kernel``.
     """
-    try:
-        return _cache[func]
-    except KeyError:
-        kernel = _make_chunk_wise_kernel(func, *args, **kwargs)
-        _cache[func] = kernel
-        return kernel
+    cache_key = cudautils.make_cache_key(func, "chunk_wise", *args)
+    return _cache.get(
+        cache_key, lambda: _make_chunk_wise_kernel(func, *args, **kwargs)
+    )
 
 
 def _mangle_user(name):
     """Mangle user variable name
     """
     return "__user_{}".format(name)
+
+
+def _mask_arg(name):
+    """Name of the kernel argument holding the null mask of the input
+    validity argument *name*
+    """
+    return "__mask_{}".format(name)
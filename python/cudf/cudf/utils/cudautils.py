@@ -1,9 +1,20 @@
 # Copyright (c) 2018, NVIDIA CORPORATION.
 
-from functools import lru_cache
-
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+import types
+from collections import OrderedDict, namedtuple
+from numbers import Number
+
+import cupy
+import numba
 import numpy as np
-from numba import cuda, int32, numpy_support
+from numba import cuda, numpy_support
 
 import rmm
 
@@ -395,30 +406,6 @@ def compute_scale(arr, vmin, vmax):
 #
 
 
-@cuda.jit(device=True)
-def gpu_unique_set_insert(vset, sz, val):
-    """
-    Insert *val* into the *vset* of size *sz*.
-    Returns:
-        *   -1: out-of-space
-        * >= 0: the new size
-    """
-    for i in range(sz):
-        # value matches, so return current size
-        if vset[i] == val:
-            return sz
-
-    if sz > 0:
-        i += 1
-    # insert at next available slot
-    if i < vset.size:
-        vset[i] = val
-        return sz + 1
-
-    # out of space
-    return -1
-
-
 @cuda.jit
 def gpu_shift(in_col, out_col, N):
     """Shift value at index i of an input array forward by N positions and
@@ -475,98 +462,6 @@ def apply_round(data, decimal):
     return output_dary
 
 
-MAX_FAST_UNIQUE_K = 2 * 1024
-
-
-class UniqueK(object):
-    _cached_kernels = {}
-
-    def __init__(self, dtype):
-        dtype = np.dtype(dtype)
-        self._kernel = self._get_kernel(dtype)
-
-    @classmethod
-    def _get_kernel(cls, dtype):
-        try:
-            return cls._cached_kernels[dtype]
-        except KeyError:
-            return cls._compile(dtype)
-
-    @classmethod
-    def _compile(cls, dtype):
-        nbtype = numpy_support.from_dtype(dtype)
-
-        @cuda.jit
-        def gpu_unique_k(arr, k, out, outsz_ptr):
-            """
-            Note: run with small blocks.
-            """
-            tid = cuda.threadIdx.x
-            blksz = cuda.blockDim.x
-            base = 0
-
-            # shared memory
-            vset_size = 0
-            sm_mem_size = MAX_FAST_UNIQUE_K
-            vset = cuda.shared.array(sm_mem_size, dtype=nbtype)
-            share_vset_size = cuda.shared.array(1, dtype=int32)
-            share_loaded = cuda.shared.array(sm_mem_size, dtype=nbtype)
-            sm_mem_size = min(k, sm_mem_size)
-
-            while vset_size < sm_mem_size and base < arr.size:
-                pos = base + tid
-                valid_load = min(blksz, arr.size - base)
-                # load
-                if tid < valid_load:
-                    share_loaded[tid] = arr[pos]
-                # wait for load to complete
-                cuda.syncthreads()
-                # thread-0 inserts
-                if tid == 0:
-                    for i in range(valid_load):
-                        val = share_loaded[i]
-                        new_size = gpu_unique_set_insert(vset, vset_size, val)
-                        if new_size >= 0:
-                            vset_size = new_size
-                        else:
-                            vset_size = sm_mem_size + 1
-                    share_vset_size[0] = vset_size
-                # wait until the insert is done
-                cuda.syncthreads()
-                vset_size = share_vset_size[0]
-                # increment
-                base += blksz
-
-            # output
-            if vset_size <= sm_mem_size:
-                for i in range(tid, vset_size, blksz):
-                    out[i] = vset[i]
-                if tid == 0:
-                    outsz_ptr[0] = vset_size
-            else:
-                outsz_ptr[0] = -1
-
-        # cache
-        cls._cached_kernels[dtype] = gpu_unique_k
-        return gpu_unique_k
-
-    def run(self, arr, k):
-        if k >= MAX_FAST_UNIQUE_K:
-            raise NotImplementedError("k >= {}".format(MAX_FAST_UNIQUE_K))
-        # setup mem
-        outsz_ptr = rmm.device_array(shape=1, dtype=np.intp)
-        out = rmm.device_array_like(arr)
-        # kernel
-        self._kernel[1, 64](arr, k, out, outsz_ptr)
-        # copy to host
-        unique_ct = outsz_ptr.copy_to_host()[0]
-        if unique_ct < 0:
-            raise ValueError("too many unique value (hint: increase k)")
-        else:
-            hout = out.copy_to_host()
-            return hout[:unique_ct]
-
-
 # Find segments
 
 
@@ -792,28 +687,417 @@ def modulo(arr, d):
     return out
 
 
-@cuda.jit
-def gpu_window_sizes_from_offset(arr, window_sizes, offset):
-    i = cuda.grid(1)
-    j = i
-    if i < arr.size:
-        while j > -1:
-            if (arr[i] - arr[j]) >= offset:
-                break
-            j -= 1
-        window_sizes[i] = i - j
-
-
 def window_sizes_from_offset(arr, offset):
+    """
+    Compute the size of the window ending at each element of the
+    monotonically increasing datetime array ``arr``, such that the
+    window of element ``i`` holds the elements in
+    ``(arr[i] - offset, arr[i]]``.
+
+    The start of every window is located with a binary search over
+    ``arr``, so the cost is O(n log n) however many elements fall
+    within a single window.
+    """
     window_sizes = rmm.device_array(shape=(arr.shape), dtype="int32")
     if arr.size > 0:
-        gpu_window_sizes_from_offset.forall(arr.size)(
-            arr, window_sizes, offset
-        )
+        unit, _ = np.datetime_data(arr.dtype)
+        # arr[j] > arr[i] - offset  <=>  arr[j] > arr[i] - ceil(offset)
+        # for integer timestamps
+        offset = int(np.ceil(offset / np.timedelta64(1, unit)))
+        values = cupy.asarray(arr.view("int64"))
+        starts = cupy.searchsorted(values, values - offset, side="right")
+        positions = cupy.arange(arr.size, dtype="int64")
+        cupy.asarray(window_sizes)[:] = positions - starts + 1
     return window_sizes
 
 
-@lru_cache(maxsize=32)
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class KernelCache(object):
+    """
+    A thread-safe LRU cache of compiled kernels, with hit and miss
+    statistics.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of kernels kept; the least recently used
+        kernel is evicted beyond that.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key, compile_kernel):
+        """
+        Return the kernel cached under ``key``, calling
+        ``compile_kernel()`` to create it on a miss.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+
+        kernel = compile_kernel()
+
+        with self._lock:
+            self._entries[key] = kernel
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return kernel
+
+    def info(self):
+        """
+        Return the hits, misses, maximum size and current size of the
+        cache as a ``CacheInfo`` named tuple.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._entries)
+            )
+
+    def clear(self):
+        """
+        Evict every kernel and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Kernels compiled from user defined functions, shared by compile_udf and
+# column_applymap
+kernel_cache = KernelCache()
+
+
+def _value_token(value):
+    """
+    A hashable token for a value captured by a UDF: scalars by value, any
+    other object by identity.
+    """
+    if isinstance(value, (Number, str, bytes, type(None))):
+        return (type(value), value)
+    return (type(value), id(value))
+
+
+def make_cache_key(udf, *args):
+    """
+    Build the key identifying the kernels compiled from ``udf`` for the
+    extra parameters ``args`` (types, nullability...).
+
+    The function is identified by its code object and by the values of
+    its closure variables, default arguments and referenced globals, not
+    by its identity, so that an equivalent function created anew for
+    every call (e.g. a lambda) reuses the kernels compiled for it.
+    Objects that are not scalars are keyed by identity; the cached kernel
+    references them, so their identity can't be reused while cached.
+    """
+    func = getattr(udf, "py_func", udf)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return (udf,) + args
+    try:
+        closure = tuple(
+            _value_token(cell.cell_contents) for cell in func.__closure__ or ()
+        )
+    except ValueError:
+        # empty closure cell
+        return (udf,) + args
+    defaults = tuple(_value_token(value) for value in func.__defaults__ or ())
+    global_values = func.__globals__
+    global_refs = tuple(
+        (name, _value_token(global_values[name]))
+        for name in code.co_names
+        if name in global_values
+    )
+    return (code, closure, defaults, global_refs) + args
+
+
+def _code_token(code):
+    """
+    A token of the bytecode of ``code`` that is stable across processes.
+    """
+    consts = []
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            consts.append(_code_token(const))
+        elif isinstance(const, frozenset):
+            # the iteration order of a set depends on the hash seed
+            consts.append(sorted(map(repr, const)))
+        else:
+            consts.append(repr(const))
+    return (
+        code.co_code,
+        tuple(consts),
+        code.co_names,
+        code.co_varnames,
+        code.co_freevars,
+        code.co_argcount,
+        code.co_kwonlyargcount,
+    )
+
+
+def _content_value_token(value):
+    """
+    A token of a value captured by a UDF that is stable across processes,
+    or None if the value can't be identified by content.
+    """
+    if isinstance(value, (Number, str, bytes, type(None))):
+        return (type(value).__name__, repr(value))
+    if isinstance(value, types.ModuleType):
+        return ("module", value.__name__)
+    return None
+
+
+def function_content_token(func):
+    """
+    Build a token of everything the kernels compiled from ``func`` depend
+    on: its bytecode and the values of its closure variables, default
+    arguments and referenced globals.
+
+    Unlike ``make_cache_key``, the token doesn't depend on the identity of
+    any object, so it identifies the same function in another process.
+    Returns None if ``func`` captures an object which is neither a scalar
+    nor a module.
+    """
+    func = getattr(func, "py_func", func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return None
+    try:
+        captured = [cell.cell_contents for cell in func.__closure__ or ()]
+    except ValueError:
+        # empty closure cell
+        return None
+    captured.extend(func.__defaults__ or ())
+    global_values = func.__globals__
+    names = [name for name in code.co_names if name in global_values]
+    captured.extend(global_values[name] for name in names)
+
+    tokens = tuple(_content_value_token(value) for value in captured)
+    if any(token is None for token in tokens):
+        return None
+    return (_code_token(code), tuple(names), tokens)
+
+
+def _default_cache_dir():
+    path = os.environ.get("CUDF_KERNEL_CACHE_DIR")
+    if path is None:
+        base = os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+        )
+        path = os.path.join(base, "cudf", "kernels")
+    return path
+
+
+def _environment_token():
+    """
+    The library versions and device the compiled kernels depend on.
+    """
+    from cudf import __version__
+
+    device = cuda.get_current_device()
+    return (
+        __version__,
+        numba.__version__,
+        sys.version,
+        device.compute_capability,
+    )
+
+
+class DiskKernelCache(object):
+    """
+    A content-addressed cache of compiled kernels on disk, shared by all
+    the processes using the same cache directory.
+
+    Kernels are pickled (numba serializes a specialized kernel as its PTX)
+    into a file named after the SHA-256 digest of their key, the library
+    versions and the compute capability of the device. Entries are written
+    to a temporary file and renamed, so that concurrent readers never see
+    a partial entry. Once the entries exceed ``max_bytes``, the least
+    recently used ones are removed.
+
+    Parameters
+    ----------
+    path : str, optional
+        The cache directory. Defaults to ``$CUDF_KERNEL_CACHE_DIR``, or to
+        ``cudf/kernels`` in the user cache directory. An empty path
+        disables the cache.
+    max_bytes : int, optional
+        The maximum total size of the entries. Defaults to
+        ``$CUDF_KERNEL_CACHE_SIZE``, or to 256 MiB.
+    """
+
+    suffix = ".kernel"
+
+    _last_used_ns = 0
+    _last_used_lock = threading.Lock()
+
+    def __init__(self, path=None, max_bytes=None):
+        if path is None:
+            path = _default_cache_dir()
+        if max_bytes is None:
+            max_bytes = int(
+                os.environ.get("CUDF_KERNEL_CACHE_SIZE", 256 * 2 ** 20)
+            )
+        self.path = path
+        self.max_bytes = max_bytes
+
+    @property
+    def enabled(self):
+        return bool(self.path) and self.max_bytes > 0
+
+    def _filename(self, key):
+        token = repr((key, _environment_token())).encode("utf-8")
+        digest = hashlib.sha256(token).hexdigest()
+        return os.path.join(self.path, digest + self.suffix)
+
+    @classmethod
+    def _touch(cls, filename):
+        """
+        Mark the entry ``filename`` as used now. The times set are strictly
+        increasing within a process, as the clock of the file system is
+        too coarse to order entries used one after the other.
+        """
+        with cls._last_used_lock:
+            now = max(int(time.time() * 1e9), cls._last_used_ns + 1)
+            cls._last_used_ns = now
+        os.utime(filename, ns=(now, now))
+
+    def load(self, key):
+        """
+        Return the kernel stored under ``key``, or None.
+        """
+        if not self.enabled:
+            return None
+        filename = self._filename(key)
+        try:
+            with open(filename, "rb") as f:
+                kernel = pickle.load(f)
+            # mark the entry as recently used
+            self._touch(filename)
+        except Exception:
+            # a missing or unreadable entry is a miss
+            return None
+        return kernel
+
+    def store(self, key, kernel):
+        """
+        Store ``kernel`` under ``key``, then evict the least recently used
+        entries beyond the size limit. Failing to store is not an error.
+        """
+        if not self.enabled:
+            return
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(kernel, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, self._filename(key))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            self._touch(self._filename(key))
+            self._evict()
+        except Exception:
+            pass
+
+    def _entries(self):
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(self.suffix):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                # removed by another process
+                pass
+            total -= size
+
+    def size(self):
+        """
+        Return the total size in bytes of the stored entries.
+        """
+        if not self.enabled or not os.path.isdir(self.path):
+            return 0
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        """
+        Remove every stored entry.
+        """
+        if not self.enabled or not os.path.isdir(self.path):
+            return
+        for _, _, path in self._entries():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def __len__(self):
+        if not self.enabled or not os.path.isdir(self.path):
+            return 0
+        return len(self._entries())
+
+
+# Kernels generated by query and apply_rows, specialized for the types of
+# their arguments; the in-memory cache sits in front of the disk cache
+disk_kernel_cache = DiskKernelCache()
+specialized_kernel_cache = KernelCache()
+
+
+def specialize_kernel(kernel, content, args):
+    """
+    Return ``kernel``, a ``cuda.jit`` kernel without signature, compiled
+    for the types of ``args``.
+
+    ``content`` is a token of everything the kernel is generated from,
+    e.g. its source and the ``function_content_token`` of the functions it
+    calls. Compiled kernels are looked up by content and argument types,
+    first in ``specialized_kernel_cache`` then in ``disk_kernel_cache``,
+    so that another process or a later session reuses them without
+    compiling. If ``content`` is None, ``kernel`` is returned as is and
+    compiled by numba on launch.
+    """
+    if content is None:
+        return kernel
+    key = (content, tuple(str(numba.typeof(arg)) for arg in args))
+
+    def load_or_compile():
+        compiled = disk_kernel_cache.load(key)
+        if compiled is None:
+            compiled = kernel.specialize(*args)
+            disk_kernel_cache.store(key, compiled)
+        return compiled
+
+    return specialized_kernel_cache.get(key, load_or_compile)
+
+
 def compile_udf(udf, type_signature):
     """Copmile ``udf`` with `numba`
 
@@ -825,6 +1109,9 @@ def compile_udf(udf, type_signature):
     to generate a CUDA device funtion to be inlined into CUDA kernels,
     compiled at runtime and launched.
 
+    The result is cached in ``kernel_cache``, so compiling an equivalent
+    function with the same signature again is free.
+
     Parameters
     --------
     udf:
@@ -844,6 +1131,13 @@ def compile_udf(udf, type_signature):
       An numpy type
 
     """
+    return kernel_cache.get(
+        make_cache_key(udf, "ptx", type_signature),
+        lambda: _compile_udf(udf, type_signature),
+    )
+
+
+def _compile_udf(udf, type_signature):
     decorated_udf = cuda.jit(udf, device=True)
     compiled = decorated_udf.compile(type_signature)
     ptx_code = decorated_udf.inspect_ptx(type_signature).decode("utf-8")
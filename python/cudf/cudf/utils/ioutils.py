@@ -9,6 +9,7 @@ import fsspec
 import fsspec.implementations.local
 
 from cudf.utils.docutils import docfmt_partial
+from cudf.utils.dtypes import is_categorical_dtype
 
 _docstring_remote_sources = """
 - cuDF supports local and remote data stores. See configuration details for
@@ -117,8 +118,10 @@ skip_rows : int, default None
 num_rows : int, default None
     If not None, the total number of rows to read.
 strings_to_categorical : boolean, default False
-    If True, return string columns as GDF_CATEGORY dtype; if False, return a
-    as GDF_STRING dtype.
+    If True, return string columns as category dtype, with the dictionaries
+    of the column chunks as the categories and their codes as the codes; if
+    False, return them as strings. Columns with plain-encoded pages are
+    converted from strings.
 use_pandas_metadata : boolean, default True
     If True and dataset has custom PANDAS schema metadata, ensure that index
     columns are also loaded.
@@ -169,6 +172,12 @@ partition_cols : list, optional, default None
     Column names by which to partition the dataset
     Columns are partitioned in the order they are given
 
+Notes
+-----
+Categorical columns are written as their values, dictionary-encoded with
+the categories as the dictionary; read them back as categoricals with
+``strings_to_categorical=True``.
+
 See Also
 --------
 cudf.io.parquet.read_parquet
@@ -269,6 +278,11 @@ fname : str
 compression : {{ 'snappy', None }}, default None
     Name of the compression to use. Use None for no compression.
 
+Notes
+-----
+Categorical columns are written as their values, so that string categories
+are dictionary-encoded.
+
 See Also
 --------
 cudf.io.orc.read_orc
@@ -287,7 +301,9 @@ path_or_buf : str, path object, or file-like object
     function or `StringIO`).
 engine : {{ 'auto', 'cudf', 'pandas' }}, default 'auto'
     Parser engine to use. If 'auto' is passed, the engine will be
-    automatically selected based on the other parameters.
+    automatically selected based on the other parameters. With the pandas
+    engine, a top-level array of records is parsed in chunks by a pool of
+    processes, and its columns are built without a pandas DataFrame.
 orient : string,
     Indication of expected JSON string format (pandas engine only).
     Compatible JSON strings can be produced by ``to_json()`` with a
@@ -321,9 +337,14 @@ orient : string,
         ``'columns'``, and ``'records'``.
 typ : type of object to recover (series or frame), default 'frame'
     With cudf engine, only frame output is supported.
-dtype : boolean or dict, default True
+dtype : boolean, list or dict, default True
     If True, infer dtypes, if a dict of column to dtype, then use those,
     if False, then don't infer dtypes at all, applies only to the data.
+    With cudf engine, a list gives the dtype of each column read, in the
+    order of ``columns`` if given, and the columns missing from a dict have
+    their dtypes inferred; the data is only scanned for inference if some
+    column has no dtype given, such as one returned by
+    ``read_json_schema``.
 convert_axes : boolean, default True
     Try to convert the axes to the proper dtypes (pandas engine only).
 convert_dates : boolean, default True
@@ -374,6 +395,10 @@ byte_range : list or tuple, default None
     size in bytes. Set the size to zero to read all data after the offset
     location. Reads the row that starts before or at the end of the range,
     even if it ends after the end of the range.
+columns : list, default None
+    If not None, only these columns are read, in this order. With cudf
+    engine, the fields of the other columns are skipped while the records
+    are parsed.
 
 Returns
 -------
@@ -385,6 +410,41 @@ See Also
 """
 doc_read_json = docfmt_partial(docstring=_docstring_read_json)
 
+_docstring_read_json_schema = """
+Infer the dtypes of the columns of a JSON Lines dataset from its first rows
+
+Parameters
+----------
+path_or_buf : str, path object, or file-like object
+    Either JSON Lines data in a `str`, path to a file (a `str`,
+    `pathlib.Path`, or `py._path.local.LocalPath`), URL (including http, ftp,
+    and S3 locations), or any object with a `read()` method.
+nrows : int, default 1000
+    Number of rows at the head of the input that the dtypes are inferred
+    from; only these rows are read.
+columns : list, default None
+    If not None, only the dtypes of these columns are inferred.
+compression : {'infer', 'gzip', 'bz2', 'zip', 'xz', None}, default 'infer'
+    For on-the-fly decompression of on-disk data, as in ``read_json``.
+
+Returns
+-------
+OrderedDict mapping the name of each column to its dtype, which can be
+passed as ``dtype`` to ``read_json`` to read the whole dataset without
+inferring its dtypes.
+
+Examples
+--------
+>>> import cudf
+>>> schema = cudf.io.read_json_schema("events.jsonl", nrows=100)
+>>> df = cudf.read_json("events.jsonl", lines=True, dtype=schema)
+
+See Also
+--------
+.cudf.io.json.read_json
+"""
+doc_read_json_schema = docfmt_partial(docstring=_docstring_read_json_schema)
+
 _docstring_to_json = """
 Convert the cuDF object to a JSON string.
 Note nulls and NaNs will be converted to null and datetime objects
@@ -484,9 +544,10 @@ stop  : int, optional
 columns : list, optional
     A list of columns names to return.
 iterator : bool, optional
-    Return an iterator object.
+    Return an iterator of DataFrames rather than a DataFrame.
 chunksize : int, optional
-    Number of rows to include in an iteration when using an iterator.
+    Number of rows of the DataFrames of the iterator, which is returned
+    if ``chunksize`` is given.
 errors : str, default 'strict'
     Specifies how encoding and decoding errors are to be handled.
     See the errors argument for :func:`open` for a full list
@@ -499,6 +560,14 @@ Returns
 item : object
     The selected object. Return type depends on the object stored.
 
+Notes
+-----
+The numeric and datetime columns of a DataFrame, in fixed or table
+format, are read straight from the HDF5 arrays into reused host staging
+buffers, a bounded number of rows at a time, and copied to the device
+together. Only the rows and columns selected are read. Other columns,
+other objects and ``where`` selections are read by pandas.
+
 See Also
 --------
 cudf.io.hdf.to_hdf : Write a HDF file from a DataFrame.
@@ -586,11 +655,19 @@ path : string
     File path
 columns : list, default=None
     If not None, only these columns will be read from the file.
+memory_map : bool, default True
+    Whether to memory-map a local file, so that only the selected columns
+    are read from it.
 
 Returns
 -------
 DataFrame
 
+Notes
+-----
+The fixed-width columns are copied from the file to the device together,
+through a reused page-locked staging buffer.
+
 Examples
 --------
 >>> import cudf
@@ -621,6 +698,63 @@ cudf.io.feather.read_feather
 """
 doc_to_feather = docfmt_partial(docstring=_docstring_to_feather)
 
+_docstring_read_arrow_stream = """
+Read an Arrow IPC stream incrementally, yielding DataFrames.
+
+The record batches of the stream are read as they arrive and coalesced
+until about ``batch_bytes`` bytes or ``batch_rows`` rows are buffered, so
+that memory use is bounded however long the stream is.
+
+Parameters
+----------
+source : str, file-like object, socket, bytes or pyarrow.NativeFile
+    Path (local or remote via fsspec), open file, pipe or socket to read
+    the stream from, or the stream itself as bytes.
+columns : list, default None
+    If not None, only these columns will be read from the stream.
+batch_rows : int, default None
+    The number of rows after which the buffered record batches are
+    yielded as a DataFrame.
+batch_bytes : int, default 64MiB
+    The size after which the buffered record batches are yielded as a
+    DataFrame.
+
+Returns
+-------
+Iterator of DataFrame
+
+Examples
+--------
+>>> import cudf
+>>> for df in cudf.read_arrow_stream(sock, batch_rows=1000000):
+...     process(df)
+
+See Also
+--------
+cudf.io.arrow.to_arrow_stream
+"""
+doc_read_arrow_stream = docfmt_partial(docstring=_docstring_read_arrow_stream)
+
+_docstring_to_arrow_stream = """
+Write a DataFrame as an Arrow IPC stream.
+
+Parameters
+----------
+sink : str, file-like object, socket or pyarrow.NativeFile
+    Path (local or remote via fsspec), open file, pipe or socket to write
+    the stream to.
+preserve_index : bool, default True
+    Whether to write the index.
+chunksize : int, default None
+    The largest number of rows of a record batch; by default the frame is
+    written as a single record batch.
+
+See Also
+--------
+cudf.io.arrow.read_arrow_stream
+"""
+doc_to_arrow_stream = docfmt_partial(docstring=_docstring_to_arrow_stream)
+
 _docstring_to_dlpack = """
 Converts a cuDF object into a DLPack tensor.
 
@@ -788,8 +922,10 @@ Parameters
 ----------
 df : DataFrame
     DataFrame object to be written to csv
-path : str, default None
-    Path of file where DataFrame will be written
+path : str, path object or file-like object, default None
+    Path of file where DataFrame will be written, which can be a URL
+    (including S3 locations), or a file-like object. If None, the CSV data
+    is returned as a string.
 sep : char, default ','
     Delimiter to be used.
 na_rep : str, default ''
@@ -802,7 +938,14 @@ index : bool, default True
     Write out the index as a column
 line_terminator : char, default '\\n'
 chunksize : int or None, default None
-    Rows to write at a time
+    Rows to format at a time. Each chunk of rows is formatted on the GPU
+    while the previous one is written out. If None, chunks hold about
+    64 MiB of the data of the DataFrame.
+compression : {'infer', 'gzip', 'bz2', 'xz', None}, default 'infer'
+    Compression of the output. If 'infer', it is inferred from the
+    extension of the path. Not supported for text file-like objects.
+storage_options : dict, optional
+    Extra options for the filesystem of a URL ``path``, passed to fsspec.
 
 Notes
 -----
@@ -873,6 +1016,27 @@ def is_file_like(obj):
         return True
 
 
+def decode_categorical_columns(df):
+    """Return ``df`` with each categorical column replaced by the values it
+    encodes, sharing the other columns.
+
+    The Parquet and ORC writers dictionary-encode the values of each column
+    chunk themselves, so that a categorical column is written with its
+    categories as the dictionary rather than as integer codes.
+    """
+    names = [
+        name
+        for name, col in df._data.items()
+        if is_categorical_dtype(col.dtype)
+    ]
+    if not names:
+        return df
+    df = df.copy(deep=False)
+    for name in names:
+        df[name] = df._data[name]._get_decategorized_column()
+    return df
+
+
 def _is_local_filesystem(fs):
     return isinstance(fs, fsspec.implementations.local.LocalFileSystem)
 
@@ -2,14 +2,16 @@
 
 import ast
 import datetime as dt
+import operator
 
+import numba
 import numpy as np
 import six
-from numba import cuda
+from numba import cuda, numpy_support
 
 import rmm
 
-from cudf.utils import applyutils, cudautils
+from cudf.utils import applyutils, cudautils, utils
 
 ENVREF_PREFIX = "__CUDF_ENVREF__"
 
@@ -101,7 +103,7 @@ def _check_error(tree):
         raise QuerySyntaxError("too many expressions")
 
 
-_cache = {}
+_cache = cudautils.KernelCache()
 
 
 def query_compile(expr):
@@ -113,6 +115,9 @@ def query_compile(expr):
     expression are passed as argument to the kernel. Thus, the kernel is
     reusable on any dataframe and in any environment.
 
+    The kernel is compiled on launch, for the types of its arguments, by
+    ``query_execute``, which caches the compiled kernel on disk.
+
     Parameters
     ----------
     expr : str
@@ -124,25 +129,22 @@ def query_compile(expr):
         key "kernel" is the cuda kernel for the query.
         key "args" is a sequence of name of the arguments.
     """
+    return _cache.get(expr, lambda: _query_compile(expr))
+
 
+def _query_compile(expr):
     funcid = "queryexpr_{:x}".format(np.uintp(hash(expr)))
-    # Load cache
-    compiled = _cache.get(funcid)
-    # Cache not found
-    if compiled is None:
-        info = query_parser(expr)
-        fn = query_builder(info, funcid)
-        args = info["args"]
-        # compile
-        devicefn = cuda.jit(device=True)(fn)
-
-        kernelid = "kernel_{}".format(funcid)
-        kernel = _wrap_query_expr(kernelid, devicefn, args)
-
-        compiled = info.copy()
-        compiled["kernel"] = kernel
-        # Store cache
-        _cache[funcid] = compiled
+    info = query_parser(expr)
+    fn = query_builder(info, funcid)
+    args = info["args"]
+    # compile
+    devicefn = cuda.jit(device=True)(fn)
+
+    kernelid = "kernel_{}".format(funcid)
+    kernel = _wrap_query_expr(kernelid, devicefn, args)
+
+    compiled = info.copy()
+    compiled["kernel"] = kernel
     return compiled
 
 
@@ -181,29 +183,194 @@ def _wrap_query_expr(name, fn, args):
     return kernel
 
 
-def query_execute(df, expr, callenv):
-    """Compile & execute the query expression
+class _UnsupportedQuery(Exception):
+    """Raised by the vectorized evaluator for constructs it doesn't support
+    """
 
-    Note: the expression is compiled and cached for future reuse.
 
-    Parameters
-    ----------
-    df : DataFrame
-    expr : str
-        boolean expression
-    callenv : dict
-        Contains keys 'local_dict', 'locals' and 'globals' which are all dict.
-        They represent the arg, local and global dictionaries of the caller.
+_binary_ops = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_compare_ops = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+
+def _is_series(value):
+    from cudf.core.series import Series
+
+    return isinstance(value, Series)
+
+
+def _as_bool(value):
+    if _is_series(value):
+        if value.dtype != np.bool_:
+            raise _UnsupportedQuery("truth value of a non-boolean column")
+        return value
+    return bool(value)
+
+
+def _logical_and(left, right):
+    left, right = _as_bool(left), _as_bool(right)
+    if not _is_series(left):
+        left, right = right, left
+    if not _is_series(left):
+        return left and right
+    if not _is_series(right):
+        return left if right else False
+    return left & right
+
+
+def _logical_or(left, right):
+    left, right = _as_bool(left), _as_bool(right)
+    if not _is_series(left):
+        left, right = right, left
+    if not _is_series(left):
+        return left or right
+    if not _is_series(right):
+        return True if right else left
+    return left | right
+
+
+def _logical_not(value):
+    value = _as_bool(value)
+    if _is_series(value):
+        return ~value
+    return not value
+
+
+def _isin(value, values):
+    if not isinstance(values, (list, tuple, set)):
+        raise _UnsupportedQuery("'in' needs a list of values")
+    if _is_series(value):
+        return value.isin(list(values))
+    return value in values
+
+
+class _QueryEvaluator(ast.NodeVisitor):
+    """Evaluate a query expression with column-wise operations.
+
+    Column references evaluate to Series and environment references or
+    literals to scalars, so that each operator of the expression is one
+    vectorized operation over whole columns, without compiling a kernel.
+    ``and``, ``or`` and ``not`` combine boolean columns element-wise.
     """
-    # compile
-    compiled = query_compile(expr)
-    kernel = compiled["kernel"]
-    # process env args
-    envargs = []
+
+    def __init__(self, df, envdict):
+        self.df = df
+        self.envdict = envdict
+
+    def generic_visit(self, node):
+        raise _UnsupportedQuery(type(node).__name__)
+
+    def visit_Expr(self, node):
+        return self.visit(node.value)
+
+    def visit_Name(self, node):
+        if node.id in self.envdict:
+            return self.envdict[node.id]
+        return self.df[node.id]
+
+    def visit_Constant(self, node):
+        return node.value
+
+    def visit_Num(self, node):
+        return node.n
+
+    def visit_Str(self, node):
+        return node.s
+
+    def visit_NameConstant(self, node):
+        return node.value
+
+    def visit_List(self, node):
+        values = [self.visit(elt) for elt in node.elts]
+        if any(_is_series(value) for value in values):
+            raise _UnsupportedQuery("list of columns")
+        return values
+
+    visit_Tuple = visit_List
+
+    def visit_BinOp(self, node):
+        op = _binary_ops.get(type(node.op))
+        if op is None:
+            raise _UnsupportedQuery(type(node.op).__name__)
+        return op(self.visit(node.left), self.visit(node.right))
+
+    def visit_UnaryOp(self, node):
+        operand = self.visit(node.operand)
+        if isinstance(node.op, ast.Not):
+            return _logical_not(operand)
+        if isinstance(node.op, ast.USub):
+            return -operand
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        raise _UnsupportedQuery(type(node.op).__name__)
+
+    def visit_BoolOp(self, node):
+        combine = _logical_and if isinstance(node.op, ast.And) else _logical_or
+        result = self.visit(node.values[0])
+        for value in node.values[1:]:
+            result = combine(result, self.visit(value))
+        return result
+
+    def visit_Compare(self, node):
+        result = True
+        left = self.visit(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = self.visit(comparator)
+            if isinstance(op, ast.In):
+                compared = _isin(left, right)
+            elif isinstance(op, ast.NotIn):
+                compared = _logical_not(_isin(left, right))
+            elif type(op) in _compare_ops:
+                compared = _compare_ops[type(op)](left, right)
+            else:
+                raise _UnsupportedQuery(type(op).__name__)
+            result = _logical_and(result, compared)
+            left = right
+        return result
+
+
+def _query_evaluate(df, expr, envdict):
+    """Evaluate the query expression with vectorized column operations.
+
+    Raises ``_UnsupportedQuery`` if the expression can't be evaluated
+    that way.
+
+    Returns
+    -------
+    Device array of bools
+    """
+    tree = ast.parse(expr.replace("@", ENVREF_PREFIX))
+    result = _QueryEvaluator(df, envdict).visit(tree.body[0])
+    if not _is_series(result):
+        return cudautils.full(len(df), bool(result), np.bool_)
+    if result.dtype != np.bool_:
+        result = result.astype(np.bool_)
+    if result.has_nulls:
+        result = result.fillna(False)
+    return result._column.data_array_view
+
+
+def _env_values(refnames, callenv):
     envdict = callenv["globals"].copy()
     envdict.update(callenv["locals"])
     envdict.update(callenv["local_dict"])
-    for name in compiled["refnames"]:
+    values = []
+    for name in refnames:
         name = name[len(ENVREF_PREFIX) :]
         try:
             val = envdict[name]
@@ -213,8 +380,46 @@ def query_execute(df, expr, callenv):
             msg = "{!r} not defined in the calling environment"
             raise NameError(msg.format(name))
         else:
-            envargs.append(val)
-    columns = compiled["colnames"]
+            values.append(val)
+    return values
+
+
+def query_execute(df, expr, callenv):
+    """Evaluate the query expression
+
+    The expression is evaluated with vectorized column operations when it
+    only uses arithmetic, comparisons, ``in``/``not in`` against a list
+    and boolean ``and``, ``or`` and ``not``; this also supports string and
+    categorical columns. Any other expression is compiled into a CUDA
+    kernel, which is cached for future reuse.
+
+    Parameters
+    ----------
+    df : DataFrame
+    expr : str
+        boolean expression
+    callenv : dict
+        Contains keys 'local_dict', 'locals' and 'globals' which are all dict.
+        They represent the arg, local and global dictionaries of the caller.
+    """
+    info = query_parser(expr)
+    envargs = _env_values(info["refnames"], callenv)
+    columns = info["colnames"]
+    try:
+        out = _query_evaluate(df, expr, dict(zip(info["refnames"], envargs)))
+    except (_UnsupportedQuery, NotImplementedError, TypeError):
+        out = _query_execute_jit(df, expr, columns, envargs)
+    out_mask = applyutils.make_aggregate_nullmask(df, columns=columns)
+    if out_mask is not None:
+        out = cudautils.fill_mask(out, out_mask.data_array_view, False)
+    return out
+
+
+def _query_execute_jit(df, expr, columns, envargs):
+    """Compile the query expression into a CUDA kernel and run it
+    """
+    compiled = query_compile(expr)
+    kernel = compiled["kernel"]
     # prepare col args
     colarrays = [df[col]._column.data_array_view for col in columns]
     # allocate output buffer
@@ -222,8 +427,293 @@ def query_execute(df, expr, callenv):
     out = rmm.device_array(nrows, dtype=np.bool_)
     # run kernel
     args = [out] + colarrays + envargs
+    kernel = cudautils.specialize_kernel(
+        kernel, ("query", compiled["source"]), args
+    )
     kernel.forall(nrows)(*args)
-    out_mask = applyutils.make_aggregate_nullmask(df, columns=columns)
-    if out_mask is not None:
-        out = cudautils.fill_mask(out, out_mask.data_array_view, False)
     return out
+
+
+def eval_parser(text):
+    """The parser of ``DataFrame.eval`` expressions.
+
+    The text is either a single expression or one assignment per line,
+    such as ``"z = x * y + w"``, where a target can be used by the
+    following lines.
+
+    Parameters
+    ----------
+    text: str
+        The expressions
+
+    Returns
+    -------
+    statements: list of ``(target, node)`` pairs, where ``target`` is the
+    name of the assigned column, or None for a single expression, and
+    ``node`` is the ast of the expression.
+    """
+    text = text.replace("@", ENVREF_PREFIX)
+    tree = ast.parse(text)
+    if not isinstance(tree, ast.Module) or len(tree.body) == 0:
+        raise QuerySyntaxError("expected an expression")
+    if len(tree.body) == 1 and isinstance(tree.body[0], ast.Expr):
+        return [(None, tree.body[0].value)]
+
+    statements = []
+    for stmt in tree.body:
+        if (
+            not isinstance(stmt, ast.Assign)
+            or len(stmt.targets) != 1
+            or not isinstance(stmt.targets[0], ast.Name)
+        ):
+            raise QuerySyntaxError(
+                "multiple expressions must each assign a single column"
+            )
+        target = stmt.targets[0].id
+        if target.startswith(ENVREF_PREFIX):
+            raise QuerySyntaxError("cannot assign to a local variable")
+        statements.append((target, stmt.value))
+    return statements
+
+
+_binary_symbols = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.FloorDiv: "//",
+    ast.Mod: "%",
+    ast.Pow: "**",
+}
+
+_unary_symbols = {ast.USub: "-", ast.UAdd: "+", ast.Not: "not "}
+
+_compare_symbols = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+}
+
+
+class _EvalSourceBuilder(ast.NodeVisitor):
+    """Generate the source of a device function computing an expression.
+
+    Every operation is assigned to a temporary once: a subexpression that
+    appears several times in the expression is computed only once.
+    """
+
+    def __init__(self):
+        self.args = []
+        self.lines = []
+        self.temps = {}
+
+    def generic_visit(self, node):
+        raise _UnsupportedQuery(type(node).__name__)
+
+    def build(self, node, funcid):
+        result = self.visit(node)
+        lines = ["def {}({}):".format(funcid, ", ".join(self.args))]
+        lines.extend("    " + line for line in self.lines)
+        lines.append("    return {}".format(result))
+        return "\n".join(lines)
+
+    def _temp(self, node, source):
+        key = ast.dump(node)
+        if key not in self.temps:
+            self.temps[key] = "__tmp{}".format(len(self.temps))
+            self.lines.append("{} = {}".format(self.temps[key], source))
+        return self.temps[key]
+
+    def _cached(self, node):
+        return self.temps.get(ast.dump(node))
+
+    def visit(self, node):
+        return self._cached(node) or super().visit(node)
+
+    def visit_Name(self, node):
+        if node.id not in self.args:
+            self.args.append(node.id)
+        return node.id
+
+    def _constant(self, value):
+        if isinstance(value, (bool, int, float)):
+            return repr(value)
+        raise _UnsupportedQuery(type(value).__name__)
+
+    def visit_Constant(self, node):
+        return self._constant(node.value)
+
+    def visit_Num(self, node):
+        return self._constant(node.n)
+
+    def visit_NameConstant(self, node):
+        return self._constant(node.value)
+
+    def visit_BinOp(self, node):
+        symbol = _binary_symbols.get(type(node.op))
+        if symbol is None:
+            raise _UnsupportedQuery(type(node.op).__name__)
+        left, right = self.visit(node.left), self.visit(node.right)
+        return self._temp(node, "{} {} {}".format(left, symbol, right))
+
+    def visit_UnaryOp(self, node):
+        symbol = _unary_symbols.get(type(node.op))
+        if symbol is None:
+            raise _UnsupportedQuery(type(node.op).__name__)
+        operand = self.visit(node.operand)
+        return self._temp(node, "{}{}".format(symbol, operand))
+
+    def visit_Compare(self, node):
+        parts = [self.visit(node.left)]
+        for op, comparator in zip(node.ops, node.comparators):
+            symbol = _compare_symbols.get(type(op))
+            if symbol is None:
+                raise _UnsupportedQuery(type(op).__name__)
+            parts.extend([symbol, self.visit(comparator)])
+        return self._temp(node, " ".join(parts))
+
+    def visit_BoolOp(self, node):
+        symbol = " and " if isinstance(node.op, ast.And) else " or "
+        values = [self.visit(value) for value in node.values]
+        return self._temp(node, symbol.join(values))
+
+    def visit_IfExp(self, node):
+        test = self.visit(node.test)
+        body, orelse = self.visit(node.body), self.visit(node.orelse)
+        return self._temp(node, "{} if {} else {}".format(body, test, orelse))
+
+
+def _is_fusable(dtype):
+    return np.issubdtype(dtype, np.number) or np.issubdtype(dtype, np.bool_)
+
+
+def _eval_compile(source, funcid, args, argtypes):
+    """Compile the device function generated by ``_EvalSourceBuilder``
+    for the given argument types, and wrap it into a kernel.
+
+    Returns
+    -------
+    kernel, output dtype
+    """
+    glbs = {}
+    six.exec_(source, glbs)
+    devicefn = cuda.jit(device=True)(glbs[funcid])
+    compiled = devicefn.compile(tuple(argtypes))
+    out_dtype = numpy_support.as_dtype(compiled.signature.return_type)
+    kernel = _wrap_query_expr("kernel_{}".format(funcid), devicefn, args)
+    return kernel, out_dtype
+
+
+def _eval_fused(df, node, envdict):
+    """Compute the expression ``node`` over the columns of ``df`` with a
+    single generated kernel.
+
+    Raises ``_UnsupportedQuery`` if the expression or the type of a
+    column it uses isn't supported by the kernel.
+
+    Returns
+    -------
+    Column
+    """
+    from cudf.core.column import as_column
+
+    funcid = "evalexpr"
+    builder = _EvalSourceBuilder()
+    source = builder.build(node, funcid)
+    args = builder.args
+
+    values = []
+    for name in args:
+        if name in envdict:
+            value = envdict[name]
+            if not isinstance(value, (bool, int, float, np.number)):
+                raise _UnsupportedQuery(type(value).__name__)
+        else:
+            col = df[name]._column
+            if not _is_fusable(col.dtype):
+                raise _UnsupportedQuery(str(col.dtype))
+            value = col.data_array_view
+        values.append(value)
+    argtypes = [
+        numba.typeof(value) if name in envdict else numba.typeof(value).dtype
+        for name, value in zip(args, values)
+    ]
+
+    kernel, out_dtype = _cache.get(
+        ("eval", source, tuple(str(t) for t in argtypes)),
+        lambda: _eval_compile(source, funcid, args, argtypes),
+    )
+    nrows = len(df)
+    out = rmm.device_array(nrows, dtype=out_dtype)
+    if nrows > 0:
+        kernel_args = [out] + values
+        kernel = cudautils.specialize_kernel(
+            kernel, ("eval", source), kernel_args
+        )
+        kernel.forall(nrows)(*kernel_args)
+    return as_column(out)
+
+
+def eval_execute(df, expr, callenv):
+    """Compute the expressions of ``DataFrame.eval``
+
+    Each expression is fused into one generated kernel, which computes
+    all of its operations without materializing intermediate columns and
+    computes repeated subexpressions once. Expressions using columns that
+    can't be processed by a kernel, such as string or categorical
+    columns, are evaluated with column operations instead.
+
+    An output value is null if any of the column values used to compute
+    it is null.
+
+    Parameters
+    ----------
+    df : DataFrame
+    expr : str
+        One expression, or one assignment per line
+    callenv : dict
+        Contains keys 'local_dict', 'locals' and 'globals' which are all dict.
+        They represent the arg, local and global dictionaries of the caller.
+
+    Returns
+    -------
+    results : list of ``(target, Series)`` pairs, where ``target`` is None
+    for a single expression.
+    """
+    from cudf.core.series import Series
+
+    statements = eval_parser(expr)
+    frame = df.copy(deep=False)
+    results = []
+    for target, node in statements:
+        extractor = _NameExtractor()
+        extractor.visit(node)
+        refnames = sorted(extractor.refnames)
+        envdict = dict(zip(refnames, _env_values(refnames, callenv)))
+        columns = sorted(extractor.colnames)
+
+        try:
+            result = _eval_fused(frame, node, envdict)
+        except _UnsupportedQuery:
+            try:
+                value = _QueryEvaluator(frame, envdict).visit(node)
+            except _UnsupportedQuery as e:
+                raise NotImplementedError(
+                    "unsupported expression: {}".format(e)
+                )
+            if _is_series(value):
+                result = value._column
+            else:
+                result = utils.scalar_broadcast_to(value, len(frame))
+        out_mask = applyutils.make_aggregate_nullmask(frame, columns=columns)
+        if out_mask is not None:
+            result = result.set_mask(out_mask.data_array_view)
+
+        result = Series(result, index=frame.index)
+        if target is not None:
+            frame[target] = result
+        results.append((target, result))
+    return results
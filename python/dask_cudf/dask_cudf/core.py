@@ -132,10 +132,9 @@ class DataFrame(_Frame, dd.core.DataFrame):
         return self.map_partitions(assigner, k, v, meta=meta)
 
     def apply_rows(self, func, incols, outcols, kwargs={}, cache_key=None):
-        import uuid
-
-        if cache_key is None:
-            cache_key = uuid.uuid4()
+        # Without an explicit cache_key, cudf identifies the kernel by the
+        # code and captured values of ``func``, so that every partition and
+        # every call with the same function reuse the compiled kernel.
 
         def do_apply_rows(df, func, incols, outcols, kwargs):
             return df.apply_rows(
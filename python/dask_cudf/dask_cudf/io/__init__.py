@@ -1,3 +1,4 @@
+from .avro import read_avro
 from .csv import read_csv
 from .json import read_json
 from .orc import read_orc, to_orc
@@ -0,0 +1,246 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import dask.dataframe as dd
+from dask.base import tokenize
+from dask.bytes.core import get_fs_token_paths
+from dask.utils import parse_bytes
+
+import cudf
+
+_AVRO_MAGIC = b"Obj\x01"
+_SYNC_SIZE = 16
+
+
+def _read_long(f):
+    """Read a zig-zag encoded variable-length long"""
+    result = shift = 0
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise EOFError()
+        result |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return (result >> 1) ^ -(result & 1)
+        shift += 7
+
+
+def _read_header(f):
+    """
+    Read the header of an Avro container file, returning its size and the
+    sync marker that ends each block.
+    """
+    if f.read(4) != _AVRO_MAGIC:
+        raise ValueError("Not an Avro container file")
+    while True:
+        count = _read_long(f)
+        if count == 0:
+            break
+        if count < 0:
+            # the byte size of the block of metadata items follows
+            count = -count
+            _read_long(f)
+        for _ in range(2 * count):
+            f.read(_read_long(f))
+    sync = f.read(_SYNC_SIZE)
+    return f.tell(), sync
+
+
+def _read_blocks(fs, path):
+    """
+    List the blocks of the Avro container file ``path``, from the headers
+    of the blocks only: the data of the blocks is seeked past.
+
+    Returns the size of the file header and the ``(offset, size, nrows)``
+    of each block, its sync marker included.
+    """
+    with fs.open(path, "rb") as f:
+        header_size, sync = _read_header(f)
+        blocks = []
+        offset = header_size
+        while True:
+            try:
+                nrows = _read_long(f)
+            except EOFError:
+                break
+            f.seek(_read_long(f), 1)
+            if f.read(_SYNC_SIZE) != sync:
+                raise ValueError(
+                    "Invalid sync marker in Avro file %s at offset %d"
+                    % (path, f.tell() - _SYNC_SIZE)
+                )
+            end = f.tell()
+            blocks.append((offset, end - offset, nrows))
+            offset = end
+    return header_size, blocks
+
+
+def _plan_pieces(files, skip_rows, num_rows):
+    """
+    Select the runs of blocks of ``files``, a list of ``(path,
+    header_size, blocks)``, holding the ``num_rows`` rows after the first
+    ``skip_rows`` rows of the files, in order.
+
+    Returns a list of ``(path, header_size, start, stop, skip_rows,
+    num_rows, nbytes)`` where ``start`` and ``stop`` are the byte range of
+    a block, and ``skip_rows`` the rows of the block before the rows
+    selected; the blocks before or after the selected rows are dropped.
+    """
+    pieces = []
+    row = 0
+    stop_row = None if num_rows is None else skip_rows + num_rows
+    for path, header_size, blocks in files:
+        for offset, size, nrows in blocks:
+            first, last = row, row + nrows
+            row = last
+            if last <= skip_rows:
+                continue
+            if stop_row is not None and first >= stop_row:
+                return pieces
+            skip = max(skip_rows - first, 0)
+            take = (last if stop_row is None else min(last, stop_row)) - (
+                first + skip
+            )
+            pieces.append(
+                (path, header_size, offset, offset + size, skip, take, size)
+            )
+    return pieces
+
+
+def _partition_pieces(pieces, chunksize):
+    """
+    Group consecutive ``pieces`` into partitions of about ``chunksize``
+    bytes, merging the adjacent blocks of a file into one byte range.
+    """
+    partitions = []
+    current, nbytes = [], 0
+    for piece in pieces:
+        size = piece[-1]
+        if current and nbytes + size > chunksize:
+            partitions.append(current)
+            current, nbytes = [], 0
+        path, header_size, start, stop, skip, take, _ = piece
+        if current and current[-1][0] == path and current[-1][3] == start:
+            # the next block of the same file
+            prev = current[-1]
+            current[-1] = (
+                path,
+                header_size,
+                prev[2],
+                stop,
+                prev[4],
+                prev[5] + take,
+            )
+        else:
+            current.append((path, header_size, start, stop, skip, take))
+        nbytes += size
+    if current:
+        partitions.append(current)
+    return partitions
+
+
+def _read_avro_piece(fs, piece, columns, kwargs):
+    """
+    Read the rows of a byte range of blocks of an Avro file, by handing
+    the file header and those blocks alone to the cudf reader.
+    """
+    path, header_size, start, stop, skip_rows, num_rows = piece
+    with fs.open(path, "rb") as f:
+        data = f.read(header_size)
+        f.seek(start)
+        data += f.read(stop - start)
+    return cudf.read_avro(
+        data,
+        columns=columns,
+        skip_rows=skip_rows,
+        num_rows=num_rows,
+        **kwargs,
+    )
+
+
+def _read_avro_partition(fs, pieces, columns, kwargs):
+    frames = [_read_avro_piece(fs, piece, columns, kwargs) for piece in pieces]
+    if len(frames) == 1:
+        return frames[0]
+    return cudf.concat(frames, ignore_index=True)
+
+
+def read_avro(
+    path,
+    columns=None,
+    skip_rows=None,
+    num_rows=None,
+    chunksize="64 MiB",
+    storage_options=None,
+    **kwargs,
+):
+    """Read cudf dataframe from Avro container file(s).
+
+    The blocks of the files are listed from their headers, and grouped
+    into partitions of about ``chunksize`` bytes; a partition may hold
+    blocks of several small files, or part of the blocks of a large file.
+    Each partition reads only the header and the blocks of its files.
+
+    Parameters
+    ----------
+    path: str or list(str)
+        Location of file(s), which can be a full URL with protocol specifier,
+        and may include glob character if a single string.
+    columns: None or list(str)
+        Columns to load. If None, loads all.
+    skip_rows: None or int
+        Number of rows to skip from the start of the files, in order. The
+        blocks holding only skipped rows are not read.
+    num_rows: None or int
+        Number of rows to read after ``skip_rows``. The blocks after these
+        rows are not read.
+    chunksize: int or str, default "64 MiB"
+        Approximate size of the blocks of each partition.
+    storage_options: None or dict
+        Further parameters to pass to the bytes backend.
+
+    Returns
+    -------
+    dask_cudf.DataFrame
+    """
+
+    if isinstance(chunksize, str):
+        chunksize = parse_bytes(chunksize)
+    skip_rows = skip_rows or 0
+
+    storage_options = storage_options or {}
+    fs, fs_token, paths = get_fs_token_paths(
+        path, mode="rb", storage_options=storage_options
+    )
+    if not paths:
+        raise FileNotFoundError("No Avro files found at %s" % path)
+
+    # the files are listed concurrently, as most of the time is latency
+    with ThreadPoolExecutor(min(len(paths), 32)) as pool:
+        headers = list(pool.map(lambda p: _read_blocks(fs, p), paths))
+    files = [
+        (p, header_size, blocks)
+        for p, (header_size, blocks) in zip(paths, headers)
+    ]
+    pieces = _plan_pieces(files, skip_rows, num_rows)
+
+    # the first block of the files describes the columns
+    for p, header_size, blocks in files:
+        if blocks:
+            offset, size, _ = blocks[0]
+            piece = (p, header_size, offset, offset + size, 0, 1)
+            meta = _read_avro_piece(fs, piece, columns, kwargs).iloc[:0]
+            break
+    else:
+        raise ValueError("The Avro files hold no rows")
+
+    name = "read-avro-" + tokenize(
+        fs_token, paths, columns, skip_rows, num_rows, chunksize, **kwargs
+    )
+    dsk = {}
+    for i, partition in enumerate(_partition_pieces(pieces, chunksize)):
+        dsk[(name, i)] = (_read_avro_partition, fs, partition, columns, kwargs)
+    if not dsk:
+        dsk[(name, 0)] = meta
+
+    divisions = [None] * (len(dsk) + 1)
+    return dd.core.new_dd_object(dsk, name, meta, divisions)
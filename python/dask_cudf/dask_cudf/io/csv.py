@@ -1,7 +1,11 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
+from io import BytesIO
 from warnings import warn
 
+import fsspec
+
 import dask.dataframe as dd
 from dask.base import tokenize
 from dask.compatibility import apply
@@ -9,7 +13,15 @@ from dask.dataframe.io.csv import make_reader
 from dask.utils import parse_bytes
 
 import cudf
-from cudf._lib.GDFError import GDFError
+
+# the bytes at the head of the first file parsed to describe the columns
+_SAMPLE_BYTES = 256 * 1024
+
+# the bytes read before a range boundary to find the line it falls in
+_ALIGN_WINDOW = 64 * 1024
+
+# the share of the free device memory a partition may use when read
+_DEVICE_MEMORY_FRACTION = 1 / 8
 
 
 def read_csv(path, chunksize="256 MiB", **kwargs):
@@ -20,27 +32,114 @@ def read_csv(path, chunksize="256 MiB", **kwargs):
         return _internal_read_csv(path=path, chunksize=chunksize, **kwargs)
 
 
-def _internal_read_csv(path, chunksize="256 MiB", **kwargs):
-    if isinstance(chunksize, str):
-        chunksize = parse_bytes(chunksize)
-
+def _expand_paths(path):
     if isinstance(path, list):
-        filenames = path
+        return path
     elif isinstance(path, str):
-        filenames = sorted(glob(path))
+        return sorted(glob(path))
     elif hasattr(path, "__fspath__"):
-        filenames = sorted(glob(path.__fspath__()))
+        return sorted(glob(path.__fspath__()))
     else:
         raise TypeError("Path type not understood:{}".format(type(path)))
 
+
+def _header_lines(kwargs):
+    """The number of lines of column names at the start of each file"""
+    header = kwargs.get("header", "infer")
+    if header == "infer":
+        header = 0 if kwargs.get("names") is None else None
+    return 0 if header is None else header + 1
+
+
+def _read_sample(fn, header_lines, compression=None):
+    """
+    Read the first lines of ``fn``, up to about ``_SAMPLE_BYTES`` but at
+    least the header and one row, cut at the end of the last whole line.
+    """
+    if compression in (None, False):
+        compression = None
+    with fsspec.open(fn, "rb", compression=compression) as f:
+        sample = f.read(_SAMPLE_BYTES)
+        while sample.count(b"\n") <= header_lines:
+            data = f.read(_SAMPLE_BYTES)
+            if not data:
+                return sample
+            sample += data
+        if f.read(1):
+            sample = sample[: sample.rindex(b"\n") + 1]
+    return sample
+
+
+def _read_meta(fn, kwargs):
+    """
+    Parse a sample of the head of ``fn``, returning the empty frame that
+    describes the columns and the device bytes taken per byte of text.
+    """
+    compression = kwargs.get("compression")
+    sample = _read_sample(fn, _header_lines(kwargs), compression)
+    kwargs = kwargs.copy()
+    kwargs.pop("byte_range", None)
+    kwargs["compression"] = None
+    df = cudf.read_csv(BytesIO(sample), **kwargs)
+    return df.iloc[:0], df.__sizeof__() / max(len(sample), 1)
+
+
+def _device_chunksize(chunksize, expansion):
+    """
+    Cap ``chunksize`` so that the text of a range, and the columns parsed
+    from it, fit in a share of the free device memory.
+    """
+    try:
+        from numba import cuda
+
+        free = cuda.current_context().get_memory_info()[0]
+    except Exception:
+        # no device here, the ranges are sized by ``chunksize`` alone
+        return chunksize
+    budget = int(free * _DEVICE_MEMORY_FRACTION / (1 + expansion))
+    return max(min(chunksize, budget), 1)
+
+
+def _file_ranges(fn, chunksize, header_lines):
+    """
+    Split ``fn`` into byte ranges of about ``chunksize`` bytes starting at
+    the start of a line, so that each range holds at least one row.
+
+    Returns the modification time of the file and the ``(start, stop)`` of
+    each range.
+    """
+    stat = os.stat(fn)
+    size = stat.st_size
+    if size == 0:
+        return stat.st_mtime, []
+    starts = [0]
+    with open(fn, "rb") as f:
+        for _ in range(header_lines):
+            f.readline()
+        first = f.tell()
+        for target in range(chunksize, size, chunksize):
+            # the start of the line holding ``target``
+            lo = max(target - _ALIGN_WINDOW, starts[-1])
+            f.seek(lo)
+            pos = f.read(target - lo).rfind(b"\n")
+            if pos < 0:
+                # the line is longer than the window, or than the range
+                continue
+            start = lo + pos + 1
+            if start > max(starts[-1], first):
+                starts.append(start)
+    return stat.st_mtime, list(zip(starts, starts[1:] + [size]))
+
+
+def _internal_read_csv(path, chunksize="256 MiB", **kwargs):
+    if isinstance(chunksize, str):
+        chunksize = parse_bytes(chunksize)
+
+    filenames = _expand_paths(path)
     if not filenames:
         msg = f"A file in: {filenames} does not exist."
         raise FileNotFoundError(msg)
 
-    name = "read-csv-" + tokenize(
-        path, tokenize, **kwargs
-    )  # TODO: get last modified time
-
     compression = kwargs.get("compression", False)
     if compression and chunksize:
         # compressed CSVs reading must read the entire file
@@ -56,46 +155,47 @@ def _internal_read_csv(path, chunksize="256 MiB", **kwargs):
     if chunksize is None:
         return read_csv_without_chunksize(path, **kwargs)
 
-    dask_reader = make_reader(cudf.read_csv, "read_csv", "CSV")
-    meta = dask_reader(filenames[0], **kwargs)._meta
+    meta, expansion = _read_meta(filenames[0], kwargs)
+    chunksize = _device_chunksize(chunksize, expansion)
+    header_lines = _header_lines(kwargs)
+
+    # the files are listed concurrently, as most of the time is latency
+    with ThreadPoolExecutor(min(len(filenames), 32)) as pool:
+        files = list(
+            pool.map(
+                lambda fn: _file_ranges(fn, chunksize, header_lines),
+                filenames,
+            )
+        )
+
+    name = "read-csv-" + tokenize(
+        filenames, [mtime for mtime, _ in files], chunksize, **kwargs
+    )
 
     dsk = {}
     i = 0
-    dtypes = meta.dtypes.values
-
-    for fn in filenames:
-        size = os.path.getsize(fn)
-        for start in range(0, size, chunksize):
+    for fn, (_, ranges) in zip(filenames, files):
+        for start, stop in ranges:
             kwargs2 = kwargs.copy()
-            kwargs2["byte_range"] = (
-                start,
-                chunksize,
-            )  # specify which chunk of the file we care about
-            if start != 0:
-                kwargs2[
-                    "names"
-                ] = meta.columns  # no header in the middle of the file
+            if start == 0:
+                # the rows starting at or before the last byte of the range
+                kwargs2["byte_range"] = (0, stop - 1)
+            else:
+                # a range after the first skips up to its first line end,
+                # so it starts at the line end before its first row
+                kwargs2["byte_range"] = (start - 1, stop - start)
+                # no header in the middle of the file
+                kwargs2["names"] = meta.columns
                 kwargs2["header"] = None
-            dsk[(name, i)] = (apply, _read_csv, [fn, dtypes], kwargs2)
-
+            dsk[(name, i)] = (apply, cudf.read_csv, [fn], kwargs2)
             i += 1
+    if not dsk:
+        dsk[(name, 0)] = meta
 
     divisions = [None] * (len(dsk) + 1)
     return dd.core.new_dd_object(dsk, name, meta, divisions)
 
 
-def _read_csv(fn, dtypes=None, **kwargs):
-    try:
-        cdf = cudf.read_csv(fn, **kwargs)
-    except GDFError:
-        # end of file check https://github.com/rapidsai/dask-cudf/issues/103
-        # this should be removed when CUDF has better dtype/parse_date support
-        dtypes = dict(zip(kwargs["names"], dtypes))
-        df = dd.core.make_meta(dtypes)
-        cdf = cudf.from_pandas(df)
-    return cdf
-
-
 def read_csv_without_chunksize(path, **kwargs):
     """Read entire CSV with optional compression (gzip/zip)
 
@@ -104,18 +204,11 @@ def read_csv_without_chunksize(path, **kwargs):
     path : str
         path to files (support for glob)
     """
-    if isinstance(path, list):
-        filenames = path
-    elif isinstance(path, str):
-        filenames = sorted(glob(path))
-    elif hasattr(path, "__fspath__"):
-        filenames = sorted(glob(path.__fspath__()))
-    else:
-        raise TypeError("Path type not understood:{}".format(type(path)))
+    filenames = _expand_paths(path)
 
     name = "read-csv-" + tokenize(path, **kwargs)
 
-    meta = cudf.read_csv(filenames[0], **kwargs)
+    meta, _ = _read_meta(filenames[0], kwargs)
 
     graph = {
         (name, i): (apply, cudf.read_csv, [fn], kwargs)
@@ -5,6 +5,7 @@ import pyarrow.parquet as pq
 
 import dask.dataframe as dd
 from dask.dataframe.io.parquet.arrow import ArrowEngine
+from dask.dataframe.utils import clear_known_categories
 
 import cudf
 from cudf.core.column import build_categorical_column
@@ -15,16 +16,18 @@ class CudfEngine(ArrowEngine):
     def read_metadata(*args, **kwargs):
         meta, stats, parts = ArrowEngine.read_metadata(*args, **kwargs)
 
-        # If `strings_to_categorical==True`, convert objects to int32
+        # If `strings_to_categorical==True`, convert objects to categories.
+        # Each partition decodes the dictionaries of its own files, so the
+        # categories are unknown
         strings_to_cats = kwargs.get("strings_to_categorical", False)
-        dtypes = {}
-        for col in meta.columns:
-            if meta[col].dtype == "O":
-                dtypes[col] = "int32" if strings_to_cats else "object"
-
+        if strings_to_cats:
+            cats = [col for col in meta.columns if meta[col].dtype == "O"]
+            meta = clear_known_categories(
+                meta.astype({col: "category" for col in cats}),
+                cols=cats,
+                index=False,
+            )
         meta = cudf.DataFrame.from_pandas(meta)
-        for col, dtype in dtypes.items():
-            meta[col] = meta[col].astype(dtype)
 
         return (meta, stats, parts)
 
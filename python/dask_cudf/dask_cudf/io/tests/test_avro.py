@@ -0,0 +1,85 @@
+import fastavro
+import numpy as np
+import pandas as pd
+import pytest
+
+import dask.dataframe as dd
+
+import cudf
+
+import dask_cudf
+
+schema = {
+    "type": "record",
+    "name": "event",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "value", "type": "double"},
+        {"name": "tag", "type": "string"},
+    ],
+}
+
+
+@pytest.fixture
+def avro_files(tmpdir):
+    """Three files of 1000 rows, in blocks of about 100 rows"""
+    np.random.seed(0)
+    paths, frames = [], []
+    for i in range(3):
+        df = pd.DataFrame(
+            {
+                "id": np.arange(i * 1000, (i + 1) * 1000),
+                "value": np.random.random(1000),
+                "tag": ["a", "bb", "ccc", "dddd"] * 250,
+            }
+        )
+        path = str(tmpdir.join("part.%d.avro" % i))
+        with open(path, "wb") as f:
+            fastavro.writer(
+                f, schema, df.to_dict("records"), sync_interval=2000
+            )
+        paths.append(path)
+        frames.append(df)
+    return paths, pd.concat(frames, ignore_index=True)
+
+
+@pytest.mark.parametrize("chunksize", ["1 KiB", "16 KiB", "64 MiB"])
+def test_read_avro(avro_files, chunksize):
+    paths, expect = avro_files
+    ddf = dask_cudf.read_avro(paths, chunksize=chunksize)
+    if chunksize == "64 MiB":
+        assert ddf.npartitions == 1
+    else:
+        assert ddf.npartitions > 3
+    dd.assert_eq(ddf, expect, check_index=False)
+
+
+def test_read_avro_glob_columns(avro_files, tmpdir):
+    paths, expect = avro_files
+    ddf = dask_cudf.read_avro(
+        str(tmpdir.join("*.avro")), columns=["tag", "id"], chunksize="4 KiB"
+    )
+    dd.assert_eq(ddf, expect[["tag", "id"]], check_index=False)
+
+
+@pytest.mark.parametrize(
+    "skip_rows, num_rows", [(0, 10), (150, None), (950, 1100), (2999, 5)]
+)
+def test_read_avro_skip_rows(avro_files, skip_rows, num_rows):
+    paths, expect = avro_files
+    ddf = dask_cudf.read_avro(
+        paths, skip_rows=skip_rows, num_rows=num_rows, chunksize="4 KiB"
+    )
+    stop = None if num_rows is None else skip_rows + num_rows
+    dd.assert_eq(ddf, expect.iloc[skip_rows:stop], check_index=False)
+
+    # the blocks before and after the rows read are not part of the graph
+    if num_rows is not None:
+        full = dask_cudf.read_avro(paths, chunksize="4 KiB")
+        assert ddf.npartitions < full.npartitions
+
+
+def test_read_avro_single_file(avro_files):
+    paths, _ = avro_files
+    got = dask_cudf.read_avro(paths[0], chunksize="2 KiB").compute()
+    dd.assert_eq(got.reset_index(drop=True), cudf.read_avro(paths[0]))
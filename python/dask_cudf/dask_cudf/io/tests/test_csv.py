@@ -12,6 +12,7 @@ import dask.dataframe as dd
 import cudf
 
 import dask_cudf
+from dask_cudf.io.csv import _file_ranges
 
 
 def test_csv_roundtrip(tmp_path):
@@ -75,6 +76,31 @@ def test_read_csv_w_bytes(tmp_path):
     dd.assert_eq(df2, df, check_index=False)
 
 
+@pytest.mark.parametrize("chunksize", ["7 B", "20 B", "64 B", "1 KiB"])
+def test_read_csv_ranges_aligned(tmp_path, chunksize):
+    df = pd.DataFrame(
+        {"x": np.arange(100) ** 3, "y": ["a" * (i % 13) for i in range(100)]}
+    )
+    df.to_csv(tmp_path / "data.csv", index=False)
+
+    ddf = dask_cudf.read_csv(tmp_path / "data.csv", chunksize=chunksize)
+    # no range is empty, and no row is read twice
+    parts = [ddf.get_partition(i).compute() for i in range(ddf.npartitions)]
+    assert all(len(part) for part in parts)
+    dd.assert_eq(ddf, df, check_index=False)
+
+
+def test_read_csv_file_ranges(tmp_path):
+    fn = tmp_path / "data.csv"
+    fn.write_bytes(b"x,y\n0,0\n1,1\n22,22\n333,333\n")
+
+    _, ranges = _file_ranges(str(fn), 8, 1)
+    assert ranges == [(0, 8), (8, 12), (12, 18), (18, 26)]
+
+    _, ranges = _file_ranges(str(fn), 100, 1)
+    assert ranges == [(0, 26)]
+
+
 def test_read_csv_compression(tmp_path):
     df = pd.DataFrame(dict(x=np.arange(20), y=np.arange(20)))
     df.to_csv(tmp_path / "data.csv.gz", index=False, compression="gzip")
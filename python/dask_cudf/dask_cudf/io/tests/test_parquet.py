@@ -6,7 +6,7 @@ import pytest
 
 import dask
 import dask.dataframe as dd
-from dask.dataframe.utils import assert_eq
+from dask.dataframe.utils import UNKNOWN_CATEGORIES, assert_eq
 from dask.utils import natural_sort_key, parse_bytes
 
 import dask_cudf
@@ -105,7 +105,10 @@ def test_strings(tmpdir):
         fn, index=["a"], strings_to_categorical=True
     )
     assert_eq(read_df_cats.dtypes, read_df_cats.compute().dtypes)
-    assert_eq(read_df_cats.dtypes[0], "int32")
+    assert_eq(read_df_cats.dtypes[0], "category")
+    # each partition has the categories of its own files
+    categories = read_df_cats._meta["b"].cat.categories.to_pandas()
+    assert list(categories) == [UNKNOWN_CATEGORIES]
 
 
 def test_dask_timeseries_from_pandas(tmpdir):
@@ -520,3 +520,20 @@ def test_make_meta_backends(index):
 
     # Check "non-empty" metadata types
     dd.assert_eq(ddf._meta.dtypes, ddf._meta_nonempty.dtypes)
+
+
+def test_apply_rows_reuses_kernel():
+    from cudf.utils import applyutils
+
+    def double(x, out):
+        for i, v in enumerate(x):
+            out[i] = v * 2
+
+    df = cudf.DataFrame({"x": np.arange(20, dtype=np.float64)})
+    ddf = dgd.from_cudf(df, npartitions=4)
+
+    applyutils._cache.clear()
+    for _ in range(2):
+        got = ddf.apply_rows(double, ["x"], {"out": np.float64}).compute()
+        dd.assert_eq(got["out"], df["x"] * 2, check_names=False)
+    assert applyutils._cache.info().misses == 1
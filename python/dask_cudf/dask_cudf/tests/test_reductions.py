@@ -76,3 +76,14 @@ def test_rowwise_reductions(data, op):
         got = getattr(pddf, op)(axis=1)
 
     assert_eq(expected.compute(), got.compute(), check_less_precise=7)
+
+
+def test_series_unique_k():
+    gs = gd.Series(np.arange(6000) % 3000)
+    ds = dgd.from_cudf(gs, npartitions=4)
+
+    got = ds.unique_k(k=3000).compute()
+    assert sorted(got.to_array()) == list(range(3000))
+
+    with pytest.raises(ValueError):
+        ds.unique_k(k=100).compute()